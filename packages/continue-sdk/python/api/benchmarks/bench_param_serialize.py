@@ -0,0 +1,59 @@
+# coding: utf-8
+
+"""Micro-benchmark for per-call request building in `DefaultApi`.
+
+Times the `_*_serialize` helpers, i.e. everything `param_serialize` does
+before a request reaches the transport.
+
+Run with:
+
+    python -m benchmarks.bench_param_serialize [--number N]
+"""
+
+import argparse
+import timeit
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    api = DefaultApi(ApiClient(Configuration(access_token="token")))
+    cases = [
+        (
+            "_list_assistants_serialize",
+            lambda: api._list_assistants_serialize(
+                always_use_proxy="false",
+                organization_id="org-123",
+                _request_auth=None,
+                _content_type=None,
+                _headers=None,
+                _host_index=0,
+            ),
+        ),
+        (
+            "_get_assistant_serialize",
+            lambda: api._get_assistant_serialize(
+                owner_slug="continuedev",
+                package_slug="default assistant",
+                always_use_proxy=None,
+                organization_id="org-123",
+                _request_auth=None,
+                _content_type=None,
+                _headers=None,
+                _host_index=0,
+            ),
+        ),
+    ]
+    for name, call in cases:
+        elapsed = timeit.timeit(call, number=args.number)
+        print("%-30s %8.2f us/call" % (name, elapsed / args.number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# coding: utf-8
+
+"""Memory benchmark of AssistantRecord and OrganizationRecord.
+
+Measures with `tracemalloc` the memory held by a cache of N assistants
+and organizations decoded from their JSON, as generated models and as
+records, and the cost of converting between them.
+
+Run with:
+
+    python -m benchmarks.bench_records [--size N]
+"""
+
+import argparse
+import gc
+import json
+import timeit
+import tracemalloc
+
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.list_organizations200_response_organizations_inner import (
+    ListOrganizations200ResponseOrganizationsInner,
+)
+from openapi_client.records import AssistantRecord, OrganizationRecord
+
+
+def make_assistant(i):
+    return {
+        "configResult": {
+            "config": {
+                "name": "assistant-%d" % i,
+                "version": "1.0.%d" % (i % 10),
+                "models": [
+                    {
+                        "name": "Model %d" % j,
+                        "provider": ("anthropic", "openai", "ollama")[j % 3],
+                        "model": "model-%d" % (i % 50 + j),
+                        "roles": ["chat", "edit", "apply"],
+                        "apiKey": "${{ secrets.org-%d/assistant-%d/KEY_%d }}" % (i % 17, i, j),
+                    }
+                    for j in range(3)
+                ],
+                "context": [{"provider": name} for name in ("code", "diff", "terminal")],
+                "mcpServers": [{"name": "github", "command": "npx", "args": ["-y", "server"]}],
+            },
+            "configLoadInterrupted": False,
+        },
+        "ownerSlug": "org-%d" % (i % 17),
+        "packageSlug": "assistant-%d" % i,
+        "iconUrl": "https://hub.continue.dev/icons/%d.png?signature=%032x" % (i, i),
+        "useOnPremProxy": False,
+        "rawYaml": "name: assistant-%d\nversion: 1.0.0\nmodels:\n  - uses: anthropic/claude\n" % i,
+    }
+
+
+def make_organization(i):
+    return {"id": "%032x" % i, "name": "Organization %d" % i, "slug": "org-%d" % i}
+
+
+def measure(build):
+    """Returns the result of `build()` and the bytes it still holds."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def report(name, size, model_bytes, record_bytes):
+    print("%-13s model %8.0f B/object  record %7.0f B/object  (%.1fx smaller)" % (
+        name, model_bytes / size, record_bytes / size, model_bytes / record_bytes,
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=20000)
+    args = parser.parse_args()
+    size = args.size
+
+    # each cache entry is decoded from its own JSON, as when it arrives
+    # from the Hub, so no strings are shared with the test data
+    assistant_texts = [json.dumps(make_assistant(i)) for i in range(size)]
+    models, model_bytes = measure(
+        lambda: [ListAssistants200ResponseInner.from_json(t) for t in assistant_texts]
+    )
+    records, record_bytes = measure(lambda: [
+        AssistantRecord.from_model(ListAssistants200ResponseInner.from_json(t))
+        for t in assistant_texts
+    ])
+    report("assistants", size, model_bytes, record_bytes)
+
+    organization_texts = [json.dumps(make_organization(i)) for i in range(size)]
+    _, organization_bytes = measure(lambda: [
+        ListOrganizations200ResponseOrganizationsInner.from_json(t) for t in organization_texts
+    ])
+    organization_records, organization_record_bytes = measure(lambda: [
+        OrganizationRecord.from_model(ListOrganizations200ResponseOrganizationsInner.from_json(t))
+        for t in organization_texts
+    ])
+    report("organizations", size, organization_bytes, organization_record_bytes)
+    assert len(set(organization_records)) == size
+
+    sample_models = models[:1000]
+    sample_records = records[:1000]
+    for name, func in (
+        ("from_model", lambda: [AssistantRecord.from_model(m) for m in sample_models]),
+        ("to_model", lambda: [r.to_model() for r in sample_records]),
+        ("hash", lambda: [hash(r) for r in sample_records]),
+    ):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print("%-13s %6.2f us/assistant" % (name, seconds * 1e6 / len(sample_records)))
+
+
+if __name__ == '__main__':
+    main()
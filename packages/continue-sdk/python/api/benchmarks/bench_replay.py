@@ -0,0 +1,86 @@
+# coding: utf-8
+
+"""Benchmark of response deserialization on recorded Hub traffic.
+
+Times `ApiClient.response_deserialize` (JSON decoding and model
+hydration) for every successful response of a cassette recorded with
+`RecordingTransport`, grouped by operation, then replays the whole
+cassette through `DefaultApi`-equivalent calls.
+
+Record a cassette with:
+
+    client = ApiClient(configuration, transport=RecordingTransport(
+        "hub.jsonl.gz", configuration=configuration))
+    ...  # use the client as usual
+    client.rest_client.close()
+
+Run with:
+
+    python -m benchmarks.bench_replay hub.jsonl.gz [--number N]
+"""
+
+import argparse
+import collections
+import timeit
+
+from openapi_client.api_client import ApiClient
+from openapi_client.cassette import Cassette, ReplayTransport
+from openapi_client.sansio import RequestDescriptor, execute, match_operation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette")
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument(
+        "--latency-scale", type=float, default=0.0,
+        help="fraction of the recorded latency to replay (0 = full speed)",
+    )
+    args = parser.parse_args()
+
+    cassette = Cassette.load(args.cassette)
+    client = ApiClient()
+    by_operation = collections.defaultdict(list)
+    for interaction in cassette.interactions:
+        spec = match_operation(interaction.method, interaction.url)
+        if spec is not None and 200 <= interaction.status <= 299:
+            by_operation[spec.operation_id].append((spec, interaction))
+
+    def deserialize(interactions):
+        for spec, interaction in interactions:
+            response = interaction.to_response()
+            response.read()
+            client.response_deserialize(response, dict(spec.response_types))
+
+    for operation_id, interactions in sorted(by_operation.items()):
+        size = sum(len(interaction.body) for _, interaction in interactions)
+        seconds = timeit.timeit(lambda: deserialize(interactions), number=args.number)
+        print(
+            "%-32s %5d responses %10d bytes  %8.3f ms per response" % (
+                operation_id, len(interactions), size,
+                seconds / args.number / len(interactions) * 1000,
+            )
+        )
+
+    replay_client = ApiClient(
+        transport=ReplayTransport(cassette, latency_scale=args.latency_scale)
+    )
+    # recorded bodies are already encoded, so they are sent as raw bytes
+    requests = [
+        RequestDescriptor(
+            operation_id, interaction.method, interaction.url,
+            {'Content-Type': 'application/octet-stream'} if interaction.request_body else {},
+            interaction.request_body or None,
+        )
+        for operation_id, interactions in by_operation.items()
+        for _, interaction in interactions
+    ]
+    if requests:
+        seconds = timeit.timeit(
+            lambda: [execute(replay_client, request) for request in requests], number=1
+        )
+        print("replayed %d requests in %.3f s" % (len(requests), seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# coding: utf-8
+
+"""Micro-benchmark for `ApiClient.sanitize_for_serialization`.
+
+Compares the dispatch-table serializer against the previous recursive
+implementation on large `SyncSecretsRequest` and assistant model bodies.
+
+Run with:
+
+    python -m benchmarks.bench_sanitize [--number N]
+"""
+
+import argparse
+import datetime
+import decimal
+import timeit
+from enum import Enum
+
+from pydantic import SecretStr
+
+from openapi_client.api_client import ApiClient
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+
+
+def legacy_sanitize(obj):
+    """The recursive `isinstance` chain used before the dispatch table."""
+    if obj is None:
+        return None
+    elif isinstance(obj, Enum):
+        return obj.value
+    elif isinstance(obj, SecretStr):
+        return obj.get_secret_value()
+    elif isinstance(obj, ApiClient.PRIMITIVE_TYPES):
+        return obj
+    elif isinstance(obj, list):
+        return [legacy_sanitize(sub_obj) for sub_obj in obj]
+    elif isinstance(obj, tuple):
+        return tuple(legacy_sanitize(sub_obj) for sub_obj in obj)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    elif isinstance(obj, decimal.Decimal):
+        return str(obj)
+    elif isinstance(obj, dict):
+        obj_dict = obj
+    elif hasattr(obj, 'to_dict') and callable(getattr(obj, 'to_dict')):
+        obj_dict = obj.to_dict()
+    else:
+        obj_dict = obj.__dict__
+    return {key: legacy_sanitize(val) for key, val in obj_dict.items()}
+
+
+def make_sync_secrets_request(size):
+    return SyncSecretsRequest(
+        fqsns=[
+            {
+                "packageSlugs": [
+                    {"ownerSlug": "org-%d" % (i % 17), "packageSlug": "assistant-%d" % i},
+                    {"ownerSlug": "continuedev", "packageSlug": "block-%d" % (i % 31)},
+                ],
+                "secretName": "SECRET_%d" % i,
+            }
+            for i in range(size)
+        ],
+        orgScopeId="org-0",
+    )
+
+
+def make_assistant(models):
+    return ListAssistants200ResponseInner.from_dict({
+        "configResult": {
+            "config": {
+                "name": "Large assistant",
+                "version": "1.0.0",
+                "models": [
+                    {
+                        "name": "model-%d" % i,
+                        "provider": "openai",
+                        "model": "gpt-4o",
+                        "roles": ["chat", "edit", "apply"],
+                        "defaultCompletionOptions": {"temperature": 0.2, "maxTokens": 4096},
+                        "requestOptions": {"headers": {"X-Index": str(i)}},
+                    }
+                    for i in range(models)
+                ],
+                "context": [{"provider": "code"}, {"provider": "diff"}],
+            },
+            "configLoadInterrupted": False,
+            "errors": [],
+        },
+        "ownerSlug": "continuedev",
+        "packageSlug": "large-assistant",
+        "rawYaml": "name: Large assistant\n" * models,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    client = ApiClient()
+    request = make_sync_secrets_request(2000)
+    assistant = make_assistant(500)
+    cases = [
+        ("SyncSecretsRequest model (2000 fqsns)", request),
+        ("SyncSecretsRequest plain dict", request.to_dict()),
+        ("ListAssistants200ResponseInner model (500 models)", assistant),
+        ("ListAssistants200ResponseInner plain dict", assistant.to_dict()),
+    ]
+    for name, body in cases:
+        assert client.sanitize_for_serialization(body) == legacy_sanitize(body)
+        legacy = timeit.timeit(lambda: legacy_sanitize(body), number=args.number)
+        current = timeit.timeit(
+            lambda: client.sanitize_for_serialization(body), number=args.number
+        )
+        print(
+            "%-52s legacy %8.3f ms  current %8.3f ms  speedup %5.1fx" % (
+                name,
+                legacy / args.number * 1000,
+                current / args.number * 1000,
+                legacy / current,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,7 @@
 __version__ = "1.0.0"
 
 # import apis into sdk package
-from api.default_api import DefaultApi
+from openapi_client.api.default_api import DefaultApi
 
 # import ApiClient
 from openapi_client.api_response import ApiResponse
@@ -29,6 +29,42 @@ from openapi_client.exceptions import ApiValueError
 from openapi_client.exceptions import ApiKeyError
 from openapi_client.exceptions import ApiAttributeError
 from openapi_client.exceptions import ApiException
+from openapi_client.exceptions import RateLimitExceededException
+from openapi_client.exceptions import ResponseTooLargeException
+from openapi_client.exceptions import DeadlineExceededException
+from openapi_client.bulk import BulkResult
+from openapi_client.bulk import get_assistants_bulk
+from openapi_client.bulk import list_assistants_for_all_orgs
+from openapi_client.assistant_index import AssistantIndex
+from openapi_client.cassette import Cassette
+from openapi_client.cassette import RecordingTransport
+from openapi_client.cassette import ReplayTransport
+from openapi_client.export import AssistantExporter
+from openapi_client.mirror import AssistantMirror
+from openapi_client.policy import CompiledPolicy
+from openapi_client.policy import PolicyEvaluator
+from openapi_client.pool_stats import PoolStats
+from openapi_client.records import AssistantRecord
+from openapi_client.records import OrganizationRecord
+from openapi_client.secret_prefetch import SecretPrefetcher
+from openapi_client.usage import UsageMeter
+from openapi_client.host_selector import HostSelector
+from openapi_client.latency import AdaptiveTimeout
+from openapi_client.latency import HedgingPolicy
+from openapi_client.latency import LatencyTracker
+from openapi_client.rate_limit import RateLimiter
+from openapi_client.rate_limit import SharedTokenBucket
+from openapi_client.rate_limit import TokenBucket
+from openapi_client.sansio import RawResponse
+from openapi_client.sansio import RequestDescriptor
+from openapi_client.shared_cache import SharedResponseCache
+from openapi_client.token_manager import AccessToken
+from openapi_client.transport import ASGITransport
+from openapi_client.transport import Transport
+from openapi_client.transport import UnixSocketTransport
+from openapi_client.transport import WSGITransport
+from openapi_client.token_manager import TokenManager
+from openapi_client.watcher import HubWatcher
 
 # import models into sdk package
 from openapi_client.models.get_assistant200_response import GetAssistant200Response
@@ -1,5 +1,5 @@
 # flake8: noqa
 
 # import apis into api package
-from api.default_api import DefaultApi
+from openapi_client.api.default_api import DefaultApi
 
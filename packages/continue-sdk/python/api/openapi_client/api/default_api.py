@@ -118,7 +118,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_assistant'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -200,7 +201,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_assistant'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -282,7 +284,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_assistant'
         )
         return response_data.response
 
@@ -419,7 +422,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_free_trial_status'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -483,7 +487,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_free_trial_status'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -547,7 +552,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_free_trial_status'
         )
         return response_data.response
 
@@ -677,7 +683,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_models_add_on_checkout_url'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -750,7 +757,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_models_add_on_checkout_url'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -823,7 +831,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_models_add_on_checkout_url'
         )
         return response_data.response
 
@@ -954,7 +963,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_policy'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1018,7 +1028,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_policy'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1082,7 +1093,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='get_policy'
         )
         return response_data.response
 
@@ -1202,7 +1214,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='list_assistant_full_slugs'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1265,7 +1278,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='list_assistant_full_slugs'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1328,7 +1342,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='list_assistant_full_slugs'
         )
         return response_data.response
 
@@ -1458,7 +1473,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='list_assistants'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1531,7 +1547,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='list_assistants'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1604,7 +1621,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='list_assistants'
         )
         return response_data.response
 
@@ -1735,7 +1753,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='list_organizations'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1799,7 +1818,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='list_organizations'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -1863,7 +1883,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='list_organizations'
         )
         return response_data.response
 
@@ -1988,7 +2009,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='sync_secrets'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -2056,7 +2078,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='sync_secrets'
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -2124,7 +2147,8 @@ class DefaultApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _operation_id='sync_secrets'
         )
         return response_data.response
 
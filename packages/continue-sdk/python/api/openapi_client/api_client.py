@@ -12,28 +12,45 @@
 """  # noqa: E501
 
 
+import atexit
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    wait,
+)
 import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
 import json
 import mimetypes
+import mmap
 import os
 import re
 import tempfile
+import threading
+import time
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
+import urllib3
+from typing import Any, Tuple, Optional, List, Dict, Set, Union
 from pydantic import SecretStr
 
 from openapi_client.configuration import Configuration
 from openapi_client.api_response import ApiResponse, T as ApiResponseT
 import openapi_client.models
 from openapi_client import rest
+from openapi_client.host_selector import is_connect_error
+from openapi_client.latency import DeadlineRetry
+from openapi_client.multipart import FileSource
+from openapi_client.request_log import start_request_log
 from openapi_client.exceptions import (
     ApiValueError,
     ApiException,
     BadRequestException,
+    DeadlineExceededException,
     UnauthorizedException,
     ForbiddenException,
     NotFoundException,
@@ -42,6 +59,120 @@ from openapi_client.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+# Node kinds used by `ApiClient.sanitize_for_serialization`. Kinds below
+# `_SANITIZE_CONTAINER` are leaves, the others are walked; kinds from
+# `_SANITIZE_DICT` onwards are walked as mappings.
+_SANITIZE_IDENTITY = 0
+_SANITIZE_ENUM = 1
+_SANITIZE_SECRET = 2
+_SANITIZE_ISOFORMAT = 3
+_SANITIZE_STR = 4
+_SANITIZE_CONTAINER = 5
+_SANITIZE_LIST = 5
+_SANITIZE_LIST_COPY = 6
+_SANITIZE_TUPLE = 7
+_SANITIZE_TUPLE_COPY = 8
+_SANITIZE_DICT = 9
+_SANITIZE_DICT_COPY = 10
+_SANITIZE_MODEL = 11
+_SANITIZE_OBJECT = 12
+_SANITIZE_PLAIN_KINDS = frozenset((
+    _SANITIZE_LIST, _SANITIZE_TUPLE, _SANITIZE_DICT,
+))
+_SANITIZE_COPY_KINDS = frozenset((
+    _SANITIZE_LIST_COPY, _SANITIZE_TUPLE_COPY, _SANITIZE_DICT_COPY,
+))
+_SANITIZE_CYCLE_CHECK_DEPTH = 64
+
+_POOL_LOCK = threading.Lock()
+
+
+def _discard_response(future):
+    """Closes the connection of a hedged request that lost the race."""
+    if not future.cancelled() and future.exception() is None:
+        response = future.result().response
+        response.close()
+        # closing alone keeps the pool slot taken with a blocking pool
+        response.release_conn()
+
+
+_PATH_PARAM_PATTERN = re.compile(r'\{([^{}]+)\}')
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_path_value(value, safe):
+    return quote(value, safe=safe)
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_query_value(value):
+    return quote(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _select_json_media_type(media_types):
+    """Returns the first JSON media type, or the first one if none is JSON."""
+    for media_type in media_types:
+        if re.search('json', media_type, re.IGNORECASE):
+            return media_type
+    return media_types[0]
+
+
+def _all_str_values(params):
+    """Whether every value of a dict or list of two-tuples is a `str`."""
+    for _, v in params.items() if isinstance(params, dict) else params:
+        if type(v) is not str:
+            return False
+    return True
+
+
+def _encode_str_query(params):
+    """Encodes a list of (name, str value) tuples as a URL query string."""
+    return "&".join([
+        "%s=%s" % (k, _quote_query_value(v)) for k, v in params
+    ])
+
+
+class RequestTemplate:
+    """The parts of an operation's request that do not change per call.
+
+    Built once per (method, resource path) by `ApiClient.param_serialize`,
+    so later calls only substitute the path parameter values.
+
+    :param method: HTTP method of the operation.
+    :param resource_path: Path template, e.g. `/ide/get-assistant/{ownerSlug}`.
+    """
+
+    __slots__ = ('method', 'resource_path', 'literals', 'path_param_names')
+
+    def __init__(self, method, resource_path) -> None:
+        self.method = method
+        self.resource_path = resource_path
+        parts = _PATH_PARAM_PATTERN.split(resource_path)
+        self.literals = parts[0::2]
+        self.path_param_names = parts[1::2]
+
+    def render_path(self, path_params, safe_chars):
+        """Substitutes path parameter values into the resource path.
+
+        :param path_params: dict of path parameter name to value.
+        :param safe_chars: characters `quote` must not encode.
+        :return: The rendered resource path.
+        """
+        if not self.path_param_names:
+            return self.resource_path
+        literals = self.literals
+        path = [literals[0]]
+        for i, name in enumerate(self.path_param_names):
+            if name in path_params:
+                path.append(
+                    _quote_path_value(str(path_params[name]), safe_chars)
+                )
+            else:
+                path.append('{%s}' % name)
+            path.append(literals[i + 1])
+        return ''.join(path)
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -56,6 +187,22 @@ class ApiClient:
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+    :param response_cache: optional SharedResponseCache serving `GET`
+        requests, shared with other processes on the host.
+    :param pool_threads: The number of threads to use for concurrent
+        requests such as the bulk operations. Defaults to
+        `configuration.connection_pool_maxsize`.
+    :param rate_limiter: optional RateLimiter every request must obtain
+        a token from before it is sent.
+    :param hedging_policy: optional HedgingPolicy; slow `GET` requests
+        are then duplicated and the first response is used.
+    :param host_selector: optional HostSelector routing each request to
+        the best healthy host, failing over on connect errors.
+    :param adaptive_timeout: optional AdaptiveTimeout setting the timeouts
+        of requests from the observed latency of their operation.
+    :param transport: optional Transport sending the requests, e.g. a
+        WSGITransport, ASGITransport or UnixSocketTransport. Defaults to
+        urllib3 over TCP.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
@@ -71,24 +218,64 @@ class ApiClient:
         'object': object,
     }
     _pool = None
+    _hedge_pool = None
+    _sanitize_kinds = {
+        type(None): _SANITIZE_IDENTITY,
+        str: _SANITIZE_IDENTITY,
+        int: _SANITIZE_IDENTITY,
+        float: _SANITIZE_IDENTITY,
+        bool: _SANITIZE_IDENTITY,
+        bytes: _SANITIZE_IDENTITY,
+        list: _SANITIZE_LIST,
+        tuple: _SANITIZE_TUPLE,
+        dict: _SANITIZE_DICT,
+        datetime.datetime: _SANITIZE_ISOFORMAT,
+        datetime.date: _SANITIZE_ISOFORMAT,
+        decimal.Decimal: _SANITIZE_STR,
+        SecretStr: _SANITIZE_SECRET,
+    }
 
     def __init__(
         self,
         configuration=None,
         header_name=None,
         header_value=None,
-        cookie=None
+        cookie=None,
+        response_cache=None,
+        pool_threads=None,
+        rate_limiter=None,
+        hedging_policy=None,
+        host_selector=None,
+        adaptive_timeout=None,
+        transport=None
     ) -> None:
         # use default configuration if none is provided
         if configuration is None:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        if transport is None:
+            transport = rest.RESTClientObject(configuration)
+        self.rest_client = transport
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
         self.cookie = cookie
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+        self.hedging_policy = hedging_policy
+        self.host_selector = host_selector
+        self.adaptive_timeout = adaptive_timeout
+        # set by SecretPrefetcher(api, scan_responses=True)
+        self.secret_prefetcher = None
+        self.pool_threads = pool_threads or configuration.connection_pool_maxsize or 1
+        self._request_templates: Dict[Tuple[str, str], RequestTemplate] = {}
+        self._static_headers: Dict[str, str] = {}
+        self._static_headers_key: Optional[Tuple[Any, ...]] = None
+        self._rendered_auth: Dict[
+            Tuple[Any, ...], Tuple[Dict[str, str], List[Tuple[str, str]]]
+        ] = {}
+        self._auth_state: Optional[Tuple[Configuration, int, Optional[int]]] = None
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
@@ -97,7 +284,58 @@ class ApiClient:
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        self.close()
+
+    def close(self):
+        """Shuts down the thread pools, if any were started."""
+        pools = [self._pool, self._hedge_pool]
+        self._pool = self._hedge_pool = None
+        if any(pools):
+            atexit.unregister(self.close)
+        for pool in pools:
+            if pool:
+                pool.shutdown(wait=True)
+
+    @property
+    def pool(self):
+        """Thread pool shared by the concurrent operations of this client.
+
+        Created on first use, so blocking-only clients never start threads.
+        """
+        if self._pool is None:
+            with _POOL_LOCK:
+                if self._pool is None:
+                    atexit.register(self.close)
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.pool_threads,
+                        thread_name_prefix='openapi-client',
+                    )
+        return self._pool
+
+    @property
+    def hedge_pool(self):
+        """Thread pool running hedged requests.
+
+        Separate from `pool`, so operations running on `pool` never wait
+        for requests queued behind themselves.
+        """
+        if self._hedge_pool is None:
+            with _POOL_LOCK:
+                if self._hedge_pool is None:
+                    atexit.register(self.close)
+                    self._hedge_pool = ThreadPoolExecutor(
+                        max_workers=2 * self.pool_threads,
+                        thread_name_prefix='openapi-client-hedge',
+                    )
+        return self._hedge_pool
+
+    def pool_stats(self):
+        """Returns the PoolStats of the connection pool of each host, by
+        `scheme://host:port`; empty for transports without connection
+        pools, such as WSGITransport.
+        """
+        pool_stats = getattr(self.rest_client, 'pool_stats', None)
+        return pool_stats() if pool_stats is not None else {}
 
     @property
     def user_agent(self):
@@ -176,13 +414,15 @@ class ApiClient:
         """
 
         config = self.configuration
+        template = self._request_templates.get((method, resource_path))
+        if template is None:
+            template = RequestTemplate(method, resource_path)
+            self._request_templates[(method, resource_path)] = template
 
         # header parameters
-        header_params = header_params or {}
-        header_params.update(self.default_headers)
-        if self.cookie:
-            header_params['Cookie'] = self.cookie
-        if header_params:
+        header_params = dict(header_params) if header_params else {}
+        header_params.update(self._render_static_headers())
+        if collection_formats or not _all_str_values(header_params):
             header_params = self.sanitize_for_serialization(header_params)
             header_params = dict(
                 self.parameters_to_tuples(header_params,collection_formats)
@@ -191,16 +431,16 @@ class ApiClient:
         # path parameters
         if path_params:
             path_params = self.sanitize_for_serialization(path_params)
-            path_params = self.parameters_to_tuples(
+            if collection_formats:
+                path_params = dict(self.parameters_to_tuples(
+                    path_params,
+                    collection_formats
+                ))
+            # specified safe chars, encode everything
+            resource_path = template.render_path(
                 path_params,
-                collection_formats
+                config.safe_chars_for_path_param
             )
-            for k, v in path_params:
-                # specified safe chars, encode everything
-                resource_path = resource_path.replace(
-                    '{%s}' % k,
-                    quote(str(v), safe=config.safe_chars_for_path_param)
-                )
 
         # post parameters
         if post_params or files:
@@ -214,15 +454,24 @@ class ApiClient:
                 post_params.extend(self.files_parameters(files))
 
         # auth setting
-        self.update_params_for_auth(
-            header_params,
-            query_params,
-            auth_settings,
-            resource_path,
-            method,
-            body,
-            request_auth=_request_auth
-        )
+        rendered_auth = None
+        if auth_settings and not _request_auth:
+            rendered_auth = self._render_auth(template, auth_settings)
+        if rendered_auth is not None:
+            auth_headers, auth_queries = rendered_auth
+            header_params.update(auth_headers)
+            if auth_queries:
+                query_params.extend(auth_queries)
+        else:
+            self.update_params_for_auth(
+                header_params,
+                query_params,
+                auth_settings,
+                resource_path,
+                method,
+                body,
+                request_auth=_request_auth
+            )
 
         # body
         if body:
@@ -237,15 +486,78 @@ class ApiClient:
 
         # query parameters
         if query_params:
-            query_params = self.sanitize_for_serialization(query_params)
-            url_query = self.parameters_to_url_query(
-                query_params,
-                collection_formats
-            )
+            if collection_formats or not _all_str_values(query_params):
+                query_params = self.sanitize_for_serialization(query_params)
+                url_query = self.parameters_to_url_query(
+                    query_params,
+                    collection_formats
+                )
+            else:
+                url_query = _encode_str_query(query_params)
             url += "?" + url_query
 
         return method, url, header_params, body, post_params
 
+    def _render_static_headers(self):
+        """Returns the sanitized default headers and cookie.
+
+        The rendered headers are cached until `default_headers` or `cookie`
+        change.
+
+        :return: dict of header name to header value.
+        """
+        key = (self.cookie, tuple(self.default_headers.items()))
+        if key != self._static_headers_key:
+            headers = dict(self.default_headers)
+            if self.cookie:
+                headers['Cookie'] = self.cookie
+            headers = self.sanitize_for_serialization(headers)
+            self._static_headers = dict(self.parameters_to_tuples(headers, None))
+            self._static_headers_key = key
+        return self._static_headers
+
+    def _render_auth(self, template, auth_settings):
+        """Returns the pre-rendered auth headers and queries for an operation.
+
+        Rendered auth is cached per operation and dropped whenever the
+        configuration, its credentials or its token manager's token change.
+        Nothing is cached while a `refresh_api_key_hook` is set, since the
+        hook must run for every request.
+
+        :param template: RequestTemplate of the operation.
+        :param auth_settings: Authentication setting identifiers list.
+        :return: tuple of (headers dict, queries list), or None when the
+            auth must be applied per request.
+        """
+        config = self.configuration
+        if config.refresh_api_key_hook is not None:
+            return None
+        token_revision = None
+        if config.token_manager is not None:
+            # only blocks when the manager holds no usable token
+            config.token_manager.get_token()
+            token_revision = config.token_manager.revision
+        state = (config, config.auth_revision, token_revision)
+        if state != self._auth_state:
+            self._rendered_auth.clear()
+            self._auth_state = state
+        key = (template.method, template.resource_path, tuple(auth_settings))
+        rendered = self._rendered_auth.get(key)
+        if rendered is None:
+            headers: Dict[str, str] = {}
+            queries: List[Tuple[str, str]] = []
+            self.update_params_for_auth(
+                headers,
+                queries,
+                auth_settings,
+                template.resource_path,
+                template.method,
+                None
+            )
+            rendered = (headers, queries)
+            self._rendered_auth[key] = rendered
+        return rendered
+
 
     def call_api(
         self,
@@ -254,7 +566,8 @@ class ApiClient:
         header_params=None,
         body=None,
         post_params=None,
-        _request_timeout=None
+        _request_timeout=None,
+        _operation_id=None
     ) -> rest.RESTResponse:
         """Makes the HTTP request (synchronous)
         :param method: Method to call.
@@ -265,23 +578,193 @@ class ApiClient:
         :param post_params dict: Request post form parameters,
             for `application/x-www-form-urlencoded`, `multipart/form-data`.
         :param _request_timeout: timeout setting for this request.
+        :param _operation_id: name of the API operation, used to apply
+            per-operation settings such as rate limits.
         :return: RESTResponse
+
+        When `configuration.request_deadline` is set, every attempt of the
+        call, including failovers, hedges and urllib3's own retries, must
+        start before the deadline and is timed out when it is reached.
         """
 
+        deadline = None
+        if self.configuration.request_deadline is not None:
+            deadline = time.monotonic() + self.configuration.request_deadline
+        trackers = self._latency_trackers()
+
+        def send(target=url):
+            rate_limiter = self.rate_limiter
+            if rate_limiter is not None:
+                rate_limiter.acquire(_operation_id)
+            timeout = _request_timeout
+            options = {}
+            if deadline is not None or (
+                self.adaptive_timeout is not None and not _request_timeout
+            ):
+                timeout, retries = self._attempt_timeout(
+                    _operation_id, _request_timeout, deadline
+                )
+                if retries is not None:
+                    options['_retries'] = retries
+            request_log = start_request_log(
+                self.configuration, _operation_id, method, target
+            )
+            start = time.monotonic()
+            try:
+                response = self.rest_client.request(
+                    method, target,
+                    headers=header_params,
+                    body=body, post_params=post_params,
+                    _request_timeout=timeout,
+                    **options
+                )
+            except Exception as e:
+                if request_log is not None:
+                    request_log.finish(error=e)
+                raise
+            for tracker in trackers:
+                tracker.record(_operation_id, time.monotonic() - start)
+            # logged once the body has been read
+            response.request_log = request_log
+            if rate_limiter is not None and response.status == 429:
+                rate_limiter.throttled(
+                    _operation_id, response.getheader('Retry-After')
+                )
+            max_size = self.configuration.max_response_size_by_operation.get(
+                _operation_id, self.configuration.max_response_size
+            )
+            if max_size is not None:
+                response.limit(max_size)
+            return response
+
+        if self.host_selector is not None:
+            send = functools.partial(self._send_failover, send, url)
+        if self.hedging_policy is not None and method == 'GET':
+            send = functools.partial(self._send_hedged, send, _operation_id)
+
         try:
             # perform request and return response
-            response_data = self.rest_client.request(
-                method, url,
-                headers=header_params,
-                body=body, post_params=post_params,
-                _request_timeout=_request_timeout
-            )
+            if self.response_cache is not None and method == 'GET':
+                response_data = self.response_cache.fetch(
+                    method, url, header_params, send
+                )
+            else:
+                response_data = send()
 
         except ApiException as e:
             raise e
 
+        if self.secret_prefetcher is not None:
+            # read back by response_deserialize to scan the result
+            response_data.operation_id = _operation_id
+            response_data.url = url
         return response_data
 
+    def _latency_trackers(self):
+        """Returns the distinct trackers fed by the latency of requests."""
+        trackers = []
+        for owner in (self.hedging_policy, self.adaptive_timeout):
+            if owner is not None and owner.tracker not in trackers:
+                trackers.append(owner.tracker)
+        return trackers
+
+    def _attempt_timeout(self, operation_id, request_timeout, deadline):
+        """Returns the urllib3 Timeout and Retry of the next attempt of a
+        call, bounded by its deadline.
+
+        :raises DeadlineExceededException: if the deadline has passed.
+        """
+        timeout = {}
+        if request_timeout:
+            if isinstance(request_timeout, tuple):
+                timeout['connect'], timeout['read'] = request_timeout
+            else:
+                timeout['total'] = request_timeout
+        elif self.adaptive_timeout is not None:
+            timeout['connect'] = self.adaptive_timeout.connect_timeout
+            timeout['read'] = self.adaptive_timeout.read_timeout(operation_id)
+        retries = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededException(self.configuration.request_deadline)
+            timeout['total'] = min(timeout.get('total') or remaining, remaining)
+            retries = DeadlineRetry.wrap(self.configuration.retries, deadline)
+        return urllib3.Timeout(**timeout), retries
+
+    def _send_failover(self, send, url):
+        """Calls `send` with `url` moved to the hosts of `host_selector`,
+        best first, until one of them accepts the connection."""
+        selector = self.host_selector
+        base = self.configuration.host
+        if not url.startswith(base):
+            # the operation targets its own server
+            return send(url)
+        path = url[len(base):]
+        error: Optional[Exception] = None
+        for host in selector.candidates():
+            selector.begin(host)
+            start = time.monotonic()
+            try:
+                response = send(host + path)
+            except Exception as e:
+                if not is_connect_error(e):
+                    selector.record_abandoned(host)
+                    raise
+                selector.record_failure(host)
+                error = e
+                continue
+            if response.status in (502, 503, 504):
+                selector.record_failure(host)
+            else:
+                selector.record_success(host, time.monotonic() - start)
+            return response
+        assert error is not None
+        raise error
+
+    def _send_hedged(self, send, operation_id):
+        """Calls `send`, calling it a second time if the first call is slow.
+
+        The first call to succeed wins; the other one is cancelled if it
+        has not started yet, or has its connection closed once it answers.
+        """
+        policy = self.hedging_policy
+        policy.on_request()
+        delay = policy.delay(operation_id)
+        if delay is None:
+            return send()
+        pool = self.hedge_pool
+        primary = pool.submit(send)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        if not policy.try_hedge():
+            return primary.result()
+
+        attempts = [primary, pool.submit(send)]
+        pending = set(attempts)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for winner in attempts:
+                if winner in done and winner.exception() is None:
+                    for loser in attempts:
+                        if loser is not winner and not loser.cancel():
+                            loser.add_done_callback(_discard_response)
+                    if winner is not primary:
+                        policy.hedge_won()
+                    return winner.result()
+        # both attempts failed, report the original one
+        return primary.result()
+
+    @staticmethod
+    def _select_response_type(status, response_types_map):
+        response_type = response_types_map.get(str(status), None)
+        if not response_type and isinstance(status, int) and 100 <= status <= 599:
+            # if not found, look for '1XX', '2XX', etc.
+            response_type = response_types_map.get(str(status)[0] + "XX", None)
+        return response_type
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -291,16 +774,25 @@ class ApiClient:
         :param response_data: RESTResponse object to be deserialized.
         :param response_types_map: dict of response types.
         :return: ApiResponse
+
+        Responses of the `file` type may be passed without calling
+        `RESTResponse.read()` first (e.g. from the
+        `*_without_preload_content` methods); they are then streamed to
+        disk instead of being buffered.
         """
 
+        response_type = self._select_response_type(response_data.status, response_types_map)
+        if response_type == "file" and 200 <= response_data.status <= 299:
+            return ApiResponse(
+                status_code = response_data.status,
+                data = self.__deserialize_file(response_data),
+                headers = response_data.getheaders(),
+                raw_data = response_data.data or b''
+            )
+
         msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
         assert response_data.data is not None, msg
 
-        response_type = response_types_map.get(str(response_data.status), None)
-        if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
-            # if not found, look for '1XX', '2XX', etc.
-            response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
-
         # deserialize response data
         response_text = None
         return_data = None
@@ -325,6 +817,8 @@ class ApiClient:
                     data=return_data,
                 )
 
+        if self.secret_prefetcher is not None:
+            self.secret_prefetcher.scan_response(response_data, return_data)
         return ApiResponse(
             status_code = response_data.status,
             data = return_data,
@@ -345,47 +839,170 @@ class ApiClient:
         If obj is dict, return the dict.
         If obj is OpenAPI model, return the properties dict.
 
+        Nodes are dispatched on their exact type and the tree is walked
+        with an explicit stack, so deeply nested bodies do not hit the
+        recursion limit. Plain `dict`, `list` and `tuple` containers whose
+        contents are already JSON-safe are returned as-is instead of being
+        copied.
+
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
-        if obj is None:
-            return None
-        elif isinstance(obj, Enum):
-            return obj.value
-        elif isinstance(obj, SecretStr):
-            return obj.get_secret_value()
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
+        kinds = self._sanitize_kinds
+        kind = kinds.get(type(obj))
+        if kind is None:
+            kind = self._resolve_sanitize_kind(type(obj))
+        if kind == _SANITIZE_IDENTITY:
             return obj
-        elif isinstance(obj, list):
-            return [
-                self.sanitize_for_serialization(sub_obj) for sub_obj in obj
-            ]
-        elif isinstance(obj, tuple):
-            return tuple(
-                self.sanitize_for_serialization(sub_obj) for sub_obj in obj
+        if kind < _SANITIZE_CONTAINER:
+            return self._sanitize_leaf(kind, obj)
+
+        # Each frame is [kind, source, iterator, values, changed, pending],
+        # where `pending` is the child container currently being sanitized.
+        stack: List[List[Any]] = []
+        # ids of the containers on the stack, only tracked once the stack is
+        # deep enough for a circular reference to be plausible
+        active: Optional[Set[int]] = None
+        node = obj
+        while True:
+            # descend into a container node
+            if kind in _SANITIZE_PLAIN_KINDS:
+                source, changed = node, False
+            else:
+                source, changed = self._sanitize_source(kind, node)
+            if len(stack) >= _SANITIZE_CYCLE_CHECK_DEPTH:
+                if active is None:
+                    active = {id(frame[1]) for frame in stack}
+                if id(source) in active:
+                    raise ApiValueError(
+                        "Circular reference detected while serializing %s"
+                        % type(node).__name__
+                    )
+                active.add(id(source))
+            iterator = iter(
+                source.values() if kind >= _SANITIZE_DICT else source
             )
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
+            frame = [kind, source, iterator, [], changed, None]
+            stack.append(frame)
+
+            while True:
+                values = frame[3]
+                for child in frame[2]:
+                    child_kind = kinds.get(type(child))
+                    if child_kind is None:
+                        child_kind = self._resolve_sanitize_kind(type(child))
+                    if child_kind == _SANITIZE_IDENTITY:
+                        values.append(child)
+                        continue
+                    if child_kind < _SANITIZE_CONTAINER:
+                        values.append(self._sanitize_leaf(child_kind, child))
+                        frame[4] = True
+                        continue
+                    if child_kind in _SANITIZE_PLAIN_KINDS:
+                        # fast pass: a plain container holding only JSON
+                        # scalars is kept without pushing a frame for it
+                        for value in (
+                            child.values() if child_kind == _SANITIZE_DICT
+                            else child
+                        ):
+                            if kinds.get(type(value)) != _SANITIZE_IDENTITY:
+                                break
+                        else:
+                            values.append(child)
+                            continue
+                    frame[5] = node = child
+                    kind = child_kind
+                    break
+                else:
+                    # the frame is exhausted: build its result and hand it
+                    # back to the parent frame
+                    stack.pop()
+                    if active is not None:
+                        active.discard(id(frame[1]))
+                    if frame[4]:
+                        result = self._sanitize_finish(frame)
+                    else:
+                        result = frame[1]
+                    if not stack:
+                        return result
+                    frame = stack[-1]
+                    frame[3].append(result)
+                    if result is not frame[5]:
+                        frame[4] = True
+                    continue
+                break
+
+    def _resolve_sanitize_kind(self, klass):
+        """Classifies a type for `sanitize_for_serialization`.
+
+        The result is cached per exact type, so the `isinstance` chain only
+        runs the first time a given type is seen.
+
+        :param klass: The type to classify.
+        :return: One of the `_SANITIZE_*` kinds.
+        """
+        if klass is type(None):
+            kind = _SANITIZE_IDENTITY
+        elif issubclass(klass, Enum):
+            kind = _SANITIZE_ENUM
+        elif issubclass(klass, SecretStr):
+            kind = _SANITIZE_SECRET
+        elif issubclass(klass, self.PRIMITIVE_TYPES):
+            kind = _SANITIZE_IDENTITY
+        elif issubclass(klass, list):
+            kind = _SANITIZE_LIST if klass is list else _SANITIZE_LIST_COPY
+        elif issubclass(klass, tuple):
+            kind = _SANITIZE_TUPLE if klass is tuple else _SANITIZE_TUPLE_COPY
+        elif issubclass(klass, (datetime.datetime, datetime.date)):
+            kind = _SANITIZE_ISOFORMAT
+        elif issubclass(klass, decimal.Decimal):
+            kind = _SANITIZE_STR
+        elif issubclass(klass, dict):
+            kind = _SANITIZE_DICT if klass is dict else _SANITIZE_DICT_COPY
+        elif callable(getattr(klass, 'to_dict', None)):
+            kind = _SANITIZE_MODEL
+        else:
+            kind = _SANITIZE_OBJECT
+        self._sanitize_kinds[klass] = kind
+        return kind
+
+    @staticmethod
+    def _sanitize_leaf(kind, obj):
+        """Converts a non-container value to its JSON form."""
+        if kind == _SANITIZE_ISOFORMAT:
             return obj.isoformat()
-        elif isinstance(obj, decimal.Decimal):
+        elif kind == _SANITIZE_ENUM:
+            return obj.value
+        elif kind == _SANITIZE_SECRET:
+            return obj.get_secret_value()
+        else:
             return str(obj)
 
-        elif isinstance(obj, dict):
-            obj_dict = obj
-        else:
+    @staticmethod
+    def _sanitize_source(kind, obj):
+        """Returns the container to walk for `obj` and whether the result
+        must be a new container regardless of its contents."""
+        if kind == _SANITIZE_MODEL:
             # Convert model obj to dict except
             # attributes `openapi_types`, `attribute_map`
             # and attributes which value is not None.
             # Convert attribute name to json key in
             # model definition for request.
-            if hasattr(obj, 'to_dict') and callable(getattr(obj, 'to_dict')):
-                obj_dict = obj.to_dict()
-            else:
-                obj_dict = obj.__dict__
-
-        return {
-            key: self.sanitize_for_serialization(val)
-            for key, val in obj_dict.items()
-        }
+            # `to_dict()` returns a fresh dict, so it can be reused as-is.
+            return obj.to_dict(), False
+        elif kind == _SANITIZE_OBJECT:
+            return obj.__dict__, True
+        return obj, kind in _SANITIZE_COPY_KINDS
+
+    @staticmethod
+    def _sanitize_finish(frame):
+        """Builds a new sanitized container for an exhausted stack frame."""
+        kind, source, _, values, _, _ = frame
+        if kind >= _SANITIZE_DICT:
+            return dict(zip(source, values))
+        elif kind in (_SANITIZE_TUPLE, _SANITIZE_TUPLE_COPY):
+            return tuple(values)
+        return values
 
     def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
         """Deserializes response into an object.
@@ -445,6 +1062,10 @@ class ApiClient:
                 return {k: self.__deserialize(v, sub_kls)
                         for k, v in data.items()}
 
+            # None was handled above, so only the wrapped type is left
+            if klass.startswith('Optional['):
+                return self.__deserialize(data, klass[len('Optional['):-1])
+
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
                 klass = self.NATIVE_TYPES_MAPPING[klass]
@@ -537,20 +1158,25 @@ class ApiClient:
 
     def files_parameters(
         self,
-        files: Dict[str, Union[str, bytes, List[str], List[bytes], Tuple[str, bytes]]],
+        files: Dict[str, Union[str, bytes, List[str], List[bytes], Tuple[str, Any], Any]],
     ):
         """Builds form parameters.
 
-        :param files: File parameters.
+        File contents are not read here: paths become `FileSource` parts
+        and file objects are passed through, so the multipart body is
+        streamed when the request is sent.
+
+        :param files: File parameters: paths, bytes-like values (including
+            `mmap`), binary file objects or `(filename, data)` tuples.
         :return: Form parameters with files.
         """
         params = []
         for k, v in files.items():
+            filedata: Any
             if isinstance(v, str):
-                with open(v, 'rb') as f:
-                    filename = os.path.basename(f.name)
-                    filedata = f.read()
-            elif isinstance(v, bytes):
+                filename = os.path.basename(v)
+                filedata = FileSource(v)
+            elif isinstance(v, (bytes, bytearray, memoryview, mmap.mmap)):
                 filename = k
                 filedata = v
             elif isinstance(v, tuple):
@@ -559,6 +1185,9 @@ class ApiClient:
                 for file_param in v:
                     params.extend(self.files_parameters({k: file_param}))
                 continue
+            elif hasattr(v, 'read'):
+                filename = os.path.basename(getattr(v, 'name', None) or k)
+                filedata = v
             else:
                 raise ValueError("Unsupported file value")
             mimetype = (
@@ -579,11 +1208,7 @@ class ApiClient:
         if not accepts:
             return None
 
-        for accept in accepts:
-            if re.search('json', accept, re.IGNORECASE):
-                return accept
-
-        return accepts[0]
+        return _select_json_media_type(tuple(accepts))
 
     def select_header_content_type(self, content_types):
         """Returns `Content-Type` based on an array of content_types provided.
@@ -594,11 +1219,7 @@ class ApiClient:
         if not content_types:
             return None
 
-        for content_type in content_types:
-            if re.search('json', content_type, re.IGNORECASE):
-                return content_type
-
-        return content_types[0]
+        return _select_json_media_type(tuple(content_types))
 
     def update_params_for_auth(
         self,
@@ -683,6 +1304,8 @@ class ApiClient:
 
         Saves response body into a file in a temporary folder,
         using the filename from the `Content-Disposition` header if provided.
+        The body is copied in chunks, straight from the connection when it
+        has not been read yet.
 
         handle file downloading
         save response body into a tmp file and return the instance
@@ -705,7 +1328,8 @@ class ApiClient:
             path = os.path.join(os.path.dirname(path), filename)
 
         with open(path, "wb") as f:
-            f.write(response.data)
+            for chunk in response.stream():
+                f.write(chunk)
 
         return path
 
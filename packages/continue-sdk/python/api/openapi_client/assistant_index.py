@@ -0,0 +1,200 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Inverted index over the unrolled configs of assistants.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import threading
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Optional, Set, Tuple
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.bulk import list_assistants_for_all_orgs
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.records import AssistantRecord
+
+# (ownerSlug, packageSlug)
+AssistantKey = Tuple[str, str]
+Term = Tuple[str, str]
+
+FACETS = ('model', 'provider', 'model_name', 'mcp_server', 'context_provider')
+
+_EMPTY: FrozenSet[AssistantKey] = frozenset()
+_NO_TERMS: FrozenSet[Term] = frozenset()
+
+
+def _assistant_fields(assistant: Any) -> Tuple[AssistantKey, Optional[Dict[str, Any]]]:
+    if isinstance(assistant, ListAssistants200ResponseInner):
+        return (
+            (assistant.owner_slug, assistant.package_slug),
+            assistant.config_result.config,
+        )
+    if isinstance(assistant, AssistantRecord):
+        return assistant.key, assistant.config
+    config_result = assistant.get('configResult') or {}
+    return (assistant['ownerSlug'], assistant['packageSlug']), config_result.get('config')
+
+
+def config_terms(config: Optional[Dict[str, Any]]) -> FrozenSet[Term]:
+    """Returns the `(facet, value)` terms an unrolled config is indexed by."""
+    terms: Set[Term] = set()
+    if not config:
+        return frozenset()
+
+    def items(section: str) -> Iterable[Dict[str, Any]]:
+        return (item for item in config.get(section) or () if isinstance(item, dict))
+
+    for model in items('models'):
+        for facet, field in (('model', 'model'), ('provider', 'provider'), ('model_name', 'name')):
+            value = model.get(field)
+            if isinstance(value, str):
+                terms.add((facet, value))
+    for server in items('mcpServers'):
+        if isinstance(server.get('name'), str):
+            terms.add(('mcp_server', server['name']))
+    for context in items('context'):
+        if isinstance(context.get('provider'), str):
+            terms.add(('context_provider', context['provider']))
+    return frozenset(terms)
+
+
+class AssistantIndex:
+    """Finds the assistants that use a model, provider, MCP server or
+    context provider, without scanning their configs.
+
+    Assistants are indexed by the terms of their `configResult.config`
+    (see `FACETS`). `update` and `sync` only touch the postings of terms
+    that changed, so keeping the index current costs work in proportion
+    to the changes, and a lookup is a dictionary access.
+
+    Lookups return frozensets of `(ownerSlug, packageSlug)` keys.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._postings: Dict[Term, FrozenSet[AssistantKey]] = {}
+        self._terms: Dict[AssistantKey, FrozenSet[Term]] = {}
+        self._scopes: Dict[Hashable, Set[AssistantKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._terms
+
+    def _apply(self, changes: Dict[AssistantKey, Optional[FrozenSet[Term]]]) -> None:
+        """Sets the terms of assistants, None removing them.
+
+        Postings are replaced rather than mutated, so readers can hold a
+        lookup result without copying it; each changed posting is rebuilt
+        once per batch.
+        """
+        added: Dict[Term, Set[AssistantKey]] = {}
+        removed: Dict[Term, Set[AssistantKey]] = {}
+        for key, terms in changes.items():
+            old = self._terms.get(key, _NO_TERMS)
+            if terms is None:
+                self._terms.pop(key, None)
+                terms = _NO_TERMS
+            else:
+                self._terms[key] = terms
+            for term in old - terms:
+                removed.setdefault(term, set()).add(key)
+            for term in terms - old:
+                added.setdefault(term, set()).add(key)
+        for term in added.keys() | removed.keys():
+            posting = self._postings.get(term, _EMPTY)
+            posting = (posting - removed.get(term, _EMPTY)) | added.get(term, _EMPTY)
+            if posting:
+                self._postings[term] = posting
+            else:
+                self._postings.pop(term, None)
+
+    def update(self, assistants: Iterable[Any], scope: Hashable = None) -> None:
+        """Indexes or re-indexes assistants.
+
+        :param assistants: ListAssistants200ResponseInner models,
+          AssistantRecords, or their JSON dicts.
+        :param scope: Scope the assistants are listed in, for `sync`.
+        """
+        changes: Dict[AssistantKey, Optional[FrozenSet[Term]]] = dict(
+            (key, config_terms(config))
+            for key, config in map(_assistant_fields, assistants)
+        )
+        with self._lock:
+            self._apply(changes)
+            self._scopes.setdefault(scope, set()).update(changes)
+
+    def sync(self, assistants: Iterable[Any], scope: Hashable = None) -> None:
+        """Makes the assistants of a scope, such as the result of
+        `list_assistants` for one organization, the complete set of that
+        scope: assistants previously synced in it but absent now are
+        removed, unless another scope still lists them."""
+        changes: Dict[AssistantKey, Optional[FrozenSet[Term]]] = dict(
+            (key, config_terms(config))
+            for key, config in map(_assistant_fields, assistants)
+        )
+        with self._lock:
+            previous = self._scopes.get(scope, set())
+            gone = previous - changes.keys()
+            for other, members in self._scopes.items():
+                if other != scope:
+                    gone -= members
+            changes.update((key, None) for key in gone)
+            self._apply(changes)
+            self._scopes[scope] = {key for key, terms in changes.items() if key not in gone}
+
+    def remove(self, key: AssistantKey) -> None:
+        with self._lock:
+            self._apply({key: None})
+            for members in self._scopes.values():
+                members.discard(key)
+
+    def find(self, facet: str, value: str) -> FrozenSet[AssistantKey]:
+        """Returns the assistants whose config has `value` for `facet`."""
+        if facet not in FACETS:
+            raise ValueError("facet must be one of {0}".format(', '.join(FACETS)))
+        return self._postings.get((facet, value), _EMPTY)
+
+    def by_model(self, model: str) -> FrozenSet[AssistantKey]:
+        return self.find('model', model)
+
+    def by_provider(self, provider: str) -> FrozenSet[AssistantKey]:
+        return self.find('provider', provider)
+
+    def by_mcp_server(self, name: str) -> FrozenSet[AssistantKey]:
+        return self.find('mcp_server', name)
+
+    def by_context_provider(self, provider: str) -> FrozenSet[AssistantKey]:
+        return self.find('context_provider', provider)
+
+    def values(self, facet: str) -> FrozenSet[str]:
+        """Returns every indexed value of a facet."""
+        with self._lock:
+            return frozenset(value for term_facet, value in self._postings if term_facet == facet)
+
+    def terms(self, key: AssistantKey) -> FrozenSet[Term]:
+        """Returns the terms an assistant is indexed by."""
+        return self._terms.get(key, _NO_TERMS)
+
+    def refresh(
+        self, api: DefaultApi, max_concurrency: int = 8, **kwargs: Any
+    ) -> Dict[Optional[str], BaseException]:
+        """Syncs every organization, and the personal assistants, from
+        `list_assistants_for_all_orgs`.
+
+        Organizations that fail keep their previous entries.
+
+        :param kwargs: Further keyword arguments for
+          `list_assistants_for_all_orgs`.
+        :return: The errors of the organizations that failed.
+        """
+        result = list_assistants_for_all_orgs(api, max_concurrency=max_concurrency, **kwargs)
+        for item in result:
+            if item.ok:
+                self.sync(item.value, scope=item.key)
+        return result.errors
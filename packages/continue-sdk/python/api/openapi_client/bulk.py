@@ -0,0 +1,214 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from openapi_client.models.get_assistant200_response import GetAssistant200Response
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+
+if TYPE_CHECKING:
+    from openapi_client.api.default_api import DefaultApi
+    from openapi_client.secret_prefetch import SecretPrefetcher
+
+
+class BulkItem(NamedTuple):
+    """The outcome of one call of a bulk operation.
+
+    Exactly one of `value` and `error` is meaningful, see `ok`.
+    """
+
+    key: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkResult(List[BulkItem]):
+    """The items of a bulk operation, in the order of its input.
+
+    Failures do not abort the operation; they are recorded on their item
+    and can be inspected with `errors` or re-raised with `raise_for_errors`.
+    """
+
+    @property
+    def values(self) -> List[Any]:
+        """Values of the successful items."""
+        return [item.value for item in self if item.ok]
+
+    @property
+    def errors(self) -> Dict[Any, BaseException]:
+        """Errors of the failed items, by key."""
+        return {item.key: item.error for item in self if item.error is not None}
+
+    @property
+    def ok(self) -> bool:
+        return all(item.ok for item in self)
+
+    def raise_for_errors(self) -> None:
+        """Raises the error of the first failed item, if any."""
+        for item in self:
+            if item.error is not None:
+                raise item.error
+
+
+def run_bulk(
+    executor: Executor,
+    func: Callable[[Any], Any],
+    keys: Iterable[Any],
+    max_concurrency: int,
+) -> BulkResult:
+    """Calls `func` for each key on `executor`, at most `max_concurrency`
+    at a time.
+
+    Keys are submitted lazily as earlier calls finish, so a large input
+    never floods the executor's queue or the connection pool.
+
+    :param executor: The executor to run the calls on.
+    :param func: Called with each key.
+    :param keys: The inputs.
+    :param max_concurrency: Upper bound of calls in flight.
+    :return: BulkResult in the order of `keys`.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    keys = list(keys)
+    items: List[Optional[BulkItem]] = [None] * len(keys)
+    pending: Set["Future[Any]"] = set()
+    indexes: Dict["Future[Any]", int] = {}
+
+    def collect(done: Iterable["Future[Any]"]) -> None:
+        for future in done:
+            index = indexes.pop(future)
+            error = future.exception()
+            if error is None:
+                items[index] = BulkItem(keys[index], future.result())
+            else:
+                items[index] = BulkItem(keys[index], error=error)
+
+    for index, key in enumerate(keys):
+        if len(pending) >= max_concurrency:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+        future = executor.submit(func, key)
+        indexes[future] = index
+        pending.add(future)
+    done, _ = wait(pending)
+    collect(done)
+    return BulkResult(items)  # type: ignore[arg-type]
+
+
+def get_assistants_bulk(
+    api: "DefaultApi",
+    slugs: Iterable[Tuple[str, str]],
+    always_use_proxy: Optional[str] = None,
+    organization_id: Optional[str] = None,
+    max_concurrency: int = 8,
+    secret_prefetcher: Optional["SecretPrefetcher"] = None,
+    **kwargs: Any,
+) -> BulkResult:
+    """Gets several assistants by slug concurrently.
+
+    Calls `api.get_assistant` for each `(owner_slug, package_slug)` pair on
+    the API client's thread pool, with at most `max_concurrency` calls in
+    flight. A failing call does not abort the others.
+
+    :param api: The DefaultApi, or a subclass, to call.
+    :param slugs: (owner_slug, package_slug) pairs to fetch.
+    :param always_use_proxy: Passed to each `get_assistant` call.
+    :param organization_id: Passed to each `get_assistant` call.
+    :param max_concurrency: Upper bound of calls in flight.
+    :param secret_prefetcher: If set, starts resolving the secrets
+                              referenced by the fetched assistants, in
+                              one `sync_secrets` call, once all are
+                              received.
+    :param kwargs: Further keyword arguments for `get_assistant`, such
+                   as `_request_timeout`.
+    :return: BulkResult of GetAssistant200Response, in input order and
+             keyed by the slug pair.
+    """
+
+    def fetch(slug: Tuple[str, str]) -> GetAssistant200Response:
+        owner_slug, package_slug = slug
+        return api.get_assistant(
+            owner_slug,
+            package_slug,
+            always_use_proxy=always_use_proxy,
+            organization_id=organization_id,
+            **kwargs
+        )
+
+    result = run_bulk(api.api_client.pool, fetch, slugs, max_concurrency)
+    if secret_prefetcher is not None:
+        # every assistant shares the organization scope: one batch
+        secret_prefetcher.prefetch(result.values, organization_id)
+    return result
+
+
+def list_assistants_for_all_orgs(
+    api: "DefaultApi",
+    always_use_proxy: Optional[str] = None,
+    include_personal: bool = True,
+    max_concurrency: int = 8,
+    secret_prefetcher: Optional["SecretPrefetcher"] = None,
+    **kwargs: Any,
+) -> BulkResult:
+    """Lists the assistants of every organization concurrently.
+
+    Calls `api.list_organizations`, then `api.list_assistants` for each
+    organization on the API client's thread pool, with at most
+    `max_concurrency` calls in flight. A failing organization does not
+    abort the others.
+
+    :param api: The DefaultApi, or a subclass, to call.
+    :param always_use_proxy: Passed to each `list_assistants` call.
+    :param include_personal: Whether to also list the personal
+                             assistants, under the key None.
+    :param max_concurrency: Upper bound of calls in flight.
+    :param secret_prefetcher: If set, starts resolving the secrets
+                              referenced by the assistants of each
+                              organization, in one `sync_secrets` call
+                              scoped to it, as soon as they are listed.
+    :param kwargs: Further keyword arguments for `list_assistants`, such
+                   as `_request_timeout`.
+    :return: BulkResult of List[ListAssistants200ResponseInner], keyed by
+             organization id, personal assistants first.
+    """
+    organizations = api.list_organizations().organizations
+    organization_ids: List[Optional[str]] = [org.id for org in organizations]
+    if include_personal:
+        organization_ids.insert(0, None)
+
+    def fetch(organization_id: Optional[str]) -> List[ListAssistants200ResponseInner]:
+        assistants = api.list_assistants(
+            always_use_proxy=always_use_proxy,
+            organization_id=organization_id,
+            **kwargs
+        )
+        if secret_prefetcher is not None:
+            secret_prefetcher.prefetch(assistants, organization_id)
+        return assistants
+
+    return run_bulk(api.api_client.pool, fetch, organization_ids, max_concurrency)
@@ -0,0 +1,287 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import base64
+import collections
+import gzip
+import hashlib
+import io
+import json
+import threading
+import time
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import urllib3
+from urllib3._collections import HTTPHeaderDict
+
+from openapi_client.exceptions import ApiException
+from openapi_client.rest import RESTClientObject, RESTResponse
+from openapi_client.sansio import match_operation
+from openapi_client.transport import Transport, encode_body
+
+CASSETTE_VERSION = 1
+
+# never written to a cassette, which may be shared or committed
+REDACTED_HEADERS = frozenset((
+    'authorization', 'cookie', 'proxy-authorization', 'set-cookie',
+))
+
+# operations whose response bodies carry secret values
+SECRET_OPERATIONS = frozenset(('sync_secrets',))
+
+# dropped along with a redacted body, which they no longer describe
+_BODY_HEADERS = frozenset(('content-encoding', 'content-length'))
+
+
+class Interaction(NamedTuple):
+    """One recorded request and its response.
+
+    `body` holds the response body as received on the wire, before any
+    `Content-Encoding` is decoded, so replay is byte-exact. `latency` is
+    the time from sending the request to reading the whole body.
+    """
+
+    method: str
+    url: str
+    request_headers: Dict[str, str]
+    request_body: Optional[bytes]
+    status: int
+    reason: Optional[str]
+    headers: List[Tuple[str, str]]
+    body: bytes
+    latency: float
+
+    @property
+    def key(self) -> Tuple[str, str, Optional[str]]:
+        return _match_key(self.method, self.url, self.request_body)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'method': self.method,
+            'url': self.url,
+            'request_headers': self.request_headers,
+            'request_body': _b64(self.request_body),
+            'status': self.status,
+            'reason': self.reason,
+            'headers': [list(header) for header in self.headers],
+            'body': _b64(self.body),
+            'latency': round(self.latency, 6),
+        }
+
+    @classmethod
+    def from_dict(cls, obj: Dict[str, Any]) -> "Interaction":
+        return cls(
+            method=obj['method'],
+            url=obj['url'],
+            request_headers=obj.get('request_headers') or {},
+            request_body=_unb64(obj.get('request_body')),
+            status=obj['status'],
+            reason=obj.get('reason'),
+            headers=[(name, value) for name, value in obj.get('headers') or []],
+            body=_unb64(obj.get('body')) or b'',
+            latency=obj.get('latency') or 0.0,
+        )
+
+    def to_response(self) -> RESTResponse:
+        """Returns a fresh response serving the recorded body."""
+        return RESTResponse(urllib3.HTTPResponse(
+            body=io.BytesIO(self.body),
+            headers=HTTPHeaderDict(self.headers),
+            status=self.status,
+            reason=self.reason,
+            preload_content=False,
+            decode_content=True,
+        ))
+
+
+def _b64(data: Optional[bytes]) -> Optional[str]:
+    return None if data is None else base64.b64encode(data).decode('ascii')
+
+
+def _unb64(data: Optional[str]) -> Optional[bytes]:
+    return None if data is None else base64.b64decode(data)
+
+
+def _match_key(method: str, url: str, body: Optional[bytes]) -> Tuple[str, str, Optional[str]]:
+    digest = None if body is None else hashlib.sha256(body).hexdigest()
+    return method.upper(), url, digest
+
+
+def _redact_headers(headers: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    return [(name, value) for name, value in headers if name.lower() not in REDACTED_HEADERS]
+
+
+def _request_body(
+    method: str, headers: Dict[str, str], body: Any, post_params: Any
+) -> Optional[bytes]:
+    """The encoded request body, or None for multipart bodies whose random
+    boundary would never match again."""
+    if (headers.get('Content-Type') or '').startswith('multipart/'):
+        return None
+    return encode_body(method, dict(headers), body, post_params)
+
+
+class Cassette:
+    """Recorded interactions, stored as gzipped JSON lines.
+
+    The first line holds the format version; every other line is one
+    Interaction with base64-encoded bodies.
+
+    :param interactions: The interactions, in the order they were recorded.
+    """
+
+    def __init__(self, interactions: Iterable[Interaction] = ()) -> None:
+        self.interactions: List[Interaction] = list(interactions)
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header.get('version') != CASSETTE_VERSION:
+                raise ValueError(
+                    "Unsupported cassette version {0}".format(header.get('version'))
+                )
+            return cls(Interaction.from_dict(json.loads(line)) for line in f if line.strip())
+
+    def save(self, path: str) -> None:
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps({'version': CASSETTE_VERSION}) + '\n')
+            for interaction in self.interactions:
+                f.write(json.dumps(interaction.to_dict(), separators=(',', ':')) + '\n')
+
+
+class RecordingTransport:
+    """Sends requests through another transport and records them.
+
+    Responses are read in full before they are returned, so the recorded
+    latency covers the body. Request and response headers in
+    `REDACTED_HEADERS` are not recorded, nor are the response bodies of
+    `SECRET_OPERATIONS` unless `redact_bodies` says otherwise. The
+    cassette is written by `save()` or `close()`.
+
+    :param path: File the cassette is saved to.
+    :param transport: Transport that sends the requests; a
+      `RESTClientObject` for `configuration` by default.
+    :param configuration: Configuration of the default transport.
+    :param redact_bodies: Operation ids whose response bodies are
+      recorded as empty; replaying them serves an empty body. Pass `()`
+      to record the secret values of `SECRET_OPERATIONS` too.
+    """
+
+    def __init__(self, path: str, transport: Optional[Transport] = None,
+                 configuration=None,
+                 redact_bodies: Iterable[str] = SECRET_OPERATIONS) -> None:
+        if transport is None:
+            if configuration is None:
+                raise ValueError("transport or configuration is required")
+            transport = RESTClientObject(configuration)
+        self.path = path
+        self.transport = transport
+        self.redact_bodies = frozenset(redact_bodies)
+        self.cassette = Cassette()
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None, _retries=None) -> RESTResponse:
+        headers = dict(headers or {})
+        request_body = _request_body(method.upper(), headers, body, post_params)
+        options = {} if _retries is None else {'_retries': _retries}
+        start = time.monotonic()
+        response = self.transport.request(
+            method, url, headers=headers, body=body, post_params=post_params,
+            _request_timeout=_request_timeout, **options
+        )
+        try:
+            data = response.response.read(decode_content=False)
+        finally:
+            response.response.release_conn()
+        response_headers = _redact_headers(response.getheaders().items())
+        if self.redact_bodies:
+            spec = match_operation(method, url)
+            if spec is not None and spec.operation_id in self.redact_bodies:
+                data = b''
+                response_headers = [
+                    (name, value) for name, value in response_headers
+                    if name.lower() not in _BODY_HEADERS
+                ]
+        interaction = Interaction(
+            method=method.upper(),
+            url=url,
+            request_headers=dict(_redact_headers(headers.items())),
+            request_body=request_body,
+            status=response.status,
+            reason=response.reason,
+            headers=response_headers,
+            body=data,
+            latency=time.monotonic() - start,
+        )
+        with self._lock:
+            self.cassette.interactions.append(interaction)
+        return interaction.to_response()
+
+    def save(self) -> None:
+        with self._lock:
+            self.cassette.save(self.path)
+
+    def close(self) -> None:
+        """Saves the cassette and closes the wrapped transport."""
+        self.save()
+        close = getattr(self.transport, 'close', None)
+        if close is not None:
+            close()
+
+
+class ReplayTransport:
+    """Serves recorded responses without any I/O.
+
+    Requests are matched on method, URL and body. Repeated requests get
+    their recorded responses in order, starting over once all were served
+    if `repeat` is set.
+
+    :param cassette: Cassette, or the path of one.
+    :param latency_scale: Fraction of the recorded latency to wait before
+      answering; 0 replays at full speed, 1 at recorded latency.
+    :param repeat: Whether to serve recorded responses again once all
+      responses to a request were used.
+    """
+
+    def __init__(self, cassette: Any, latency_scale: float = 0.0, repeat: bool = True) -> None:
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+        self.repeat = repeat
+        self._lock = threading.Lock()
+        self._recorded: Dict[Tuple[str, str, Optional[str]], List[Interaction]] = {}
+        for interaction in cassette.interactions:
+            self._recorded.setdefault(interaction.key, []).append(interaction)
+        self._queues: Dict[Tuple[str, str, Optional[str]], Deque[Interaction]] = {}
+
+    def _next(self, key: Tuple[str, str, Optional[str]]) -> Optional[Interaction]:
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is None or (not queue and self.repeat):
+                queue = self._queues[key] = collections.deque(self._recorded.get(key, ()))
+            return queue.popleft() if queue else None
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None, _retries=None) -> RESTResponse:
+        headers = dict(headers or {})
+        key = _match_key(method, url, _request_body(method.upper(), headers, body, post_params))
+        interaction = self._next(key)
+        if interaction is None:
+            raise ApiException(
+                status=0,
+                reason="No recorded response for {0} {1}".format(method.upper(), url),
+            )
+        if self.latency_scale > 0:
+            time.sleep(interaction.latency * self.latency_scale)
+        return interaction.to_response()
@@ -23,6 +23,8 @@ from typing_extensions import NotRequired, Self
 
 import urllib3
 
+from openapi_client.token_manager import TokenManager
+
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     'multipleOf', 'maximum', 'exclusiveMaximum',
@@ -32,6 +34,11 @@ JSON_SCHEMA_VALIDATION_KEYWORDS = {
 
 ServerVariablesT = Dict[str, str]
 
+AUTH_ATTRIBUTES = frozenset({
+    'api_key', 'api_key_prefix', 'refresh_api_key_hook',
+    'username', 'password', 'access_token', 'token_manager',
+})
+
 GenericAuthSetting = TypedDict(
     "GenericAuthSetting",
     {
@@ -230,6 +237,11 @@ class Configuration:
         self.access_token = access_token
         """Access token
         """
+        self.token_manager: Optional[TokenManager] = None
+        """TokenManager supplying the access token. When set, it takes
+           precedence over `access_token` and keeps the token refreshed in
+           the background instead of inside requests.
+        """
         self.logger = {}
         """Logging Settings
         """
@@ -287,6 +299,15 @@ class Configuration:
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
         """
+        self.connection_pool_block = False
+        """Whether requests wait for a free connection when all
+           `connection_pool_maxsize` connections of a host are in use,
+           instead of opening an extra connection that is closed after use.
+        """
+        self.connection_pool_saturation_warning = False
+        """Log a warning when a request finds no free connection in its
+           pool. See `ApiClient.pool_stats()` for the pool statistics.
+        """
 
         self.proxy: Optional[str] = None
         """Proxy URL
@@ -315,15 +336,41 @@ class Configuration:
         """date format
         """
 
+        self.request_log_sample_rate = 1.0
+        """Fraction of successful requests logged at DEBUG by the
+           `openapi_client.requests` logger. Failed and slow requests are
+           always logged at INFO. Records are only built when that logger
+           is enabled for INFO, so leaving it at WARNING costs nothing.
+        """
+        self.request_log_slow_threshold: Optional[float] = None
+        """Latency in seconds from which a request is logged as slow."""
+
+        self.request_deadline: Optional[float] = None
+        """Total time budget in seconds of a call, across all its attempts
+           and retries. None means no deadline.
+        """
+
+        self.max_response_size: Optional[int] = None
+        """Maximum size in bytes of a response body, after decompression.
+           Larger responses are aborted while they are read and raise
+           ResponseTooLargeException. None means no limit.
+        """
+        self.max_response_size_by_operation: Dict[str, Optional[int]] = {}
+        """Per-operation overrides of `max_response_size`, keyed by
+           operation id, e.g. `{'list_assistants': 50 * 1024 * 1024}`.
+        """
+
     def __deepcopy__(self, memo:  Dict[int, Any]) -> Self:
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler', 'token_manager'):
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
+        # the token manager owns a refresh thread and is shared, not copied
+        result.token_manager = self.token_manager
         # use setters to configure loggers
         result.logger_file = self.logger_file
         result.debug = self.debug
@@ -331,6 +378,23 @@ class Configuration:
 
     def __setattr__(self, name: str, value: Any) -> None:
         object.__setattr__(self, name, value)
+        if name in AUTH_ATTRIBUTES:
+            object.__setattr__(self, '_auth_revision', self.auth_revision + 1)
+
+    @property
+    def auth_revision(self) -> int:
+        """Counter bumped whenever a credential attribute is reassigned.
+
+        API clients use it to know when pre-rendered auth headers are stale.
+        Credentials mutated in place (e.g. `api_key['name'] = ...`) are not
+        noticed; reassign the attribute or call `invalidate_auth` instead.
+        """
+        revision: int = self.__dict__.get('_auth_revision', 0)
+        return revision
+
+    def invalidate_auth(self) -> None:
+        """Marks the credentials as changed, see `auth_revision`."""
+        object.__setattr__(self, '_auth_revision', self.auth_revision + 1)
 
     @classmethod
     def set_default(cls, default: Optional[Self]) -> None:
@@ -492,12 +556,19 @@ class Configuration:
         :return: The Auth Settings information dict.
         """
         auth: AuthSettings = {}
-        if self.access_token is not None:
+        if self.token_manager is not None:
+            # rendered with the manager's own prefix
+            authorization: Optional[str] = self.token_manager.authorization_header
+        elif self.access_token is not None:
+            authorization = 'Bearer ' + self.access_token
+        else:
+            authorization = None
+        if authorization is not None:
             auth['apiKeyAuth'] = {
                 'type': 'bearer',
                 'in': 'header',
                 'key': 'Authorization',
-                'value': 'Bearer ' + self.access_token
+                'value': authorization
             }
         return auth
 
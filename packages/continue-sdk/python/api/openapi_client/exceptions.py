@@ -205,6 +205,51 @@ class UnprocessableEntityException(ApiException):
     pass
 
 
+class RateLimitExceededException(ApiException):
+    """Raised by the client-side RateLimiter when a request would exceed
+    its budget; the request was not sent."""
+
+    def __init__(self, operation_id=None, retry_after=None) -> None:
+        super(RateLimitExceededException, self).__init__(
+            status=429, reason="Client-side rate limit exceeded"
+        )
+        self.operation_id = operation_id
+        self.retry_after = retry_after
+
+    def __str__(self):
+        return "(429)\nReason: {0} for {1}, retry after {2:.3f}s\n".format(
+            self.reason, self.operation_id or "request", self.retry_after or 0.0
+        )
+
+
+class ResponseTooLargeException(ApiException):
+    """Raised when a response body exceeds the configured maximum size.
+
+    The connection is closed as soon as the limit is crossed, so at most
+    about `limit` bytes of the body are ever read.
+    """
+
+    def __init__(self, limit, status=None, headers=None) -> None:
+        super(ResponseTooLargeException, self).__init__(
+            status=status,
+            reason="Response body exceeds {0} bytes".format(limit),
+        )
+        self.limit = limit
+        self.headers = headers
+
+
+class DeadlineExceededException(ApiException):
+    """Raised when the deadline of a call passed before a new attempt
+    could be sent."""
+
+    def __init__(self, deadline) -> None:
+        super(DeadlineExceededException, self).__init__(
+            status=0,
+            reason="Deadline of {0}s exceeded".format(deadline),
+        )
+        self.deadline = deadline
+
+
 def render_path(path_to_item):
     """Returns a string representation of a path"""
     result = ""
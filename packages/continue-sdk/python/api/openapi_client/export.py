@@ -0,0 +1,312 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Streaming export of the assistants of every organization.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.sansio import build_request, fetch_json
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('jsonl', 'jsonl.gz', 'parquet')
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Replaces the file at `path` with `data`, so readers and a crash
+    only ever see the old or the new content."""
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.%s.' % os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ExportResult(NamedTuple):
+    """The outcome of an export run."""
+
+    organizations: int
+    assistants: int
+    skipped: int
+    errors: Dict[Optional[str], BaseException]
+
+
+class _JsonlSink:
+    """Appends the assistants of each organization to one JSONL file.
+
+    With compression, each organization is a separate gzip member, which
+    gzip readers concatenate. After each organization the file is synced
+    and its size returned; resuming truncates the file to that size, so
+    a run interrupted mid-write leaves no partial records behind.
+    """
+
+    def __init__(self, path: str, compress: bool, offset: int) -> None:
+        self.compress = compress
+        self.file = open(path, 'r+b' if offset else 'wb')
+        self.file.truncate(offset)
+        self.file.seek(offset)
+
+    def write(self, organization_id: Optional[str], assistants: List[Dict[str, Any]]) -> int:
+        out: Any = self.file
+        if self.compress:
+            out = gzip.GzipFile(fileobj=self.file, mode='wb', mtime=0)
+        for assistant in assistants:
+            assistant['organizationId'] = organization_id
+            out.write(json.dumps(assistant, separators=(',', ':')).encode('utf-8') + b'\n')
+        if self.compress:
+            out.close()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _parquet_part(directory: str, organization_id: Optional[str]) -> str:
+    name = hashlib.sha256(json.dumps(organization_id).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(directory, 'part-%s.parquet' % name)
+
+
+class _ParquetSink:
+    """Writes the assistants of each organization to its own Parquet file
+    in a directory, which Parquet readers load as one dataset.
+
+    The nested config is stored as a JSON string column. Part files of
+    organizations other than the resumed `done` ones are removed, so
+    parts of an earlier export or of an interrupted write never end up
+    in the dataset.
+    """
+
+    def __init__(self, directory: str, done: Iterable[Optional[str]] = ()) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("pyarrow is required for the parquet export format") from e
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        keep = {os.path.basename(_parquet_part(directory, org)) for org in done}
+        for name in os.listdir(directory):
+            if name.startswith('part-') and name not in keep:
+                try:
+                    os.unlink(os.path.join(directory, name))
+                except OSError:
+                    pass
+        self.schema = pyarrow.schema([
+            ('organization_id', pyarrow.string()),
+            ('owner_slug', pyarrow.string()),
+            ('package_slug', pyarrow.string()),
+            ('icon_url', pyarrow.string()),
+            ('on_prem_proxy_url', pyarrow.string()),
+            ('use_on_prem_proxy', pyarrow.bool_()),
+            ('config_load_interrupted', pyarrow.bool_()),
+            ('config', pyarrow.string()),
+            ('errors', pyarrow.string()),
+            ('raw_yaml', pyarrow.string()),
+        ])
+
+    def write(self, organization_id: Optional[str], assistants: List[Dict[str, Any]]) -> int:
+        rows = []
+        for assistant in assistants:
+            config_result = assistant.get('configResult') or {}
+            rows.append({
+                'organization_id': organization_id,
+                'owner_slug': assistant.get('ownerSlug'),
+                'package_slug': assistant.get('packageSlug'),
+                'icon_url': assistant.get('iconUrl'),
+                'on_prem_proxy_url': assistant.get('onPremProxyUrl'),
+                'use_on_prem_proxy': assistant.get('useOnPremProxy'),
+                'config_load_interrupted': config_result.get('configLoadInterrupted'),
+                'config': json.dumps(config_result.get('config')),
+                'errors': json.dumps(config_result.get('errors')),
+                'raw_yaml': assistant.get('rawYaml'),
+            })
+        path = _parquet_part(self.directory, organization_id)
+        tmp_path = path + '.tmp'
+        self.pq.write_table(self.pa.Table.from_pylist(rows, schema=self.schema), tmp_path)
+        os.replace(tmp_path, path)
+        return 0
+
+    def close(self) -> None:
+        pass
+
+
+class AssistantExporter:
+    """Exports the assistants of every organization to a file.
+
+    Organizations are fetched concurrently, at most `max_concurrency` at a
+    time, and each is written out and dropped as soon as it arrives, so
+    memory is bounded by the organizations in flight. Assistants are
+    written as received from the Hub, without building models, with an
+    added `organizationId` (null for personal assistants).
+
+    Progress is saved to a checkpoint after each organization. A run
+    that finds a checkpoint for the same output resumes, skipping the
+    organizations already exported; the checkpoint is removed once every
+    organization was exported. Organizations that failed are retried by
+    the next run. A checkpoint whose output was removed or truncated
+    since is ignored, and the export starts over.
+
+    :param api: DefaultApi used for the requests.
+    :param path: Output file, or output directory for `parquet`.
+    :param format: One of `FORMATS`; `parquet` requires pyarrow.
+    :param checkpoint_path: Checkpoint file; `path` + `.checkpoint` by
+      default.
+    :param max_concurrency: Upper bound of organizations in flight.
+    :param always_use_proxy: Passed to each `list_assistants` call.
+    :param include_personal: Whether to also export personal assistants.
+    """
+
+    def __init__(
+        self,
+        api: DefaultApi,
+        path: str,
+        format: str = 'jsonl.gz',
+        checkpoint_path: Optional[str] = None,
+        max_concurrency: int = 8,
+        always_use_proxy: Optional[str] = None,
+        include_personal: bool = True,
+    ) -> None:
+        if format not in FORMATS:
+            raise ValueError("format must be one of {0}".format(', '.join(FORMATS)))
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.api = api
+        self.path = path
+        self.format = format
+        self.checkpoint_path = checkpoint_path or path.rstrip('/\\') + '.checkpoint'
+        self.max_concurrency = max_concurrency
+        self.always_use_proxy = always_use_proxy
+        self.include_personal = include_personal
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        try:
+            with open(self.checkpoint_path, 'rb') as f:
+                checkpoint = json.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        if checkpoint.get('path') != self.path or checkpoint.get('format') != self.format:
+            logger.warning("Ignoring checkpoint %s of another export", self.checkpoint_path)
+            return {}
+        if not self._output_intact(checkpoint):
+            logger.warning(
+                "Ignoring checkpoint %s: %s was removed or truncated",
+                self.checkpoint_path, self.path,
+            )
+            return {}
+        return checkpoint
+
+    def _output_intact(self, checkpoint: Dict[str, Any]) -> bool:
+        """Whether the output still holds what `checkpoint` says was
+        exported."""
+        if self.format == 'parquet':
+            return all(
+                os.path.exists(_parquet_part(self.path, org))
+                for org in checkpoint.get('done', [])
+            )
+        try:
+            return os.path.getsize(self.path) >= checkpoint.get('offset', 0)
+        except FileNotFoundError:
+            return False
+
+    def _save_checkpoint(self, done: List[Optional[str]], offset: int) -> None:
+        write_atomic(self.checkpoint_path, json.dumps({
+            'path': self.path,
+            'format': self.format,
+            'offset': offset,
+            'done': done,
+        }).encode('utf-8'))
+
+    def _fetch(self, organization_id: Optional[str]) -> List[Dict[str, Any]]:
+        api_client = self.api.api_client
+        request = build_request(
+            api_client, 'list_assistants',
+            always_use_proxy=self.always_use_proxy, organization_id=organization_id,
+        )
+        return fetch_json(api_client, request)
+
+    def run(self) -> ExportResult:
+        """Exports every organization not exported yet."""
+        checkpoint = self._load_checkpoint()
+        done: List[Optional[str]] = list(checkpoint.get('done', []))
+        offset: int = checkpoint.get('offset', 0)
+        if checkpoint:
+            logger.info("Resuming export to %s after %d organizations", self.path, len(done))
+
+        organization_ids: List[Optional[str]] = [
+            org.id for org in self.api.list_organizations().organizations
+        ]
+        if self.include_personal:
+            organization_ids.insert(0, None)
+        skipped: Set[Optional[str]] = set(done)
+        remaining = [org for org in organization_ids if org not in skipped]
+
+        sink: Any
+        if self.format == 'parquet':
+            sink = _ParquetSink(self.path, done)
+        else:
+            sink = _JsonlSink(self.path, self.format == 'jsonl.gz', offset)
+        pool = self.api.api_client.pool
+        pending: Dict["Future[List[Dict[str, Any]]]", Optional[str]] = {}
+        errors: Dict[Optional[str], BaseException] = {}
+        assistants = 0
+        try:
+            queue = iter(remaining)
+            while True:
+                for organization_id in queue:
+                    pending[pool.submit(self._fetch, organization_id)] = organization_id
+                    if len(pending) >= self.max_concurrency:
+                        break
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    organization_id = pending.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        logger.warning(
+                            "Export of organization %s failed: %s", organization_id, error
+                        )
+                        errors[organization_id] = error
+                        continue
+                    items = future.result()
+                    offset = sink.write(organization_id, items)
+                    assistants += len(items)
+                    done.append(organization_id)
+                    self._save_checkpoint(done, offset)
+        finally:
+            for future in pending:
+                future.cancel()
+            sink.close()
+        if not errors:
+            try:
+                os.unlink(self.checkpoint_path)
+            except FileNotFoundError:
+                pass
+        return ExportResult(len(organization_ids), assistants, len(skipped), errors)
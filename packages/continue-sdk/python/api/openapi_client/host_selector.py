@@ -0,0 +1,186 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import logging
+import threading
+import time
+from typing import Iterable, List, NamedTuple, Optional
+
+import urllib3
+
+logger = logging.getLogger(__name__)
+
+_CONNECT_ERRORS = (
+    urllib3.exceptions.NewConnectionError,
+    urllib3.exceptions.ConnectTimeoutError,
+)
+
+
+def is_connect_error(error: BaseException) -> bool:
+    """Whether `error` means the request never reached the host, so it is
+    safe to send it to another one whatever its method."""
+    if isinstance(error, urllib3.exceptions.MaxRetryError):
+        error = error.reason  # type: ignore[assignment]
+    return isinstance(error, _CONNECT_ERRORS)
+
+
+class HostStatus(NamedTuple):
+    """A snapshot of the health of one host."""
+
+    url: str
+    latency: Optional[float]
+    healthy: bool
+    failures: int
+    in_flight: int
+
+
+class _HostState:
+
+    __slots__ = ('url', 'latency', 'failures', 'down_until', 'in_flight')
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.down_until = 0.0
+        self.in_flight = 0
+
+
+class HostSelector:
+    """Routes requests to the fastest healthy host of a set of equivalent
+    hosts, e.g. several regions or an on-prem proxy and the Hub.
+
+    Each host keeps an exponentially weighted moving average of its
+    latency; requests go to the healthy host with the lowest average,
+    weighted by the requests it already has in flight. Hosts that were
+    never used are tried first so every host gets measured. A host that
+    fails to connect is marked down for `cooldown` seconds, doubling on
+    each consecutive failure up to `max_cooldown`, and the request fails
+    over to the next host. When every host is down the one that has been
+    down longest is tried again.
+
+    Pass it as `ApiClient(host_selector=...)`; URLs built from
+    `configuration.host` are then rewritten to the selected host.
+
+    :param hosts: Base URLs of the hosts, like `configuration.host`.
+    :param alpha: Weight of a new sample in the latency average.
+    :param cooldown: Seconds a host is avoided after a failure.
+    :param max_cooldown: Upper bound of the cooldown.
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str],
+        alpha: float = 0.2,
+        cooldown: float = 5.0,
+        max_cooldown: float = 300.0,
+    ) -> None:
+        self._hosts = [_HostState(url.rstrip('/')) for url in hosts]
+        if not self._hosts:
+            raise ValueError("HostSelector needs at least one host")
+        self._by_url = {host.url: host for host in self._hosts}
+        self.alpha = alpha
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configuration(
+        cls,
+        configuration,
+        indexes: Optional[Iterable[int]] = None,
+        extra_hosts: Iterable[str] = (),
+        **kwargs,
+    ) -> "HostSelector":
+        """Builds a selector from `configuration.get_host_settings()`.
+
+        :param configuration: The Configuration to read the servers from.
+        :param indexes: Indexes of the host settings to use; all of them if
+          None.
+        :param extra_hosts: Additional base URLs, e.g. on-prem proxies.
+        """
+        settings = configuration.get_host_settings()
+        if indexes is None:
+            indexes = range(len(settings))
+        hosts = [
+            configuration.get_host_from_settings(
+                index, variables=configuration.server_variables, servers=settings
+            )
+            for index in indexes
+        ]
+        return cls(hosts + list(extra_hosts), **kwargs)
+
+    @property
+    def hosts(self) -> List[str]:
+        return [host.url for host in self._hosts]
+
+    def status(self) -> List[HostStatus]:
+        """Returns the health of every host."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                HostStatus(host.url, host.latency, host.down_until <= now,
+                           host.failures, host.in_flight)
+                for host in self._hosts
+            ]
+
+    def candidates(self) -> List[str]:
+        """Returns the hosts in the order they should be tried."""
+        now = time.monotonic()
+        with self._lock:
+            healthy = [host for host in self._hosts if host.down_until <= now]
+            down = [host for host in self._hosts if host.down_until > now]
+            healthy.sort(key=self._score)
+            down.sort(key=lambda host: host.down_until)
+            return [host.url for host in healthy + down]
+
+    def select(self) -> str:
+        """Returns the host the next request should go to."""
+        return self.candidates()[0]
+
+    @staticmethod
+    def _score(host: _HostState) -> float:
+        if host.latency is None:
+            return -1.0
+        return host.latency * (1 + host.in_flight)
+
+    def begin(self, url: str) -> None:
+        """Records a request sent to `url`."""
+        with self._lock:
+            self._by_url[url].in_flight += 1
+
+    def record_success(self, url: str, seconds: float) -> None:
+        """Records a response received from `url` after `seconds`."""
+        with self._lock:
+            host = self._by_url[url]
+            host.in_flight = max(host.in_flight - 1, 0)
+            host.failures = 0
+            host.down_until = 0.0
+            if host.latency is None:
+                host.latency = seconds
+            else:
+                host.latency += self.alpha * (seconds - host.latency)
+
+    def record_failure(self, url: str) -> None:
+        """Records a failed request to `url`, marking it down."""
+        with self._lock:
+            host = self._by_url[url]
+            host.in_flight = max(host.in_flight - 1, 0)
+            host.failures += 1
+            cooldown = min(self.cooldown * 2 ** (host.failures - 1), self.max_cooldown)
+            host.down_until = time.monotonic() + cooldown
+        logger.warning("Host %s marked down for %.1fs", url, cooldown)
+
+    def record_abandoned(self, url: str) -> None:
+        """Records a request to `url` that failed for another reason."""
+        with self._lock:
+            host = self._by_url[url]
+            host.in_flight = max(host.in_flight - 1, 0)
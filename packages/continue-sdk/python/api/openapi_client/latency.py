@@ -0,0 +1,246 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import collections
+import copy
+import threading
+import time
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+import urllib3
+
+
+class _Samples:
+    """Recent latencies of one operation and a lazily sorted copy."""
+
+    __slots__ = ('values', 'sorted', 'stale')
+
+    def __init__(self, window: int) -> None:
+        self.values: Deque[float] = collections.deque(maxlen=window)
+        self.sorted: List[float] = []
+        self.stale = 0
+
+
+class LatencyTracker:
+    """Percentiles of the recent latencies of each operation.
+
+    Keeps the last `window` samples per operation. Percentiles are read
+    from a sorted copy that is only rebuilt after `window // 8` new
+    samples, so reading them on every request is cheap.
+
+    :param window: Number of samples kept per operation.
+    :param min_samples: Samples needed before percentiles are reported.
+    """
+
+    def __init__(self, window: int = 256, min_samples: int = 20) -> None:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.min_samples = min_samples
+        self._resort_after = max(window // 8, 1)
+        self._lock = threading.Lock()
+        self._samples: Dict[Optional[str], _Samples] = {}
+
+    def record(self, operation_id: Optional[str], seconds: float) -> None:
+        """Adds the latency of a completed request."""
+        with self._lock:
+            samples = self._samples.get(operation_id)
+            if samples is None:
+                samples = self._samples[operation_id] = _Samples(self.window)
+            samples.values.append(seconds)
+            samples.stale += 1
+
+    def percentile(self, operation_id: Optional[str], percentile: float) -> Optional[float]:
+        """Returns the given percentile (0-100) of the recent latencies of
+        an operation, or None while there are fewer than `min_samples`."""
+        with self._lock:
+            samples = self._samples.get(operation_id)
+            if samples is None or len(samples.values) < max(self.min_samples, 1):
+                return None
+            if samples.stale >= self._resort_after or not samples.sorted:
+                samples.sorted = sorted(samples.values)
+                samples.stale = 0
+            ordered = samples.sorted
+        index = int(round(percentile / 100.0 * (len(ordered) - 1)))
+        return ordered[min(max(index, 0), len(ordered) - 1)]
+
+    def count(self, operation_id: Optional[str]) -> int:
+        """Returns the number of samples kept for an operation."""
+        samples = self._samples.get(operation_id)
+        return len(samples.values) if samples is not None else 0
+
+    def reset(self, operation_id: Optional[str] = None) -> None:
+        """Forgets the samples of one operation, or of all of them."""
+        with self._lock:
+            if operation_id is None:
+                self._samples.clear()
+            else:
+                self._samples.pop(operation_id, None)
+
+
+class HedgingPolicy:
+    """When and how often `ApiClient` may hedge a request.
+
+    A `GET` that has not answered after the `percentile` latency of its
+    operation is sent a second time; the first answer is used and the
+    other is discarded. Until an operation has enough samples no hedge is
+    sent, unless `default_delay` is set.
+
+    Hedges are paid for from a budget that grows by `max_extra_load` for
+    every request and holds at most `burst` hedges, so hedging adds at
+    most that fraction of extra requests even when the Hub is slow for
+    everyone.
+
+    :param percentile: Latency percentile after which a hedge is sent.
+    :param min_delay: Lower bound of the hedging delay, in seconds.
+    :param max_delay: Upper bound of the hedging delay, in seconds.
+    :param default_delay: Delay used before an operation has enough
+      samples; None disables hedging until then.
+    :param max_extra_load: Hedges allowed per request, e.g. 0.05 for 5%.
+    :param burst: Maximum number of hedges saved up in the budget.
+    :param operations: Operation ids that may be hedged; all `GET`
+      operations if None.
+    :param tracker: LatencyTracker the delays are derived from.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.005,
+        max_delay: Optional[float] = None,
+        default_delay: Optional[float] = None,
+        max_extra_load: float = 0.05,
+        burst: float = 10.0,
+        operations: Optional[Iterable[str]] = None,
+        tracker: Optional[LatencyTracker] = None,
+    ) -> None:
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.default_delay = default_delay
+        self.max_extra_load = max_extra_load
+        self.burst = burst
+        self.operations = frozenset(operations) if operations is not None else None
+        self.tracker = tracker if tracker is not None else LatencyTracker()
+        self._lock = threading.Lock()
+        self._budget = 0.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def delay(self, operation_id: Optional[str]) -> Optional[float]:
+        """Returns how long to wait before hedging a request, or None if
+        it must not be hedged."""
+        if operation_id is None or (
+            self.operations is not None and operation_id not in self.operations
+        ):
+            return None
+        delay = self.tracker.percentile(operation_id, self.percentile)
+        if delay is None:
+            delay = self.default_delay
+            if delay is None:
+                return None
+        delay = max(delay, self.min_delay)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+    def on_request(self) -> None:
+        """Credits the budget for a request about to be sent."""
+        with self._lock:
+            self.requests += 1
+            self._budget = min(self._budget + self.max_extra_load, self.burst)
+
+    def try_hedge(self) -> bool:
+        """Takes a hedge from the budget, if one is available."""
+        with self._lock:
+            if self._budget < 1.0:
+                return False
+            self._budget -= 1.0
+            self.hedges += 1
+            return True
+
+    def hedge_won(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+
+class AdaptiveTimeout:
+    """Read timeouts derived from the observed latency of each operation.
+
+    The read timeout of a request is `multiplier` times the `percentile`
+    latency of its operation, clamped to `[min_timeout, max_timeout]`.
+    Healthy but slow operations, such as `list_assistants` for a large
+    organization, learn a long timeout while fast ones fail quickly on a
+    dead connection. Until an operation has enough samples `max_timeout`
+    is used.
+
+    Pass it as `ApiClient(adaptive_timeout=...)`. It applies to requests
+    without an explicit `_request_timeout`.
+
+    :param percentile: Latency percentile the timeout is based on.
+    :param multiplier: Factor applied to that percentile.
+    :param min_timeout: Lower bound of the read timeout, in seconds.
+    :param max_timeout: Upper bound of the read timeout, in seconds.
+    :param connect_timeout: Timeout for establishing connections.
+    :param tracker: LatencyTracker the timeouts are derived from.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 99.0,
+        multiplier: float = 3.0,
+        min_timeout: float = 1.0,
+        max_timeout: float = 60.0,
+        connect_timeout: Optional[float] = 5.0,
+        tracker: Optional[LatencyTracker] = None,
+    ) -> None:
+        if min_timeout > max_timeout:
+            raise ValueError("min_timeout must not exceed max_timeout")
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.connect_timeout = connect_timeout
+        self.tracker = tracker if tracker is not None else LatencyTracker()
+
+    def read_timeout(self, operation_id: Optional[str]) -> float:
+        """Returns the read timeout for a request of an operation."""
+        latency = self.tracker.percentile(operation_id, self.percentile)
+        if latency is None:
+            return self.max_timeout
+        return min(max(latency * self.multiplier, self.min_timeout), self.max_timeout)
+
+
+class DeadlineRetry(urllib3.Retry):
+    """A urllib3 Retry that gives up once a deadline has passed, so retries
+    made inside urllib3 stay within the budget of the call."""
+
+    deadline: Optional[float] = None
+
+    @classmethod
+    def wrap(cls, retries: Any, deadline: float) -> "DeadlineRetry":
+        """Returns `retries` (a Retry, an int or None for the urllib3
+        default) bounded by `deadline`, a `time.monotonic()` timestamp."""
+        retry = copy.copy(urllib3.Retry.from_int(retries))
+        retry.__class__ = cls
+        retry.deadline = deadline  # type: ignore[attr-defined]
+        return retry  # type: ignore[return-value]
+
+    def new(self, **kw: Any) -> "DeadlineRetry":
+        retry = super().new(**kw)
+        retry.deadline = self.deadline
+        return retry
+
+    def is_exhausted(self) -> bool:
+        return super().is_exhausted() or (
+            self.deadline is not None and time.monotonic() >= self.deadline
+        )
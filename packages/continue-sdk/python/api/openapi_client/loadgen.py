@@ -0,0 +1,340 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Load generator for the DefaultApi operations.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import argparse
+import collections
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Counter, Dict, Optional, Sequence, Tuple
+
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import ApiException
+from openapi_client.sansio import OPERATIONS, RequestDescriptor, build_request, execute
+
+
+class LatencyHistogram:
+    """A log-linear histogram of latencies, in the manner of HdrHistogram.
+
+    Values are kept in microseconds with a relative precision of
+    `2 ** (1 - precision_bits)` (under 1% by default) over any range, in a
+    number of buckets that only grows with the logarithm of the range.
+
+    :param precision_bits: Bits of precision kept for each value.
+    """
+
+    def __init__(self, precision_bits: int = 8) -> None:
+        self.precision_bits = precision_bits
+        self._counts: Counter[int] = collections.Counter()
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _bucket(self, value: int) -> int:
+        shift = max(value.bit_length() - self.precision_bits, 0)
+        # the lowest value of the bucket, so each bucket has one key
+        return (value >> shift) << shift
+
+    def record(self, seconds: float) -> None:
+        value = max(int(seconds * 1e6), 0)
+        with self._lock:
+            self._counts[self._bucket(value)] += 1
+            self.count += 1
+            self.total += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        with self._lock:
+            self._counts.update(other._counts)
+            self.count += other.count
+            self.total += other.total
+            for value in (other.min, other.max):
+                if value is not None:
+                    self.min = value if self.min is None else min(self.min, value)
+                    self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Returns the given percentile (0-100) in seconds, or None if no
+        value was recorded."""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(percentile / 100.0 * self.count, 1)
+            seen = 0
+            for bucket in sorted(self._counts):
+                seen += self._counts[bucket]
+                if seen >= rank:
+                    # report the end of the bucket, never beyond the maximum
+                    shift = max(bucket.bit_length() - self.precision_bits, 0)
+                    return min(bucket + (1 << shift) - 1, self.max or 0) / 1e6
+            return (self.max or 0) / 1e6
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count / 1e6 if self.count else None
+
+
+class LoadReport:
+    """The outcome of a load run.
+
+    Latencies of open-loop runs are measured from the time each request
+    was scheduled, so time spent waiting for a free worker counts.
+    """
+
+    PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+    def __init__(self, operation_id: str, target_rate: Optional[float],
+                 concurrency: Optional[int]) -> None:
+        self.operation_id = operation_id
+        self.target_rate = target_rate
+        self.concurrency = concurrency
+        self.latency = LatencyHistogram()
+        self.statuses: Counter[int] = collections.Counter()
+        self.errors: Counter[str] = collections.Counter()
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def requests(self) -> int:
+        return self.latency.count
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def record(self, seconds: float, status: Optional[int],
+               error: Optional[BaseException]) -> None:
+        self.latency.record(seconds)
+        with self._lock:
+            if status is not None:
+                self.statuses[status] += 1
+            if error is not None:
+                self.errors[type(error).__name__] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'operation_id': self.operation_id,
+            'target_rate': self.target_rate,
+            'concurrency': self.concurrency,
+            'requests': self.requests,
+            'elapsed': round(self.elapsed, 3),
+            'throughput': round(self.throughput, 3),
+            'latency_ms': {
+                'min': None if self.latency.min is None else self.latency.min / 1e3,
+                'mean': _ms(self.latency.mean),
+                'max': None if self.latency.max is None else self.latency.max / 1e3,
+                **{
+                    'p%g' % p: _ms(self.latency.percentile(p))
+                    for p in self.PERCENTILES
+                },
+            },
+            'statuses': {str(status): n for status, n in sorted(self.statuses.items())},
+            'errors': dict(self.errors.most_common()),
+        }
+
+    def __str__(self) -> str:
+        report = self.as_dict()
+        lines = [
+            "%s: %d requests in %.2f s, %.1f req/s%s" % (
+                self.operation_id, self.requests, self.elapsed, self.throughput,
+                " (target %g req/s)" % self.target_rate if self.target_rate else "",
+            ),
+            "latency ms: " + "  ".join(
+                "%s=%s" % (name, "-" if value is None else "%.2f" % value)
+                for name, value in report['latency_ms'].items()
+            ),
+            "statuses: " + (", ".join(
+                "%s=%d" % item for item in report['statuses'].items()
+            ) or "-"),
+        ]
+        for name, n in self.errors.most_common():
+            lines.append("  %-36s %d" % (name, n))
+        return "\n".join(lines)
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1e3, 3)
+
+
+def _send(api_client: ApiClient, request: RequestDescriptor, report: LoadReport,
+          start: float, timeout: Optional[float]) -> None:
+    status: Optional[int] = None
+    error: Optional[BaseException] = None
+    try:
+        status = execute(api_client, request, timeout).status_code
+    except ApiException as e:
+        status, error = e.status or None, e
+    except Exception as e:
+        error = e
+    report.record(time.monotonic() - start, status, error)
+
+
+def run_load(
+    api_client: ApiClient,
+    request: RequestDescriptor,
+    rate: Optional[float] = None,
+    concurrency: Optional[int] = None,
+    duration: Optional[float] = None,
+    total: Optional[int] = None,
+    workers: int = 64,
+    timeout: Optional[float] = None,
+) -> LoadReport:
+    """Sends `request` repeatedly and measures the responses.
+
+    With `rate`, requests are started on a fixed schedule whatever the
+    latency of earlier ones (open loop), so a slow server cannot hide its
+    queueing delay by slowing the load down. With `concurrency`,
+    that many workers each send a request as soon as the previous one
+    completes (closed loop).
+
+    :param rate: Requests per second to start.
+    :param concurrency: Number of requests kept in flight.
+    :param duration: Seconds to run for.
+    :param total: Number of requests to send.
+    :param workers: Threads available to an open-loop run.
+    :param timeout: Timeout of each request, in seconds.
+    :return: LoadReport
+    """
+    if (rate is None) == (concurrency is None):
+        raise ValueError("exactly one of rate and concurrency is required")
+    if duration is None and total is None:
+        raise ValueError("duration or total is required")
+    report = LoadReport(request.operation_id, rate, concurrency)
+    start = time.monotonic()
+    end = None if duration is None else start + duration
+
+    if rate is not None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with ThreadPoolExecutor(workers, thread_name_prefix='openapi-client-loadgen') as pool:
+            index = 0
+            while total is None or index < total:
+                scheduled = start + index / rate
+                if end is not None and scheduled >= end:
+                    break
+                delay = scheduled - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(_send, api_client, request, report, scheduled, timeout)
+                index += 1
+    else:
+        assert concurrency is not None
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        remaining = [total]
+        lock = threading.Lock()
+
+        def worker() -> None:
+            while end is None or time.monotonic() < end:
+                with lock:
+                    if remaining[0] is not None:
+                        if remaining[0] <= 0:
+                            return
+                        remaining[0] -= 1
+                _send(api_client, request, report, time.monotonic(), timeout)
+
+        threads = [
+            threading.Thread(target=worker, name='openapi-client-loadgen-%d' % i)
+            for i in range(concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    report.elapsed = time.monotonic() - start
+    return report
+
+
+def _parse_param(value: str) -> Tuple[str, Any]:
+    name, sep, raw = value.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError("expected name=value, got %r" % value)
+    try:
+        return name, json.loads(raw)
+    except ValueError:
+        return name, raw
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    configuration = Configuration()
+    hosts = configuration.get_host_settings()
+    parser = argparse.ArgumentParser(
+        prog='openapi-client-loadgen',
+        description="Drives a Continue Hub IDE API operation at a target rate "
+                    "or concurrency and reports latency percentiles.",
+    )
+    parser.add_argument('operation', choices=sorted(OPERATIONS))
+    parser.add_argument(
+        '-p', '--param', action='append', type=_parse_param, default=[],
+        metavar='NAME=VALUE',
+        help="operation parameter; VALUE is parsed as JSON when possible",
+    )
+    target = parser.add_argument_group('target')
+    target.add_argument(
+        '--host-index', type=int, default=len(hosts) - 1,
+        help="index of the server to use: " + ", ".join(
+            "%d = %s (%s)" % (i, host['url'], host['description'])
+            for i, host in enumerate(hosts)
+        ) + " (default: %(default)s)",
+    )
+    target.add_argument('--host', help="base URL, instead of --host-index")
+    target.add_argument(
+        '--access-token', default=os.environ.get('CONTINUE_API_KEY'),
+        help="bearer token (default: $CONTINUE_API_KEY)",
+    )
+    target.add_argument('--timeout', type=float, default=30.0, help="request timeout in seconds")
+    load = parser.add_argument_group('load')
+    mode = load.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--rate', type=float, help="requests per second (open loop)")
+    mode.add_argument('--concurrency', type=int, help="requests in flight (closed loop)")
+    load.add_argument('--duration', type=float, help="seconds to run (default: 10)")
+    load.add_argument('--requests', type=int, help="number of requests to send")
+    load.add_argument('--workers', type=int, default=64, help="threads of an open-loop run")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.host:
+        configuration.host = args.host.rstrip('/')
+    else:
+        configuration.server_index = args.host_index
+    configuration.access_token = args.access_token
+    configuration.connection_pool_maxsize = args.concurrency or args.workers
+
+    api_client = ApiClient(configuration)
+    try:
+        request = build_request(api_client, args.operation, **dict(args.param))
+        report = run_load(
+            api_client,
+            request,
+            rate=args.rate,
+            concurrency=args.concurrency,
+            duration=args.duration if args.duration or args.requests else 10.0,
+            total=args.requests,
+            workers=args.workers,
+            timeout=args.timeout,
+        )
+    except (TypeError, ValueError) as e:
+        parser.error(str(e))
+    finally:
+        api_client.close()
+    print(json.dumps(report.as_dict(), indent=2) if args.json else report)
+    return 1 if report.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
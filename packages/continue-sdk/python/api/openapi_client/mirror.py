@@ -0,0 +1,203 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Incremental on-disk mirror of the rawYaml of assistants.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.bulk import run_bulk
+from openapi_client.export import write_atomic
+from openapi_client.sansio import build_request, fetch_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = '.manifest.json'
+
+
+class MirrorResult(NamedTuple):
+    """The outcome of a mirror sync."""
+
+    written: List[str]
+    unchanged: int
+    deleted: List[str]
+    errors: Dict[Optional[str], BaseException]
+
+
+class ManifestEntry(NamedTuple):
+    """What the manifest knows about a mirrored file."""
+
+    sha256: str
+    organization_id: Optional[str]
+
+
+def _safe_slug(slug: Any) -> bool:
+    return (
+        isinstance(slug, str) and slug not in ('', '.', '..')
+        and '/' not in slug and '\\' not in slug and '\0' not in slug
+    )
+
+
+class AssistantMirror:
+    """Keeps a directory in sync with the `rawYaml` of assistants.
+
+    Each assistant is mirrored to `<ownerSlug>/<packageSlug>.yaml`. A
+    manifest maps every file to the SHA-256 of its content, so a sync only
+    writes assistants whose content changed, without reading or parsing
+    the files on disk, and deletes the files of assistants that are gone.
+    Files are written atomically and in parallel. Files of organizations
+    that failed to list are left untouched.
+
+    :param api: DefaultApi used for the requests.
+    :param directory: The mirror directory.
+    :param organization_ids: Organizations to mirror, None for personal
+      assistants; every organization and the personal assistants if not
+      given. A sync of a subset leaves the files of other organizations
+      in the mirror alone.
+    :param max_workers: Threads used to list organizations and to write.
+    :param always_use_proxy: Passed to each `list_assistants` call.
+    """
+
+    def __init__(
+        self,
+        api: DefaultApi,
+        directory: str,
+        organization_ids: Optional[Iterable[Optional[str]]] = None,
+        max_workers: int = 8,
+        always_use_proxy: Optional[str] = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.api = api
+        self.directory = directory
+        self.organization_ids = None if organization_ids is None else list(organization_ids)
+        self.max_workers = max_workers
+        self.always_use_proxy = always_use_proxy
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+
+    def load_manifest(self) -> Dict[str, ManifestEntry]:
+        try:
+            with open(self.manifest_path, 'rb') as f:
+                files = json.loads(f.read()).get('files', {})
+        except FileNotFoundError:
+            return {}
+        return {
+            path: ManifestEntry(entry['sha256'], entry.get('organizationId'))
+            for path, entry in files.items()
+        }
+
+    def _save_manifest(self, manifest: Dict[str, ManifestEntry]) -> None:
+        write_atomic(self.manifest_path, json.dumps({
+            'files': {
+                path: {'sha256': entry.sha256, 'organizationId': entry.organization_id}
+                for path, entry in sorted(manifest.items())
+            },
+        }, indent=1).encode('utf-8'))
+
+    def _list(self, organization_id: Optional[str]) -> List[Dict[str, Any]]:
+        api_client = self.api.api_client
+        return fetch_json(api_client, build_request(
+            api_client, 'list_assistants',
+            always_use_proxy=self.always_use_proxy, organization_id=organization_id,
+        ))
+
+    def _write(self, path: str, data: bytes) -> None:
+        target = os.path.join(self.directory, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        write_atomic(target, data)
+
+    def _delete(self, path: str) -> None:
+        target = os.path.join(self.directory, path)
+        try:
+            os.unlink(target)
+        except FileNotFoundError:
+            pass
+        try:
+            os.rmdir(os.path.dirname(target))
+        except OSError:
+            pass  # not empty
+
+    def sync(self) -> MirrorResult:
+        """Brings the mirror up to date with the Hub."""
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = self.load_manifest()
+        organization_ids = self.organization_ids
+        if organization_ids is None:
+            organization_ids = [None] + [
+                org.id for org in self.api.list_organizations().organizations
+            ]
+        with ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix='openapi-client-mirror'
+        ) as pool:
+            listed = run_bulk(pool, self._list, organization_ids, self.max_workers)
+            errors = listed.errors
+
+            wanted: Dict[str, Tuple[bytes, ManifestEntry]] = {}
+            for item in listed:
+                if not item.ok:
+                    continue
+                for assistant in item.value:
+                    raw_yaml = assistant.get('rawYaml')
+                    owner, package = assistant.get('ownerSlug'), assistant.get('packageSlug')
+                    if raw_yaml is None:
+                        continue
+                    if not (_safe_slug(owner) and _safe_slug(package)):
+                        logger.warning(
+                            "Not mirroring assistant %r/%r: unsafe slug", owner, package
+                        )
+                        continue
+                    path = '%s/%s.yaml' % (owner, package)
+                    if path in wanted:
+                        continue
+                    data = raw_yaml.encode('utf-8')
+                    entry = ManifestEntry(hashlib.sha256(data).hexdigest(), item.key)
+                    wanted[path] = (data, entry)
+
+            changed = [
+                path for path, (_, entry) in wanted.items()
+                if path not in manifest or manifest[path].sha256 != entry.sha256
+                or not os.path.exists(os.path.join(self.directory, path))
+            ]
+            # files of organizations that failed are kept until they list
+            # again, and a subset only deletes files of its own organizations
+            synced = {item.key for item in listed if item.ok}
+            removed = [
+                path for path, entry in manifest.items()
+                if path not in wanted and entry.organization_id not in errors
+                and (self.organization_ids is None or entry.organization_id in synced)
+            ]
+            written = run_bulk(
+                pool, lambda path: self._write(path, wanted[path][0]), changed, self.max_workers
+            )
+            deleted = run_bulk(pool, self._delete, removed, self.max_workers)
+
+        for item in written:
+            if item.ok:
+                manifest[item.key] = wanted[item.key][1]
+            else:
+                logger.warning("Failed to write %s: %s", item.key, item.error)
+                manifest.pop(item.key, None)
+        for path, (_, entry) in wanted.items():
+            if path in manifest:
+                manifest[path] = entry
+        for item in deleted:
+            if item.ok:
+                manifest.pop(item.key, None)
+        self._save_manifest(manifest)
+        return MirrorResult(
+            written=[item.key for item in written if item.ok],
+            unchanged=len(wanted) - len(changed),
+            deleted=[item.key for item in deleted if item.ok],
+            errors=errors,
+        )
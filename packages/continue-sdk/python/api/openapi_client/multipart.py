@@ -0,0 +1,158 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import binascii
+import json
+import mmap
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from urllib3.fields import format_multipart_header_param
+except ImportError:  # urllib3 < 2, where the same encoding has this name
+    from urllib3.fields import format_header_param_html5 as format_multipart_header_param
+
+CHUNK_SIZE = 64 * 1024
+
+_BYTES_LIKE = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+class FileSource:
+    """A file on disk, opened only while its part of a body is sent.
+
+    :param path: Path of the file.
+    """
+
+    __slots__ = ('path',)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
+    def chunks(self, chunk_size: int) -> Iterator[bytes]:
+        with open(self.path, 'rb') as f:
+            yield from iter(lambda: f.read(chunk_size), b'')
+
+
+def _fileobj_size(fileobj, start: Optional[int]) -> Optional[int]:
+    """Returns the bytes of a seekable file object from `start`, or None."""
+    if start is None:
+        return None
+    try:
+        position = fileobj.tell()
+        end = fileobj.seek(0, os.SEEK_END)
+        fileobj.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return end - start
+
+
+class MultipartEncoder:
+    """A `multipart/form-data` body produced chunk by chunk.
+
+    Unlike urllib3's `encode_multipart_formdata`, file contents are never
+    held in memory as a whole: `FileSource` parts are read from disk,
+    file objects are read from their current position, and bytes-like
+    values (including `mmap` objects) are copied one chunk at a time.
+    The encoder is an iterable of bytes that urllib3 sends as the request
+    body; iterating it again produces the same body, so a request can be
+    retried. Field names and filenames are escaped as urllib3 does.
+
+    :param fields: Sequence of `(name, value)` where value is a str or
+      bytes, or a `(filename, data, mimetype)` tuple whose data is
+      bytes-like, a `FileSource` or a binary file object.
+    :param boundary: The multipart boundary; random if not given.
+    :param chunk_size: Size of the chunks read from files.
+    """
+
+    def __init__(
+        self,
+        fields: List[Tuple[str, Any]],
+        boundary: Optional[str] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode('ascii')
+        self.chunk_size = chunk_size
+        self._parts: List[Tuple[bytes, Any]] = []
+        self._positions: Dict[int, int] = {}
+        for name, value in fields:
+            if isinstance(value, tuple):
+                filename, data, mimetype = value
+                header = (
+                    'Content-Disposition: form-data; %s; %s\r\n'
+                    'Content-Type: %s\r\n\r\n' % (
+                        format_multipart_header_param('name', name),
+                        format_multipart_header_param('filename', filename),
+                        mimetype or 'application/octet-stream',
+                    )
+                )
+            else:
+                data = value
+                if isinstance(data, dict):
+                    data = json.dumps(data)
+                header = 'Content-Disposition: form-data; %s\r\n\r\n' % (
+                    format_multipart_header_param('name', name)
+                )
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            elif not isinstance(data, _BYTES_LIKE) and not isinstance(data, FileSource):
+                if not hasattr(data, 'read'):
+                    data = str(data).encode('utf-8')
+                else:
+                    try:
+                        self._positions[id(data)] = data.tell()
+                    except (AttributeError, OSError, ValueError):
+                        pass
+            prefix = ('--%s\r\n' % self.boundary + header).encode('utf-8')
+            self._parts.append((prefix, data))
+        self._trailer = ('--%s--\r\n' % self.boundary).encode('ascii')
+
+    @property
+    def content_type(self) -> str:
+        return 'multipart/form-data; boundary=%s' % self.boundary
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Length of the body, or None if a file object has no known size."""
+        length = len(self._trailer)
+        for prefix, data in self._parts:
+            if isinstance(data, FileSource):
+                size: Optional[int] = data.size
+            elif isinstance(data, _BYTES_LIKE):
+                size = len(data)
+            else:
+                size = _fileobj_size(data, self._positions.get(id(data)))
+            if size is None:
+                return None
+            length += len(prefix) + size + 2
+        return length
+
+    def __iter__(self) -> Iterator[bytes]:
+        chunk_size = self.chunk_size
+        for prefix, data in self._parts:
+            yield prefix
+            if isinstance(data, FileSource):
+                yield from data.chunks(chunk_size)
+            elif isinstance(data, _BYTES_LIKE):
+                view = memoryview(data)
+                for start in range(0, len(view), chunk_size):
+                    yield bytes(view[start:start + chunk_size])
+            else:
+                position = self._positions.get(id(data))
+                if position is not None:
+                    data.seek(position)
+                for chunk in iter(lambda: data.read(chunk_size), b''):
+                    yield chunk
+            yield b'\r\n'
+        yield self._trailer
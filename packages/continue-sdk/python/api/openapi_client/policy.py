@@ -0,0 +1,91 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Compiled evaluation of organization policies.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import collections
+import hashlib
+import json
+import threading
+from typing import Any, Mapping, Optional
+
+from openapi_client.api.default_api import DefaultApi
+
+
+def policy_hash(policy: Optional[Mapping[str, Any]]) -> str:
+    """Returns the SHA-256 of the canonical JSON of a policy."""
+    return hashlib.sha256(
+        json.dumps(policy, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    ).hexdigest()
+
+
+class CompiledPolicy:
+    """An organization policy, compiled for fast checks.
+
+    Reads the flags of the Hub's policy schema: `allowAnonymousTelemetry`,
+    `allowOtherOrgs`, `allowCodebaseIndexing` and `allowMcpServers`, all
+    true when absent. Other keys are ignored.
+
+    :param policy: The `policy` of a `GetPolicy200Response`; None for no
+      policy, which allows everything.
+    """
+
+    def __init__(self, policy: Optional[Mapping[str, Any]]) -> None:
+        policy = policy or {}
+        self.hash = policy_hash(policy)
+        self.allow_anonymous_telemetry = policy.get('allowAnonymousTelemetry') is not False
+        self.allow_other_orgs = policy.get('allowOtherOrgs') is not False
+        self.allow_codebase_indexing = policy.get('allowCodebaseIndexing') is not False
+        self.allow_mcp_servers = policy.get('allowMcpServers') is not False
+
+
+class PolicyEvaluator:
+    """Compiles policies and keeps the compiled forms by content hash.
+
+    A policy is only compiled again when its content changes, so calling
+    `fetch()` on every request costs one `get_policy` call (or a cache hit
+    with a response cache) and a hash of the policy.
+
+    :param api: DefaultApi used by `fetch()`.
+    :param max_cached: Number of compiled policies kept.
+    """
+
+    def __init__(self, api: Optional[DefaultApi] = None, max_cached: int = 16) -> None:
+        self.api = api
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._compiled: "collections.OrderedDict[str, CompiledPolicy]" = collections.OrderedDict()
+        self.compilations = 0
+
+    def compile(self, policy: Optional[Mapping[str, Any]]) -> CompiledPolicy:
+        """Returns the compiled form of a policy, from the cache if its
+        content was compiled before."""
+        key = policy_hash(policy or {})
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                self._compiled.move_to_end(key)
+                return compiled
+        compiled = CompiledPolicy(policy)
+        with self._lock:
+            self.compilations += 1
+            self._compiled[key] = compiled
+            while len(self._compiled) > self.max_cached:
+                self._compiled.popitem(last=False)
+        return compiled
+
+    def fetch(self, **kwargs: Any) -> CompiledPolicy:
+        """Calls `get_policy` and returns the compiled policy.
+
+        :param kwargs: Keyword arguments for `get_policy`, such as
+          `_request_timeout`.
+        """
+        if self.api is None:
+            raise ValueError("PolicyEvaluator needs an api to fetch policies")
+        return self.compile(self.api.get_policy(**kwargs).policy)
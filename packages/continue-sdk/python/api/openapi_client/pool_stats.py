@@ -0,0 +1,233 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Statistics of the urllib3 connection pools of a client.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import bisect
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# upper bounds in seconds of the buckets of the checkout wait histogram
+WAIT_BUCKETS = (0.001, 0.005, 0.025, 0.1, 0.5, 2.5, float('inf'))
+
+# set by `_new_conn` while `_get_conn` runs in the same thread
+_local = threading.local()
+
+
+class PoolStats(NamedTuple):
+    """Snapshot of the connection pool of one host.
+
+    `saturated` counts checkouts that found no free connection: they
+    waited for one when the pool blocks, and otherwise opened an extra
+    connection that is `discarded` when it is returned to the full pool.
+    `wait_histogram` holds `(upper bound, count)` per bucket of
+    `WAIT_BUCKETS`.
+    """
+    host: str
+    maxsize: int
+    in_use: int
+    idle: int
+    peak_in_use: int
+    checkouts: int
+    reused: int
+    new_connections: int
+    discarded: int
+    saturated: int
+    wait_seconds: float
+    max_wait: float
+    wait_histogram: Tuple[Tuple[float, int], ...]
+    uptime: float
+
+    @property
+    def reuse_ratio(self) -> Optional[float]:
+        """Fraction of checkouts served by an existing connection."""
+        return self.reused / self.checkouts if self.checkouts else None
+
+    @property
+    def new_connection_rate(self) -> float:
+        """New connections per second since the pool was created."""
+        return self.new_connections / self.uptime if self.uptime > 0 else 0.0
+
+    @property
+    def mean_wait(self) -> Optional[float]:
+        return self.wait_seconds / self.checkouts if self.checkouts else None
+
+
+class _Counters:
+    """Live counters of the pools of one host."""
+
+    __slots__ = (
+        'host', 'lock', 'pool', 'created', 'in_use', 'peak_in_use', 'checkouts',
+        'reused', 'new_connections', 'discarded', 'saturated', 'wait_seconds',
+        'max_wait', 'wait_buckets', 'last_warning',
+    )
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        self.lock = threading.Lock()
+        self.pool: Optional["weakref.ref[Any]"] = None
+        self.created = time.monotonic()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.reused = 0
+        self.new_connections = 0
+        self.discarded = 0
+        self.saturated = 0
+        self.wait_seconds = 0.0
+        self.max_wait = 0.0
+        self.wait_buckets = [0] * len(WAIT_BUCKETS)
+        self.last_warning: Optional[float] = None
+
+    def snapshot(self) -> PoolStats:
+        pool = self.pool() if self.pool is not None else None
+        queue = getattr(pool, 'pool', None)
+        maxsize = queue.maxsize if queue is not None else 0
+        # the queue holds None for the slots without an open connection
+        idle = sum(1 for conn in list(queue.queue) if conn is not None) if queue is not None else 0
+        with self.lock:
+            return PoolStats(
+                host=self.host,
+                maxsize=maxsize,
+                in_use=self.in_use,
+                idle=idle,
+                peak_in_use=self.peak_in_use,
+                checkouts=self.checkouts,
+                reused=self.reused,
+                new_connections=self.new_connections,
+                discarded=self.discarded,
+                saturated=self.saturated,
+                wait_seconds=self.wait_seconds,
+                max_wait=self.max_wait,
+                wait_histogram=tuple(zip(WAIT_BUCKETS, self.wait_buckets)),
+                uptime=time.monotonic() - self.created,
+            )
+
+
+class _InstrumentedPool:
+    """Mixin counting the checkouts and returns of a urllib3 pool."""
+
+    metrics: "PoolMetrics"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._counters = self.metrics._register(self)
+
+    def _new_conn(self) -> Any:
+        conn = super()._new_conn()  # type: ignore[misc]
+        _local.created = True
+        counters = self._counters
+        with counters.lock:
+            counters.new_connections += 1
+        return conn
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        counters = self._counters
+        queue = getattr(self, 'pool', None)
+        saturated = queue is not None and queue.empty()
+        if saturated:
+            self.metrics._saturated(self, counters)
+        _local.created = False
+        start = time.perf_counter()
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        waited = time.perf_counter() - start
+        with counters.lock:
+            counters.checkouts += 1
+            if not _local.created:
+                counters.reused += 1
+            counters.saturated += saturated
+            counters.in_use += 1
+            counters.peak_in_use = max(counters.peak_in_use, counters.in_use)
+            counters.wait_seconds += waited
+            counters.max_wait = max(counters.max_wait, waited)
+            counters.wait_buckets[bisect.bisect_left(WAIT_BUCKETS, waited)] += 1
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        queue = getattr(self, 'pool', None)
+        discarded = conn is not None and queue is not None and queue.full()
+        try:
+            super()._put_conn(conn)  # type: ignore[misc]
+        finally:
+            counters = self._counters
+            with counters.lock:
+                counters.in_use = max(counters.in_use - 1, 0)
+                counters.discarded += discarded
+
+
+class PoolMetrics:
+    """Collects the statistics of the connection pools of a PoolManager.
+
+    `instrument` returns subclasses of the manager's pool classes that
+    count checkouts, new and reused connections, connections discarded
+    because the pool was full, and the time spent waiting for a
+    connection. `stats` snapshots them per host.
+
+    :param warn_on_saturation: Log a warning when a request finds no free
+      connection in its pool, at most once per `warning_interval` seconds
+      per host.
+    :param warning_interval: Seconds between warnings for one host.
+    """
+
+    def __init__(self, warn_on_saturation: bool = False, warning_interval: float = 60.0) -> None:
+        self.warn_on_saturation = warn_on_saturation
+        self.warning_interval = warning_interval
+        self._lock = threading.Lock()
+        self._counters: Dict[str, _Counters] = {}
+
+    def instrument(self, pool_classes: Mapping[str, type]) -> Dict[str, type]:
+        """Returns instrumented subclasses of pool classes by scheme, for
+        `PoolManager.pool_classes_by_scheme`."""
+        return {
+            scheme: type(
+                'Instrumented' + cls.__name__, (_InstrumentedPool, cls), {'metrics': self}
+            )
+            for scheme, cls in pool_classes.items()
+        }
+
+    def _register(self, pool: Any) -> _Counters:
+        host = '%s://%s:%s' % (pool.scheme, pool.host, pool.port)
+        with self._lock:
+            counters = self._counters.get(host)
+            if counters is None:
+                counters = self._counters[host] = _Counters(host)
+            # pools evicted by the manager are replaced by new ones for
+            # the same host; the counters carry over
+            counters.pool = weakref.ref(pool)
+        return counters
+
+    def _saturated(self, pool: Any, counters: _Counters) -> None:
+        if not self.warn_on_saturation:
+            return
+        now = time.monotonic()
+        with counters.lock:
+            if (
+                counters.last_warning is not None
+                and now - counters.last_warning < self.warning_interval
+            ):
+                return
+            counters.last_warning = now
+            in_use = counters.in_use
+        logger.warning(
+            "Connection pool for %s is saturated (%d connections in use, maxsize %d); "
+            "requests are %s. Consider raising Configuration.connection_pool_maxsize.",
+            counters.host, in_use, pool.pool.maxsize,
+            "waiting for a connection" if pool.block else "opening extra connections",
+        )
+
+    def stats(self) -> Dict[str, PoolStats]:
+        """Returns the statistics of each host's pool."""
+        with self._lock:
+            counters: List[_Counters] = list(self._counters.values())
+        return {c.host: c.snapshot() for c in counters}
@@ -0,0 +1,224 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import os
+import struct
+import threading
+import time
+from typing import Dict, List, Optional
+
+from openapi_client.exceptions import RateLimitExceededException
+from openapi_client.shared_cache import FileLock
+
+_STATE = struct.Struct('<dd')
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    :param rate: Tokens added per second, i.e. the sustained request rate.
+    :param capacity: Maximum number of tokens, i.e. the allowed burst.
+      Defaults to one second worth of tokens.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Takes `tokens` if available.
+
+        :return: 0 if the tokens were taken, otherwise the number of seconds
+          until they will be available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Returns tokens taken by a request that was not sent."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hands out no tokens for `seconds` and drains the burst."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = self._paused_until
+
+
+class SharedTokenBucket(TokenBucket):
+    """A token bucket shared by every process on the host.
+
+    The bucket state lives in a small file guarded by a `FileLock`, so all
+    processes using the same `path` draw from one budget.
+
+    :param path: File holding the bucket state.
+    :param rate: Tokens added per second.
+    :param capacity: Maximum number of tokens.
+    """
+
+    def __init__(self, path: str, rate: float, capacity: Optional[float] = None) -> None:
+        super().__init__(rate, capacity)
+        self.path = path
+        self._file_lock_path = path + '.lock'
+
+    def _update(self, change) -> float:
+        lock = FileLock(self._file_lock_path)
+        lock.acquire()
+        try:
+            try:
+                with open(self.path, 'rb') as f:
+                    tokens, updated = _STATE.unpack(f.read(_STATE.size))
+            except (OSError, struct.error):
+                tokens, updated = self.capacity, time.time()
+            now = time.time()
+            if now > updated:
+                tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+                updated = now
+            tokens, updated, result = change(tokens, updated, now)
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_STATE.pack(tokens, updated))
+            return result
+        finally:
+            lock.release()
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        def change(available, updated, now):
+            if now < updated:
+                # paused: `updated` is when tokens start accruing again
+                return available, updated, updated - now
+            if available >= tokens:
+                return available - tokens, updated, 0.0
+            return available, updated, (tokens - available) / self.rate
+        return self._update(change)
+
+    def refund(self, tokens: float = 1.0) -> None:
+        self._update(lambda available, updated, now: (
+            min(self.capacity, available + tokens), updated, 0.0
+        ))
+
+    def pause(self, seconds: float) -> None:
+        self._update(lambda available, updated, now: (
+            0.0, max(updated, now + seconds), 0.0
+        ))
+
+
+class RateLimiter:
+    """Client-side rate limiting for an ApiClient.
+
+    A request must obtain a token from the global bucket and from the
+    bucket of its operation, if one is configured. When the budget is
+    exhausted the request either waits for it (`block=True`, bounded by
+    `max_wait`) or fails fast with `RateLimitExceededException`. A 429
+    answer from the Hub pauses the affected buckets for its `Retry-After`,
+    so the client settles at the rate the Hub sustains instead of
+    alternating between bursts and throttling.
+
+    Pass it as `ApiClient(rate_limiter=...)`; one limiter can be shared by
+    several clients and threads.
+
+    :param global_bucket: Bucket every request draws from.
+    :param operation_buckets: Buckets by operation id, e.g.
+      `{'list_assistants': TokenBucket(2)}`.
+    :param block: Wait for tokens instead of raising.
+    :param max_wait: Longest a request may wait, in seconds, before
+      `RateLimitExceededException` is raised; None waits as long as needed.
+    :param default_retry_after: Pause applied on a 429 without a valid
+      `Retry-After` header.
+    """
+
+    def __init__(
+        self,
+        global_bucket: Optional[TokenBucket] = None,
+        operation_buckets: Optional[Dict[str, TokenBucket]] = None,
+        block: bool = True,
+        max_wait: Optional[float] = None,
+        default_retry_after: float = 1.0,
+    ) -> None:
+        self.global_bucket = global_bucket
+        self.operation_buckets = dict(operation_buckets or {})
+        self.block = block
+        self.max_wait = max_wait
+        self.default_retry_after = default_retry_after
+
+    def _buckets(self, operation_id: Optional[str]) -> List[TokenBucket]:
+        buckets = []
+        if operation_id is not None:
+            bucket = self.operation_buckets.get(operation_id)
+            if bucket is not None:
+                buckets.append(bucket)
+        if self.global_bucket is not None:
+            buckets.append(self.global_bucket)
+        return buckets
+
+    def acquire(self, operation_id: Optional[str] = None) -> None:
+        """Takes a token for a request, waiting or raising as configured.
+
+        :param operation_id: Operation the request belongs to.
+        :raises RateLimitExceededException: if no token is available in
+          time.
+        """
+        buckets = self._buckets(operation_id)
+        if not buckets:
+            return
+        deadline = None
+        if self.max_wait is not None:
+            deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = 0.0
+            taken: List[TokenBucket] = []
+            for bucket in buckets:
+                wait = bucket.try_acquire()
+                if wait > 0:
+                    break
+                taken.append(bucket)
+            if wait <= 0:
+                return
+            for bucket in taken:
+                bucket.refund()
+            if not self.block or (
+                deadline is not None and time.monotonic() + wait > deadline
+            ):
+                raise RateLimitExceededException(
+                    operation_id=operation_id, retry_after=wait
+                )
+            time.sleep(wait)
+
+    def throttled(self, operation_id: Optional[str], retry_after: Optional[str] = None) -> None:
+        """Records a 429 answer, pausing the buckets of the operation.
+
+        :param operation_id: Operation that was throttled.
+        :param retry_after: Value of the `Retry-After` header, in seconds.
+        """
+        try:
+            seconds = float(retry_after) if retry_after is not None else self.default_retry_after
+        except ValueError:
+            seconds = self.default_retry_after
+        for bucket in self._buckets(operation_id):
+            bucket.pause(seconds)
@@ -0,0 +1,149 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Compact immutable records of assistants and organizations.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import sys
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.list_assistants200_response_inner_config_result import (
+    ListAssistants200ResponseInnerConfigResult,
+)
+from openapi_client.models.list_organizations200_response_organizations_inner import (
+    ListOrganizations200ResponseOrganizationsInner,
+)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # slugs and proxy URLs repeat across the records of a cache
+    return sys.intern(value) if value is not None else None
+
+
+def _without_none(values: Dict[str, Any]) -> Dict[str, Any]:
+    # unset rather than null, so `to_dict` omits them like the original
+    return {key: value for key, value in values.items() if value is not None}
+
+
+def _canonical_json(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return json.dumps(value, sort_keys=True, separators=(',', ':'))
+
+
+class AssistantRecord(NamedTuple):
+    """A ListAssistants200ResponseInner as an immutable tuple.
+
+    Records have no per-instance dict and hold the unrolled config as
+    canonical JSON rather than nested dicts, so they take a fraction of
+    the memory of the model, and they are hashable: records of equal
+    assistants are equal, whatever the key order of their configs. The
+    `config` property decodes a fresh copy of the config on each access.
+
+    Nullable fields explicitly set to None are not distinguished from
+    unset ones.
+    """
+    owner_slug: str
+    package_slug: str
+    config_json: Optional[str]
+    config_load_interrupted: bool
+    errors: Optional[Tuple[str, ...]] = None
+    icon_url: Optional[str] = None
+    on_prem_proxy_url: Optional[str] = None
+    use_on_prem_proxy: Optional[bool] = None
+    raw_yaml: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """`(ownerSlug, packageSlug)`"""
+        return self.owner_slug, self.package_slug
+
+    @property
+    def config(self) -> Optional[Dict[str, Any]]:
+        return json.loads(self.config_json) if self.config_json is not None else None
+
+    @classmethod
+    def from_model(cls, model: ListAssistants200ResponseInner) -> "AssistantRecord":
+        config_result = model.config_result
+        return cls(
+            owner_slug=sys.intern(model.owner_slug),
+            package_slug=sys.intern(model.package_slug),
+            config_json=_canonical_json(config_result.config),
+            config_load_interrupted=config_result.config_load_interrupted,
+            errors=tuple(config_result.errors) if config_result.errors is not None else None,
+            icon_url=model.icon_url,
+            on_prem_proxy_url=_intern(model.on_prem_proxy_url),
+            use_on_prem_proxy=model.use_on_prem_proxy,
+            raw_yaml=model.raw_yaml,
+        )
+
+    @classmethod
+    def from_dict(cls, obj: Dict[str, Any]) -> "AssistantRecord":
+        """Creates a record from the JSON of an assistant, validating it
+        like the model does."""
+        return cls.from_model(ListAssistants200ResponseInner.model_validate(obj))
+
+    def to_model(self) -> ListAssistants200ResponseInner:
+        config_result: Dict[str, Any] = {
+            'config': self.config,
+            'configLoadInterrupted': self.config_load_interrupted,
+        }
+        if self.errors is not None:
+            config_result['errors'] = list(self.errors)
+        return ListAssistants200ResponseInner.model_validate(_without_none({
+            'configResult': ListAssistants200ResponseInnerConfigResult.model_validate(
+                config_result
+            ),
+            'ownerSlug': self.owner_slug,
+            'packageSlug': self.package_slug,
+            'iconUrl': self.icon_url,
+            'onPremProxyUrl': self.on_prem_proxy_url,
+            'useOnPremProxy': self.use_on_prem_proxy,
+            'rawYaml': self.raw_yaml,
+        }))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the JSON of the assistant, as the model's `to_dict`."""
+        return self.to_model().to_dict()
+
+
+class OrganizationRecord(NamedTuple):
+    """A ListOrganizations200ResponseOrganizationsInner as an immutable,
+    hashable tuple."""
+    id: str
+    name: str
+    slug: str
+    icon_url: Optional[str] = None
+
+    @classmethod
+    def from_model(
+        cls, model: ListOrganizations200ResponseOrganizationsInner
+    ) -> "OrganizationRecord":
+        return cls(
+            id=sys.intern(model.id),
+            name=model.name,
+            slug=sys.intern(model.slug),
+            icon_url=model.icon_url,
+        )
+
+    @classmethod
+    def from_dict(cls, obj: Dict[str, Any]) -> "OrganizationRecord":
+        return cls.from_model(ListOrganizations200ResponseOrganizationsInner.model_validate(obj))
+
+    def to_model(self) -> ListOrganizations200ResponseOrganizationsInner:
+        return ListOrganizations200ResponseOrganizationsInner.model_validate(_without_none({
+            'id': self.id,
+            'name': self.name,
+            'slug': self.slug,
+            'iconUrl': self.icon_url,
+        }))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.to_model().to_dict()
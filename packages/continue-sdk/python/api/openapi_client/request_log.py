@@ -0,0 +1,112 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import logging
+import random
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("openapi_client.requests")
+
+
+class RequestLog:
+    """The structured log record of one request.
+
+    It is passed to the logger as the message itself and as the
+    `openapi_request` attribute of the LogRecord, so it is only formatted
+    when a handler emits it, and structured handlers can use `as_dict()`
+    instead of parsing the message.
+    """
+
+    __slots__ = (
+        'operation_id', 'method', 'url', 'status', 'latency', 'size',
+        'retries', 'error', 'sample_rate', 'slow_threshold', '_start',
+    )
+
+    def __init__(self, operation_id: Optional[str], method: str, url: str,
+                 sample_rate: float, slow_threshold: Optional[float]) -> None:
+        self.operation_id = operation_id
+        self.method = method
+        self.url = url
+        self.status: Optional[int] = None
+        self.latency: Optional[float] = None
+        self.size: Optional[int] = None
+        self.retries = 0
+        self.error: Optional[BaseException] = None
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self._start = time.monotonic()
+
+    def finish(self, status: Optional[int] = None, size: Optional[int] = None,
+               retries: int = 0, error: Optional[BaseException] = None) -> None:
+        """Completes the record and logs it if it is selected.
+
+        Failed requests (an exception or a status of 400 and above) and
+        requests slower than `slow_threshold` are logged at INFO; other
+        requests are sampled at `sample_rate` and logged at DEBUG.
+        """
+        self.latency = time.monotonic() - self._start
+        self.status = status
+        self.size = size
+        self.retries = retries
+        self.error = error
+        if (
+            error is not None
+            or (status is not None and status >= 400)
+            or (self.slow_threshold is not None and self.latency >= self.slow_threshold)
+        ):
+            level = logging.INFO
+        elif self.sample_rate >= 1 or random.random() < self.sample_rate:
+            level = logging.DEBUG
+        else:
+            return
+        if logger.isEnabledFor(level):
+            logger.log(level, self, extra={'openapi_request': self})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'operation_id': self.operation_id,
+            'method': self.method,
+            'url': self.url,
+            'status': self.status,
+            'latency_ms': None if self.latency is None else round(self.latency * 1000, 3),
+            'size': self.size,
+            'retries': self.retries,
+            'error': None if self.error is None else repr(self.error),
+        }
+
+    def __str__(self) -> str:
+        message = "%s %s %s status=%s latency_ms=%.1f size=%s retries=%d" % (
+            self.operation_id or '-', self.method, self.url, self.status,
+            (self.latency or 0.0) * 1000, self.size, self.retries,
+        )
+        if self.error is not None:
+            message += " error=%r" % (self.error,)
+        return message
+
+
+def start_request_log(configuration, operation_id: Optional[str], method: str,
+                      url: str) -> Optional[RequestLog]:
+    """Returns a RequestLog for a request about to be sent, or None when
+    request logging is disabled, which keeps its cost to a level check."""
+    if not logger.isEnabledFor(logging.INFO):
+        return None
+    return RequestLog(
+        operation_id, method, url.partition('?')[0],
+        configuration.request_log_sample_rate,
+        configuration.request_log_slow_threshold,
+    )
+
+
+def retry_count(response) -> int:
+    """Returns the number of retries urllib3 made for a response."""
+    retries = getattr(response, 'retries', None)
+    return len(retries.history) if retries is not None else 0
@@ -16,10 +16,19 @@ import io
 import json
 import re
 import ssl
+import zlib
+from typing import Optional
 
 import urllib3
 
-from openapi_client.exceptions import ApiException, ApiValueError
+from openapi_client.exceptions import (
+    ApiException,
+    ApiValueError,
+    ResponseTooLargeException,
+)
+from openapi_client.multipart import CHUNK_SIZE, MultipartEncoder
+from openapi_client.pool_stats import PoolMetrics
+from openapi_client.request_log import retry_count
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
 RESTResponseType = urllib3.HTTPResponse
@@ -35,6 +44,35 @@ def is_socks_proxy_url(url):
         return split_section[0].lower() in SUPPORTED_SOCKS_PROXIES
 
 
+def _inflate(chunks, encoding, chunk_size):
+    """Decompresses a gzip or deflate body, yielding at most `chunk_size`
+    bytes per step however far a compressed chunk expands."""
+    decompressor = None
+    for data in chunks:
+        while data:
+            if decompressor is None:
+                # 32 + MAX_WBITS detects gzip and zlib headers; some
+                # servers send deflate without the zlib header
+                wbits = 32 + zlib.MAX_WBITS
+                if encoding == 'deflate' and (
+                    len(data) < 2 or data[0] & 0x0f != 8 or int.from_bytes(data[:2], 'big') % 31
+                ):
+                    wbits = -zlib.MAX_WBITS
+                decompressor = zlib.decompressobj(wbits)
+            while True:
+                chunk = decompressor.decompress(data, chunk_size)
+                if chunk:
+                    yield chunk
+                data = decompressor.unconsumed_tail
+                # a full chunk may leave output behind in zlib
+                if decompressor.eof or len(chunk) < chunk_size:
+                    break
+            if decompressor.eof:
+                # gzip bodies may hold several members
+                data = decompressor.unused_data if encoding == 'gzip' else b''
+                decompressor = None
+
+
 class RESTResponse(io.IOBase):
 
     def __init__(self, resp) -> None:
@@ -42,12 +80,116 @@ class RESTResponse(io.IOBase):
         self.status = resp.status
         self.reason = resp.reason
         self.data = None
+        self.max_size = None
+        self.request_log = None
+        self.operation_id: Optional[str] = None
+        self.url: Optional[str] = None
+
+    @classmethod
+    def from_bytes(cls, status, data, headers=None, reason=None):
+        """Builds a response around a body that was already received.
+
+        :param status: HTTP status code.
+        :param data: The response body as bytes.
+        :param headers: dict of response headers.
+        :param reason: HTTP reason phrase.
+        """
+        return cls(urllib3.HTTPResponse(
+            body=io.BytesIO(data),
+            headers=headers,
+            status=status,
+            reason=reason,
+            preload_content=False,
+            decode_content=False,
+        ))
 
     def read(self):
         if self.data is None:
-            self.data = self.response.data
+            try:
+                if self.max_size is None:
+                    self.data = self.response.data
+                else:
+                    self.data = b''.join(self.stream())
+            except Exception as e:
+                self._finish_log(error=e)
+                raise
+            self._finish_log(len(self.data or b''))
         return self.data
 
+    def _finish_log(self, size=None, error=None):
+        request_log = self.request_log
+        if request_log is not None:
+            self.request_log = None
+            request_log.finish(
+                self.status, size, retry_count(self.response), error
+            )
+
+    def limit(self, max_size):
+        """Limits the body to `max_size` bytes after decompression.
+
+        Fails at once if the `Content-Length` already exceeds it; otherwise
+        `read()` and `stream()` fail as soon as the limit is crossed. gzip
+        and deflate bodies are decompressed one chunk at a time, so a
+        small compressed body never expands far past the limit in memory.
+
+        :raises ResponseTooLargeException: if the body is too large.
+        """
+        self.max_size = max_size
+        if max_size is None or self.data is not None:
+            return
+        content_length = self.getheader('Content-Length')
+        if (
+            content_length is not None
+            and content_length.isdigit()
+            and int(content_length) > max_size
+            and not self.getheader('Content-Encoding')
+        ):
+            self._abort()
+
+    def _abort(self):
+        self.response.close()
+        self.response.release_conn()
+        error = ResponseTooLargeException(
+            self.max_size, status=self.status, headers=self.getheaders()
+        )
+        self._finish_log(error=error)
+        raise error
+
+    def stream(self, chunk_size=CHUNK_SIZE):
+        """Yields the body in chunks without buffering it.
+
+        Falls back to the buffered body if `read()` was already called.
+        """
+        if self.data is not None:
+            for start in range(0, len(self.data), chunk_size):
+                yield self.data[start:start + chunk_size]
+            return
+        max_size = self.max_size
+        received = 0
+        encoding = (self.getheader('Content-Encoding') or '').strip().lower()
+        if self.response.decode_content and encoding in ('gzip', 'x-gzip', 'deflate'):
+            # urllib3 would decode each raw chunk at once, whatever it
+            # expands to
+            chunks = _inflate(
+                self.response.stream(chunk_size, decode_content=False),
+                'deflate' if encoding == 'deflate' else 'gzip',
+                chunk_size,
+            )
+        else:
+            chunks = self.response.stream(chunk_size)
+        try:
+            for chunk in chunks:
+                received += len(chunk)
+                if max_size is not None and received > max_size:
+                    self._abort()
+                yield chunk
+        except Exception as e:
+            self._finish_log(received, e)
+            raise
+        finally:
+            self.response.release_conn()
+        self._finish_log(received)
+
     def getheaders(self):
         """Returns a dictionary of the response headers."""
         return self.response.headers
@@ -76,8 +218,10 @@ class RESTClientObject:
             "ca_certs": configuration.ssl_ca_cert,
             "cert_file": configuration.cert_file,
             "key_file": configuration.key_file,
-            "ca_cert_data": configuration.ca_cert_data,
         }
+        # urllib3 1.26 has no ca_cert_data pool key, so only pass it when set
+        if configuration.ca_cert_data is not None:
+            pool_args['ca_cert_data'] = configuration.ca_cert_data
         if configuration.assert_hostname is not None:
             pool_args['assert_hostname'] = (
                 configuration.assert_hostname
@@ -96,6 +240,9 @@ class RESTClientObject:
         if configuration.connection_pool_maxsize is not None:
             pool_args['maxsize'] = configuration.connection_pool_maxsize
 
+        if configuration.connection_pool_block:
+            pool_args['block'] = True
+
         # https pool manager
         self.pool_manager: urllib3.PoolManager
 
@@ -112,6 +259,17 @@ class RESTClientObject:
         else:
             self.pool_manager = urllib3.PoolManager(**pool_args)
 
+        self.pool_metrics = PoolMetrics(
+            warn_on_saturation=configuration.connection_pool_saturation_warning
+        )
+        self.pool_manager.pool_classes_by_scheme = self.pool_metrics.instrument(
+            self.pool_manager.pool_classes_by_scheme
+        )
+
+    def pool_stats(self):
+        """Returns the PoolStats of the connection pool of each host."""
+        return self.pool_metrics.stats()
+
     def request(
         self,
         method,
@@ -119,7 +277,8 @@ class RESTClientObject:
         headers=None,
         body=None,
         post_params=None,
-        _request_timeout=None
+        _request_timeout=None,
+        _retries=None
     ):
         """Perform requests.
 
@@ -133,7 +292,10 @@ class RESTClientObject:
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
+                                 (connection, read) timeouts, or a
+                                 urllib3.Timeout.
+        :param _retries: urllib3 retry setting for this request, instead of
+                         `configuration.retries`.
         """
         method = method.upper()
         assert method in [
@@ -154,9 +316,12 @@ class RESTClientObject:
         post_params = post_params or {}
         headers = headers or {}
 
+        extra = {} if _retries is None else {'retries': _retries}
         timeout = None
         if _request_timeout:
-            if isinstance(_request_timeout, (int, float)):
+            if isinstance(_request_timeout, urllib3.Timeout):
+                timeout = _request_timeout
+            elif isinstance(_request_timeout, (int, float)):
                 timeout = urllib3.Timeout(total=_request_timeout)
             elif (
                     isinstance(_request_timeout, tuple)
@@ -186,7 +351,8 @@ class RESTClientObject:
                         body=request_body,
                         timeout=timeout,
                         headers=headers,
-                        preload_content=False
+                        preload_content=False,
+                        **extra
                     )
                 elif content_type == 'application/x-www-form-urlencoded':
                     r = self.pool_manager.request(
@@ -196,23 +362,25 @@ class RESTClientObject:
                         encode_multipart=False,
                         timeout=timeout,
                         headers=headers,
-                        preload_content=False
+                        preload_content=False,
+                        **extra
                     )
                 elif content_type == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
-                    # Ensures that dict objects are serialized
-                    post_params = [(a, json.dumps(b)) if isinstance(b, dict) else (a,b) for a, b in post_params]
+                    # the Content-Type must carry the boundary of the body;
+                    # files are streamed from disk rather than buffered
+                    encoder = MultipartEncoder(post_params)
+                    headers['Content-Type'] = encoder.content_type
+                    content_length = encoder.content_length
+                    if content_length is not None:
+                        headers['Content-Length'] = str(content_length)
                     r = self.pool_manager.request(
                         method,
                         url,
-                        fields=post_params,
-                        encode_multipart=True,
+                        body=encoder,
                         timeout=timeout,
                         headers=headers,
-                        preload_content=False
+                        preload_content=False,
+                        **extra
                     )
                 # Pass a `string` parameter directly in the body to support
                 # other content types than JSON when `body` argument is
@@ -224,7 +392,8 @@ class RESTClientObject:
                         body=body,
                         timeout=timeout,
                         headers=headers,
-                        preload_content=False
+                        preload_content=False,
+                        **extra
                     )
                 elif headers['Content-Type'].startswith('text/') and isinstance(body, bool):
                     request_body = "true" if body else "false"
@@ -234,7 +403,8 @@ class RESTClientObject:
                         body=request_body,
                         preload_content=False,
                         timeout=timeout,
-                        headers=headers)
+                        headers=headers,
+                        **extra)
                 else:
                     # Cannot generate the request from given parameters
                     msg = """Cannot prepare a request message for provided
@@ -249,7 +419,8 @@ class RESTClientObject:
                     fields={},
                     timeout=timeout,
                     headers=headers,
-                    preload_content=False
+                    preload_content=False,
+                    **extra
                 )
         except urllib3.exceptions.SSLError as e:
             msg = "\n".join([type(e).__name__, str(e)])
@@ -0,0 +1,257 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import re
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.api_response import ApiResponse
+from openapi_client.bulk import BulkResult, run_bulk
+from openapi_client.rest import RESTResponse
+
+
+class OperationSpec(NamedTuple):
+    """Static description of a DefaultApi operation."""
+
+    operation_id: str
+    method: str
+    resource_path: str
+    params: Tuple[str, ...]
+    response_types: Mapping[str, Optional[str]]
+
+
+# Copied from the generated DefaultApi; test_sansio checks that the two
+# agree, so regenerate both together.
+OPERATIONS: Dict[str, OperationSpec] = {spec.operation_id: spec for spec in (
+    OperationSpec(
+        'get_assistant', 'GET', '/ide/get-assistant/{ownerSlug}/{packageSlug}',
+        ('owner_slug', 'package_slug', 'always_use_proxy', 'organization_id'),
+        {
+            '200': "GetAssistant200Response",
+            '401': "ListAssistants401Response",
+            '403': "GetAssistant403Response",
+            '404': "GetAssistant404Response",
+        },
+    ),
+    OperationSpec(
+        'get_free_trial_status', 'GET', '/ide/free-trial-status',
+        (),
+        {
+            '200': "GetFreeTrialStatus200Response",
+            '404': "ListAssistants404Response",
+        },
+    ),
+    OperationSpec(
+        'get_models_add_on_checkout_url', 'GET', '/ide/get-models-add-on-checkout-url',
+        ('profile_id', 'vscode_uri_scheme'),
+        {
+            '200': "GetModelsAddOnCheckoutUrl200Response",
+            '404': "ListAssistants404Response",
+            '500': "GetModelsAddOnCheckoutUrl500Response",
+        },
+    ),
+    OperationSpec(
+        'get_policy', 'GET', '/ide/policy',
+        (),
+        {
+            '200': "GetPolicy200Response",
+            '404': "ListAssistants404Response",
+        },
+    ),
+    OperationSpec(
+        'list_assistant_full_slugs', 'GET', '/ide/list-assistant-full-slugs',
+        (),
+        {
+            '429': "ListAssistantFullSlugs429Response",
+        },
+    ),
+    OperationSpec(
+        'list_assistants', 'GET', '/ide/list-assistants',
+        ('always_use_proxy', 'organization_id'),
+        {
+            '200': "List[ListAssistants200ResponseInner]",
+            '401': "ListAssistants401Response",
+            '404': "ListAssistants404Response",
+        },
+    ),
+    OperationSpec(
+        'list_organizations', 'GET', '/ide/list-organizations',
+        (),
+        {
+            '200': "ListOrganizations200Response",
+            '404': "ListAssistants404Response",
+        },
+    ),
+    OperationSpec(
+        'sync_secrets', 'POST', '/ide/sync-secrets',
+        ('sync_secrets_request',),
+        {
+            '200': "List[Optional[object]]",
+            '404': "ListAssistants404Response",
+        },
+    ),
+)}
+
+
+_PATH_PATTERNS: List[Tuple[Pattern[str], OperationSpec]] = [
+    (re.compile(re.sub(r'\{\w+\}', '[^/]+', spec.resource_path) + '$'), spec)
+    for spec in OPERATIONS.values()
+]
+
+
+def match_operation(method: str, url: str) -> Optional[OperationSpec]:
+    """Returns the operation a request was made for, from its method and
+    URL, or None if it is not a DefaultApi request."""
+    method = method.upper()
+    path = urlsplit(url).path
+    for pattern, spec in _PATH_PATTERNS:
+        if spec.method == method and pattern.search(path):
+            return spec
+    return None
+
+
+class RequestDescriptor(NamedTuple):
+    """A fully serialized request, ready for any executor to send.
+
+    Only holds plain data, so it can be queued, pickled to another process
+    or stored for replay.
+    """
+
+    operation_id: str
+    method: str
+    url: str
+    headers: Dict[str, str]
+    body: Any = None
+    post_params: Any = None
+
+
+class RawResponse(NamedTuple):
+    """A received response as plain data."""
+
+    status: int
+    headers: Dict[str, str]
+    data: bytes
+    reason: Optional[str] = None
+
+
+def build_request(
+    api_client: ApiClient,
+    operation_id: str,
+    _request_auth: Optional[Dict[str, Any]] = None,
+    _content_type: Optional[str] = None,
+    _headers: Optional[Dict[str, Any]] = None,
+    **params: Any,
+) -> RequestDescriptor:
+    """Serializes an operation call without sending it.
+
+    Unlike the DefaultApi methods, the parameters are not validated by
+    pydantic; pass the types the operation documents.
+
+    :param api_client: ApiClient providing configuration and auth.
+    :param operation_id: Name of the DefaultApi operation.
+    :param params: The parameters of the operation, by name.
+    :return: RequestDescriptor
+    """
+    spec = OPERATIONS.get(operation_id)
+    if spec is None:
+        raise ValueError("Unknown operation {0}".format(operation_id))
+    unknown = set(params) - set(spec.params)
+    if unknown:
+        raise TypeError("{0}() got unexpected parameters {1}".format(
+            operation_id, ', '.join(sorted(unknown))
+        ))
+    serialize = getattr(DefaultApi(api_client), '_{0}_serialize'.format(operation_id))
+    method, url, headers, body, post_params = serialize(
+        **{name: params.get(name) for name in spec.params},
+        _request_auth=_request_auth,
+        _content_type=_content_type,
+        _headers=dict(_headers) if _headers else None,
+        _host_index=0,
+    )
+    return RequestDescriptor(operation_id, method, url, headers, body, post_params or None)
+
+
+def fetch(api_client: ApiClient, request: RequestDescriptor,
+          _request_timeout: Any = None) -> RawResponse:
+    """Sends a request with `api_client` and reads the whole response."""
+    response = api_client.call_api(
+        request.method, request.url,
+        header_params=request.headers,
+        body=request.body,
+        post_params=request.post_params,
+        _request_timeout=_request_timeout,
+        _operation_id=request.operation_id,
+    )
+    data = response.read()
+    return RawResponse(response.status, dict(response.getheaders() or {}), data, response.reason)
+
+
+def parse_response(
+    api_client: ApiClient,
+    request: RequestDescriptor,
+    response: RawResponse,
+) -> ApiResponse[Any]:
+    """Deserializes a response to `request`, as the `*_with_http_info`
+    method of its operation would.
+
+    :raises ApiException: for error statuses, as the DefaultApi methods.
+    """
+    spec = OPERATIONS[request.operation_id]
+    rest_response = RESTResponse.from_bytes(
+        response.status, response.data, response.headers, response.reason
+    )
+    rest_response.read()
+    return api_client.response_deserialize(
+        response_data=rest_response,
+        response_types_map=dict(spec.response_types),
+    )
+
+
+def fetch_json(api_client: ApiClient, request: RequestDescriptor) -> Any:
+    """Sends a request and decodes its JSON body, without building models.
+
+    :raises ApiException: for error statuses, as the DefaultApi methods.
+    """
+    response = fetch(api_client, request)
+    if not 200 <= response.status <= 299:
+        parse_response(api_client, request, response)
+    return json.loads(response.data) if response.data else None
+
+
+def execute(api_client: ApiClient, request: RequestDescriptor,
+            _request_timeout: Any = None) -> ApiResponse[Any]:
+    """Sends a request and parses its response."""
+    return parse_response(api_client, request, fetch(api_client, request, _request_timeout))
+
+
+def execute_many(
+    api_client: ApiClient,
+    requests: Iterable[RequestDescriptor],
+    executor: Optional[Executor] = None,
+    max_concurrency: int = 8,
+) -> BulkResult:
+    """Executes requests concurrently, at most `max_concurrency` at a time.
+
+    :param executor: Executor to run on; `api_client.pool` by default.
+    :return: BulkResult keyed by the index of each request, whose values
+      are ApiResponses.
+    """
+    requests = list(requests)
+    return run_bulk(
+        executor if executor is not None else api_client.pool,
+        lambda index: execute(api_client, requests[index]),
+        range(len(requests)),
+        max_concurrency,
+    )
@@ -0,0 +1,233 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Discovery and early resolution of secret references in assistant configs.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import logging
+import re
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from openapi_client.models.get_assistant200_response import GetAssistant200Response
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.records import AssistantRecord
+
+if TYPE_CHECKING:
+    from openapi_client.api.default_api import DefaultApi
+    from openapi_client.rest import RESTResponse
+
+logger = logging.getLogger(__name__)
+
+# `${{ secrets.<FQSN> }}`, as matched by the config-yaml package
+SECRET_REFERENCE_RE = re.compile(r'\$\{\{\s*secrets\.([^}\s]+)\s*\}\}')
+
+# operations whose results are scanned with `scan_responses`
+SCANNED_OPERATIONS = frozenset(('get_assistant', 'list_assistants'))
+
+
+def decode_fqsn(fqsn: str) -> Dict[str, Any]:
+    """Decodes a Fully Qualified Secret Name,
+    `owner/package/.../secretName`, into its JSON form.
+
+    :raises ValueError: if a package slug lacks its package part.
+    """
+    parts = fqsn.split('/')
+    secret_name = parts.pop()
+    if len(parts) % 2:
+        raise ValueError("Invalid FQSN {0}: package slug must have two parts".format(fqsn))
+    return {
+        'packageSlugs': [
+            {'ownerSlug': parts[i], 'packageSlug': parts[i + 1]}
+            for i in range(0, len(parts), 2)
+        ],
+        'secretName': secret_name,
+    }
+
+
+def encode_fqsn(fqsn: Dict[str, Any]) -> str:
+    """Encodes the JSON form of an FQSN back into its string form."""
+    parts = [
+        '%s/%s' % (slug['ownerSlug'], slug['packageSlug'])
+        for slug in fqsn.get('packageSlugs') or ()
+    ]
+    parts.append(fqsn['secretName'])
+    return '/'.join(parts)
+
+
+def find_secret_references(value: Any) -> Set[str]:
+    """Returns the FQSNs referenced anywhere in a string, or in the
+    strings of a structure of dicts and lists such as an unrolled config.
+
+    References the Hub already rendered to a secret location
+    (`organization:acme/KEY`) are not FQSNs and are skipped.
+    """
+    found: Set[str] = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if '${{' in item:
+                found.update(
+                    name for name in SECRET_REFERENCE_RE.findall(item) if ':' not in name
+                )
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return found
+
+
+def assistant_secret_references(assistant: Any) -> Set[str]:
+    """Returns the FQSNs referenced by an assistant's unrolled config and
+    rawYaml. Accepts assistant models, AssistantRecords or their JSON
+    dicts."""
+    if isinstance(assistant, (ListAssistants200ResponseInner, GetAssistant200Response)):
+        config = assistant.config_result.config
+        raw_yaml = assistant.raw_yaml
+    elif isinstance(assistant, AssistantRecord):
+        config = assistant.config
+        raw_yaml = assistant.raw_yaml
+    else:
+        config = (assistant.get('configResult') or {}).get('config')
+        raw_yaml = assistant.get('rawYaml')
+    return find_secret_references([config, raw_yaml])
+
+
+class SecretPrefetcher:
+    """Resolves the secrets referenced by assistants ahead of their use.
+
+    `prefetch` scans assistants for `${{ secrets.<FQSN> }}` references and
+    starts a single `sync_secrets` call for all the new ones of an
+    organization on the API client's thread pool, so resolution overlaps
+    with whatever the caller does next. `get` waits for a result.
+    References already resolved or in flight are not requested again;
+    failed ones are requested again by the next `prefetch`.
+
+    :param api: DefaultApi used for the `sync_secrets` calls.
+    :param scan_responses: Also prefetch for every `get_assistant` and
+      `list_assistants` result that `api`'s ApiClient deserializes, not
+      only for those of the bulk operations and explicit `prefetch` calls.
+    """
+
+    def __init__(self, api: "DefaultApi", scan_responses: bool = False) -> None:
+        self.api = api
+        self._lock = threading.Lock()
+        self._futures: Dict[Tuple[Optional[str], str], "Future[Dict[str, Any]]"] = {}
+        if scan_responses:
+            api.api_client.secret_prefetcher = self
+
+    def prefetch(self, assistants: Iterable[Any],
+                 organization_id: Optional[str] = None) -> Optional["Future[Dict[str, Any]]"]:
+        """Starts resolving the secrets referenced by `assistants`.
+
+        :param assistants: Assistant models or their JSON dicts.
+        :param organization_id: Organization to scope the resolution to;
+          None for personal assistants.
+        :return: Future of the results by FQSN, or None if there was
+          nothing new to resolve.
+        """
+        fqsns: Set[str] = set()
+        for assistant in assistants:
+            fqsns |= assistant_secret_references(assistant)
+        return self.prefetch_fqsns(fqsns, organization_id)
+
+    def prefetch_fqsns(
+        self, fqsns: Iterable[str], organization_id: Optional[str] = None
+    ) -> Optional["Future[Dict[str, Any]]"]:
+        """Starts resolving FQSNs in one `sync_secrets` call."""
+        decoded: List[Tuple[str, Dict[str, Any]]] = []
+        for fqsn in sorted(set(fqsns)):
+            try:
+                decoded.append((fqsn, decode_fqsn(fqsn)))
+            except ValueError as e:
+                logger.warning("Skipping secret reference: %s", e)
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._lock:
+            decoded = [
+                (fqsn, value) for fqsn, value in decoded
+                if (organization_id, fqsn) not in self._futures
+            ]
+            if not decoded:
+                return None
+            for fqsn, _ in decoded:
+                self._futures[(organization_id, fqsn)] = future
+        try:
+            self.api.api_client.pool.submit(self._sync, decoded, organization_id, future)
+        except BaseException as e:
+            self._failed(decoded, organization_id, future, e)
+            raise
+        return future
+
+    def scan_response(self, response: "RESTResponse", data: Any) -> None:
+        """Prefetches for a deserialized `get_assistant` or
+        `list_assistants` result, scoped to the organization it was
+        requested for. Called by `ApiClient.response_deserialize`.
+        """
+        if response.operation_id not in SCANNED_OPERATIONS or data is None:
+            return
+        query = parse_qs(urlsplit(response.url or '').query)
+        organization_id = query['organizationId'][0] if 'organizationId' in query else None
+        try:
+            self.prefetch(data if isinstance(data, list) else [data], organization_id)
+        except Exception:
+            # already logged; the call itself succeeded
+            pass
+
+    def _sync(self, decoded: List[Tuple[str, Dict[str, Any]]],
+              organization_id: Optional[str], future: "Future[Dict[str, Any]]") -> None:
+        if not future.set_running_or_notify_cancel():
+            self._failed(decoded, organization_id, future, None)
+            return
+        try:
+            results = self.api.sync_secrets(SyncSecretsRequest(
+                fqsns=[value for _, value in decoded],
+                orgScopeId=organization_id,
+            ))
+        except BaseException as e:
+            self._failed(decoded, organization_id, future, e)
+            return
+        by_fqsn: Dict[str, Any] = {}
+        for (fqsn, _), result in zip(decoded, results):
+            # results echo their FQSN; fall back to the request order
+            echoed = result.get('fqsn') if isinstance(result, dict) else None
+            if isinstance(echoed, dict) and 'secretName' in echoed:
+                fqsn = encode_fqsn(echoed)
+            by_fqsn[fqsn] = result
+        future.set_result(by_fqsn)
+
+    def _failed(self, decoded: List[Tuple[str, Dict[str, Any]]], organization_id: Optional[str],
+                future: "Future[Dict[str, Any]]", error: Optional[BaseException]) -> None:
+        with self._lock:
+            for fqsn, _ in decoded:
+                if self._futures.get((organization_id, fqsn)) is future:
+                    del self._futures[(organization_id, fqsn)]
+        if error is not None:
+            logger.warning("sync_secrets failed for %d secrets: %s", len(decoded), error)
+            future.set_exception(error)
+
+    def get(self, fqsn: str, organization_id: Optional[str] = None,
+            timeout: Optional[float] = None) -> Any:
+        """Returns the `SecretResult` of an FQSN, waiting for its prefetch
+        or starting one if needed.
+
+        :raises ValueError: if `fqsn` is not a valid FQSN.
+        :raises Exception: the error of the `sync_secrets` call.
+        """
+        decode_fqsn(fqsn)
+        future: Optional["Future[Dict[str, Any]]"] = None
+        while future is None:
+            with self._lock:
+                future = self._futures.get((organization_id, fqsn))
+            if future is None:
+                # None if another thread started it in the meantime
+                future = self.prefetch_fqsns([fqsn], organization_id)
+        return future.result(timeout).get(fqsn)
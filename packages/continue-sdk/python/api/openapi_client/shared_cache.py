@@ -0,0 +1,357 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from openapi_client.rest import RESTResponse
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore[assignment]
+
+_ENTRY_MAGIC = b"OACACHE1\n"
+
+logger = logging.getLogger(__name__)
+
+
+def _make_private_directory(path: str) -> None:
+    """Creates a directory only the current user can access, or checks
+    that an existing one is such a directory.
+
+    :raises PermissionError: if `path` is a symlink, is not a directory,
+      belongs to another user, or is accessible by other users.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if not hasattr(os, 'getuid'):
+        return
+    info = os.lstat(path)
+    if stat.S_ISLNK(info.st_mode) or not stat.S_ISDIR(info.st_mode):
+        raise PermissionError("%s is not a directory" % path)
+    if info.st_uid != os.getuid():
+        raise PermissionError("%s belongs to another user" % path)
+    if stat.S_IMODE(info.st_mode) & 0o077:
+        raise PermissionError(
+            "%s has mode %o, expected 0700" % (path, stat.S_IMODE(info.st_mode))
+        )
+
+
+class FileLock:
+    """An exclusive lock on a file, shared by every process on the host.
+
+    Uses `flock` where available and `msvcrt.locking` on Windows. Two
+    threads of the same process also exclude each other, since each
+    acquisition opens its own file descriptor.
+
+    :param path: Path of the lock file; created if missing.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def acquire(self, timeout: Optional[float] = None, poll_interval: float = 0.01) -> bool:
+        """Acquires the lock.
+
+        :param timeout: Seconds to wait for the lock; None waits forever
+          and 0 returns immediately.
+        :return: Whether the lock was acquired.
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._try_lock(fd):
+                self._fd = fd
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                return False
+            time.sleep(poll_interval)
+
+    def release(self) -> None:
+        fd = self._fd
+        if fd is None:
+            return
+        self._fd = None
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _try_lock(fd: int) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+
+class CacheEntry:
+    """A cached response."""
+
+    __slots__ = ('stored_at', 'status', 'reason', 'headers', 'data')
+
+    def __init__(self, stored_at: float, status: int, reason: Optional[str],
+                 headers: Dict[str, str], data: bytes) -> None:
+        self.stored_at = stored_at
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+
+    def to_response(self) -> RESTResponse:
+        return RESTResponse.from_bytes(self.status, self.data, self.headers, self.reason)
+
+
+class SharedResponseCache:
+    """A response cache shared by every process of the same user on a host.
+
+    Set it as `ApiClient.response_cache` to serve `GET` requests from it.
+    Each response is stored in its own file, written to a temporary name
+    and renamed into place, so readers never observe a partial entry.
+    When an entry is missing or older than `ttl`, the processes that need it
+    race for a per-entry file lock: the winner fetches and stores the
+    response while the others wait and then read what it stored. Hub
+    traffic for a hot resource is therefore one request per `ttl` for the
+    whole host, however many processes ask for it.
+
+    Entries are keyed on method, URL and the `vary_headers` (including the
+    `Authorization` header), so callers with different credentials never
+    share entries. Only 2xx responses are stored.
+
+    :param directory: Directory holding the entries; it must be a
+      directory of the current user that other users cannot access.
+      Defaults to a per-user directory under the system temp folder, or
+      under the user's cache folder if that one is not private.
+    :param ttl: Seconds an entry is served before it is refreshed.
+    :param lock_timeout: Seconds to wait for another process's refresh
+      before fetching independently.
+    :param vary_headers: Request headers that are part of the cache key.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: float = 30.0,
+        lock_timeout: float = 30.0,
+        vary_headers: Iterable[str] = ('Authorization', 'Accept', 'Cookie'),
+    ) -> None:
+        if directory is None:
+            if hasattr(os, 'getuid'):
+                user = str(os.getuid())
+            else:
+                user = os.environ.get('USERNAME', 'user')
+            directory = os.path.join(tempfile.gettempdir(), 'openapi-client-cache-%s' % user)
+            try:
+                _make_private_directory(directory)
+            except PermissionError as e:
+                # the shared temp dir is writable by everyone, so another
+                # user may have taken the name first
+                cache_home = (os.environ.get('XDG_CACHE_HOME')
+                              or os.path.join(os.path.expanduser('~'), '.cache'))
+                fallback = os.path.join(cache_home, 'openapi-client')
+                logger.warning(
+                    "Not using cache directory %s: %s; using %s",
+                    directory, e, fallback,
+                )
+                directory = fallback
+                _make_private_directory(directory)
+        else:
+            _make_private_directory(directory)
+        self.directory = directory
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.vary_headers = tuple(h.lower() for h in vary_headers)
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, method: str, url: str, headers: Optional[Dict[str, str]]) -> str:
+        """Returns the cache key of a request."""
+        digest = hashlib.sha256()
+        digest.update(method.upper().encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(url.encode('utf-8'))
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        for name in self.vary_headers:
+            digest.update(b'\0')
+            digest.update(str(lowered.get(name, '')).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry stored under `key`, fresh or not."""
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path, 'rb') as f:
+                blob = f.read()
+        except OSError:
+            return None
+        if not blob.startswith(_ENTRY_MAGIC):
+            return None
+        header_end = blob.find(b'\n', len(_ENTRY_MAGIC))
+        if header_end < 0:
+            return None
+        try:
+            header = json.loads(blob[len(_ENTRY_MAGIC):header_end])
+        except ValueError:
+            return None
+        return CacheEntry(
+            header['stored_at'], header['status'], header.get('reason'),
+            header.get('headers') or {}, blob[header_end + 1:],
+        )
+
+    def put(self, key: str, response: RESTResponse) -> CacheEntry:
+        """Stores a response that was already read under `key`."""
+        entry = CacheEntry(
+            time.time(), response.status, response.reason,
+            dict(response.getheaders() or {}), response.data or b'',
+        )
+        header = json.dumps({
+            'stored_at': entry.stored_at,
+            'status': entry.status,
+            'reason': entry.reason,
+            'headers': entry.headers,
+        }).encode('utf-8')
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.%s.' % key)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_ENTRY_MAGIC + header + b'\n' + entry.data)
+            os.replace(tmp_path, os.path.join(self.directory, key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return entry
+
+    def is_fresh(self, entry: Optional[CacheEntry]) -> bool:
+        return entry is not None and time.time() - entry.stored_at < self.ttl
+
+    def fetch(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        send: Callable[[], RESTResponse],
+    ) -> RESTResponse:
+        """Returns the cached response for a request, calling `send` to
+        refresh it if this process is elected to.
+
+        :param method: HTTP method of the request.
+        :param url: Full URL of the request.
+        :param headers: Request headers.
+        :param send: Performs the request and returns its RESTResponse.
+        :return: RESTResponse
+        """
+        key = self.key(method, url, headers)
+        entry = self.get(key)
+        if self.is_fresh(entry):
+            self._count(hit=True)
+            return entry.to_response()  # type: ignore[union-attr]
+
+        lock = FileLock(os.path.join(self.directory, key + '.lock'))
+        locked = lock.acquire(timeout=self.lock_timeout)
+        try:
+            if locked:
+                # another process may have refreshed it while we waited
+                entry = self.get(key)
+                if self.is_fresh(entry):
+                    self._count(hit=True)
+                    return entry.to_response()  # type: ignore[union-attr]
+            self._count(hit=False)
+            response = send()
+            response.read()
+            if 200 <= response.status <= 299:
+                return self.put(key, response).to_response()
+            return RESTResponse.from_bytes(
+                response.status, response.data, response.getheaders(), response.reason
+            )
+        finally:
+            if locked:
+                lock.release()
+
+    def prune(self, max_age: Optional[float] = None) -> int:
+        """Evicts the entries older than `max_age` seconds (by default
+        `ttl`). An entry being refreshed is left alone.
+
+        Lock files are kept: another process may be waiting on one, and
+        unlinking it would let the next caller lock a new file in its
+        place while the old one is still held.
+
+        :return: The number of entries evicted.
+        """
+        max_age = self.ttl if max_age is None else max_age
+        now = time.time()
+        evicted = 0
+        for name in os.listdir(self.directory):
+            if name.startswith('.') or name.endswith('.lock'):
+                continue
+            entry = self.get(name)
+            if entry is None or now - entry.stored_at < max_age:
+                continue
+            lock = FileLock(os.path.join(self.directory, name + '.lock'))
+            if not lock.acquire(timeout=0):
+                continue
+            try:
+                os.unlink(os.path.join(self.directory, name))
+                evicted += 1
+            except OSError:
+                pass
+            finally:
+                lock.release()
+        return evicted
+
+    def clear(self) -> None:
+        """Removes every entry, keeping the lock files like `prune`."""
+        for name in os.listdir(self.directory):
+            if name.endswith('.lock'):
+                continue
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def _count(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
@@ -0,0 +1,225 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import logging
+import threading
+import time
+from typing import Callable, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class AccessToken(NamedTuple):
+    """An access token and the time.time() at which it expires."""
+
+    token: str
+    expires_at: Optional[float] = None
+
+
+TokenFetcher = Callable[[], Union[AccessToken, Tuple[str, Optional[float]], str]]
+
+
+class TokenManager:
+    """Keeps an access token fresh without making requests wait for it.
+
+    The token is renewed on a background thread shortly before it expires,
+    so requests normally just read the cached value. A request only blocks
+    when there is no usable token at all (the first call, or after the
+    background refresh kept failing until expiry), and concurrent callers
+    then share a single refresh.
+
+    Assign an instance to `Configuration.token_manager` to use it for the
+    `apiKeyAuth` bearer token.
+
+    :param fetch_token: Callable returning a new token, either as an
+      `AccessToken`, a `(token, expires_at)` tuple or a bare string for a
+      token that never expires. `expires_at` is a `time.time()` timestamp.
+    :param refresh_margin: Seconds before expiry at which the background
+      refresh starts. Capped at half of the token lifetime.
+    :param retry_interval: Initial delay before retrying a failed background
+      refresh; doubled after each failure.
+    :param max_retry_interval: Upper bound for the retry delay.
+    :param prefix: Authorization scheme used by `authorization_header`.
+    """
+
+    def __init__(
+        self,
+        fetch_token: TokenFetcher,
+        refresh_margin: float = 60.0,
+        retry_interval: float = 1.0,
+        max_retry_interval: float = 30.0,
+        prefix: str = "Bearer",
+    ) -> None:
+        self._fetch_token = fetch_token
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.prefix = prefix
+
+        self._condition = threading.Condition()
+        self._token: Optional[AccessToken] = None
+        self._refresh_at: Optional[float] = None
+        self._header: Optional[str] = None
+        self._refreshing = False
+        self._revision = 0
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped every time a new token is stored."""
+        return self._revision
+
+    def get_token(self) -> str:
+        """Returns a valid token, fetching one only if none is usable."""
+        token = self._token
+        if token is None or self._is_expired(token):
+            token = self._refresh_if_unusable()
+        return token.token
+
+    @property
+    def authorization_header(self) -> str:
+        """The pre-rendered `Authorization` header value."""
+        token = self.get_token()
+        header = self._header
+        if header is None:
+            header = "%s %s" % (self.prefix, token) if self.prefix else token
+        return header
+
+    def refresh(self) -> AccessToken:
+        """Fetches a new token now, sharing an in-flight refresh if any."""
+        with self._condition:
+            if self._refreshing:
+                revision = self._revision
+                while self._refreshing:
+                    self._condition.wait()
+                if self._revision != revision and self._token is not None:
+                    return self._token
+            self._refreshing = True
+        return self._do_refresh()
+
+    def close(self) -> None:
+        """Stops the background refresh thread."""
+        self._closed = True
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "TokenManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def _is_expired(token: AccessToken) -> bool:
+        return token.expires_at is not None and time.time() >= token.expires_at
+
+    def _refresh_if_unusable(self) -> AccessToken:
+        with self._condition:
+            while True:
+                token = self._token
+                if token is not None and not self._is_expired(token):
+                    return token
+                if not self._refreshing:
+                    break
+                self._condition.wait()
+            self._refreshing = True
+        return self._do_refresh()
+
+    def _do_refresh(self) -> AccessToken:
+        """Fetches and stores a token; the caller must own `_refreshing`."""
+        try:
+            fetched = self._fetch_token()
+        except BaseException:
+            with self._condition:
+                self._refreshing = False
+                self._condition.notify_all()
+            raise
+
+        if isinstance(fetched, str):
+            token = AccessToken(fetched)
+        else:
+            token = AccessToken(*fetched)
+        now = time.time()
+        refresh_at = None
+        if token.expires_at is not None:
+            margin = min(self.refresh_margin, (token.expires_at - now) / 2)
+            refresh_at = max(token.expires_at - margin, now + self.retry_interval)
+
+        with self._condition:
+            self._token = token
+            self._refresh_at = refresh_at
+            self._header = (
+                "%s %s" % (self.prefix, token.token) if self.prefix else token.token
+            )
+            self._revision += 1
+            self._refreshing = False
+            self._condition.notify_all()
+        self._ensure_thread()
+        self._wakeup.set()
+        return token
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None or self._closed:
+            return
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="openapi-client-token-refresh",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        failures = 0
+        while not self._closed:
+            refresh_at = self._refresh_at
+            if failures:
+                delay: Optional[float] = min(
+                    self.retry_interval * 2 ** (failures - 1),
+                    self.max_retry_interval,
+                )
+            elif refresh_at is None:
+                # the token never expires: sleep until a new one is stored
+                delay = None
+            else:
+                delay = max(refresh_at - time.time(), 0.0)
+            if self._wakeup.wait(delay):
+                self._wakeup.clear()
+                failures = 0
+                continue
+            if self._closed:
+                break
+
+            with self._condition:
+                if self._refreshing:
+                    # a caller is already refreshing, reuse its result
+                    while self._refreshing:
+                        self._condition.wait()
+                    continue
+                self._refreshing = True
+            try:
+                self._do_refresh()
+            except Exception:
+                failures += 1
+                logger.warning(
+                    "Background token refresh failed (attempt %d)",
+                    failures,
+                    exc_info=True,
+                )
+            else:
+                self._wakeup.clear()
+                failures = 0
@@ -0,0 +1,321 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import io
+import json
+import socket
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+from urllib.parse import unquote, urlencode, urlsplit
+
+import urllib3
+from urllib3.connection import HTTPConnection
+from urllib3._collections import HTTPHeaderDict
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.poolmanager import SSL_KEYWORDS
+
+from openapi_client.exceptions import ApiException, ApiValueError
+from openapi_client.multipart import MultipartEncoder
+from openapi_client.rest import RESTClientObject, RESTResponse
+
+
+class Transport(Protocol):
+    """What `ApiClient` needs to send a request.
+
+    `rest.RESTClientObject` (urllib3 over TCP) is the default; pass another
+    implementation as `ApiClient(transport=...)`. `_retries` is only passed
+    when a call has a deadline.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Any = None,
+        _retries: Any = None,
+    ) -> RESTResponse:
+        ...
+
+
+def encode_body(
+    method: str,
+    headers: Dict[str, str],
+    body: Any,
+    post_params: Any,
+) -> bytes:
+    """Encodes a request body the way `RESTClientObject.request` does.
+
+    Updates `headers` with the Content-Type of multipart bodies.
+    """
+    if post_params and body:
+        raise ApiValueError(
+            "body parameter cannot be used with post_params parameter."
+        )
+    if method not in ('POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE'):
+        return b''
+    content_type = headers.get('Content-Type')
+    if not content_type or 'json' in content_type.lower():
+        return b'' if body is None else json.dumps(body).encode('utf-8')
+    if content_type == 'application/x-www-form-urlencoded':
+        return urlencode(post_params or []).encode('utf-8')
+    if content_type == 'multipart/form-data':
+        encoder = MultipartEncoder(post_params or [])
+        headers['Content-Type'] = encoder.content_type
+        return b''.join(encoder)
+    if isinstance(body, str):
+        return body.encode('utf-8')
+    if isinstance(body, bytes):
+        return body
+    if content_type.startswith('text/') and isinstance(body, bool):
+        return b'true' if body else b'false'
+    raise ApiException(
+        status=0,
+        reason="Cannot prepare a request message for provided arguments.",
+    )
+
+
+def _total_timeout(timeout: Any) -> Optional[float]:
+    if isinstance(timeout, urllib3.Timeout):
+        timeout = timeout.total
+    if isinstance(timeout, (int, float)) and timeout:
+        return float(timeout)
+    return None
+
+
+class WSGITransport:
+    """Calls a WSGI application in-process, without sockets.
+
+    Useful to test or benchmark the SDK against a local Python app. The
+    host of request URLs only fills `SERVER_NAME` and `HTTP_HOST`.
+
+    :param app: The WSGI application.
+    """
+
+    def __init__(self, app: Callable[..., Any]) -> None:
+        self.app = app
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None, _retries=None) -> RESTResponse:
+        method = method.upper()
+        headers = dict(headers or {})
+        data = encode_body(method, headers, body, post_params)
+        parts = urlsplit(url)
+        environ = {
+            'REQUEST_METHOD': method,
+            'SCRIPT_NAME': '',
+            'PATH_INFO': unquote(parts.path) or '/',
+            'QUERY_STRING': parts.query,
+            'SERVER_NAME': parts.hostname or 'localhost',
+            'SERVER_PORT': str(parts.port or (443 if parts.scheme == 'https' else 80)),
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'HTTP_HOST': parts.netloc,
+            'CONTENT_LENGTH': str(len(data)),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': parts.scheme or 'http',
+            'wsgi.input': io.BytesIO(data),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        for name, value in headers.items():
+            key = name.upper().replace('-', '_')
+            if key == 'CONTENT_TYPE':
+                environ[key] = value
+            elif key != 'CONTENT_LENGTH':
+                environ['HTTP_' + key] = value
+
+        started: Dict[str, Any] = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            if exc_info is not None and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            started['status'] = status
+            started['headers'] = response_headers
+            return lambda chunk: chunks.append(chunk)
+
+        chunks: List[bytes] = []
+        result = self.app(environ, start_response)
+        try:
+            chunks.extend(result)
+        finally:
+            close = getattr(result, 'close', None)
+            if close is not None:
+                close()
+        code, _, reason = started['status'].partition(' ')
+        return RESTResponse.from_bytes(
+            int(code), b''.join(chunks),
+            HTTPHeaderDict(started['headers']), reason,
+        )
+
+
+class ASGITransport:
+    """Calls an ASGI application in-process, without sockets.
+
+    The application runs on an event loop owned by the transport, in a
+    background thread, so the synchronous client can be used from any
+    thread, including one that runs an event loop itself.
+
+    :param app: The ASGI 3 application.
+    :param client: `(host, port)` reported as the client address.
+    """
+
+    def __init__(self, app: Callable[..., Any],
+                 client: Tuple[str, int] = ('127.0.0.1', 0)) -> None:
+        self.app = app
+        self.client = client
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name='openapi-client-asgi', daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def close(self) -> None:
+        """Stops the event loop of the transport."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and thread is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None, _retries=None) -> RESTResponse:
+        method = method.upper()
+        headers = dict(headers or {})
+        data = encode_body(method, headers, body, post_params)
+        future = asyncio.run_coroutine_threadsafe(
+            self._call(method, url, headers, data), self._ensure_loop()
+        )
+        return future.result(_total_timeout(_request_timeout))
+
+    async def _call(self, method, url, headers, data) -> RESTResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+        raw_headers = [(b'host', parts.netloc.encode('latin-1'))]
+        raw_headers.extend(
+            (name.lower().encode('latin-1'), str(value).encode('latin-1'))
+            for name, value in headers.items()
+        )
+        raw_headers.append((b'content-length', str(len(data)).encode('ascii')))
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0', 'spec_version': '2.3'},
+            'http_version': '1.1',
+            'method': method,
+            'scheme': scheme,
+            'path': unquote(parts.path) or '/',
+            'raw_path': (parts.path or '/').encode('latin-1'),
+            'query_string': parts.query.encode('latin-1'),
+            'root_path': '',
+            'headers': raw_headers,
+            'server': (
+                parts.hostname or 'localhost',
+                parts.port or (443 if scheme == 'https' else 80),
+            ),
+            'client': self.client,
+        }
+        request_sent = False
+        response_complete = asyncio.Event()
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {'type': 'http.request', 'body': data, 'more_body': False}
+            await response_complete.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                start.update(message)
+            elif message['type'] == 'http.response.body':
+                chunks.append(message.get('body', b''))
+                if not message.get('more_body', False):
+                    response_complete.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_complete.set()
+        if 'status' not in start:
+            raise ApiException(status=0, reason="ASGI application sent no response")
+        response_headers = HTTPHeaderDict()
+        for name, value in start.get('headers', []):
+            response_headers.add(name.decode('latin-1'), value.decode('latin-1'))
+        return RESTResponse.from_bytes(start['status'], b''.join(chunks), response_headers)
+
+
+class UnixSocketTransport(RESTClientObject):
+    """urllib3 over a Unix domain socket, for local sidecars and proxies.
+
+    Every request goes to the socket at `path`, whatever the host of its
+    URL; the host is only sent in the `Host` header. Everything else
+    (pooling, retries, timeouts) behaves as with `RESTClientObject`, minus
+    the TCP and TLS handshakes.
+
+    :param path: Path of the Unix socket.
+    :param configuration: Configuration for the pool, as for
+      `RESTClientObject`.
+    """
+
+    def __init__(self, path: str, configuration) -> None:
+        super().__init__(configuration)
+        self.path = path
+
+        class UnixHTTPConnection(HTTPConnection):
+            def _new_conn(self) -> socket.socket:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    if isinstance(self.timeout, (int, float)):
+                        sock.settimeout(self.timeout)
+                    sock.connect(path)
+                except socket.timeout as e:
+                    sock.close()
+                    raise urllib3.exceptions.ConnectTimeoutError(
+                        self, "Connection to %s timed out" % path
+                    ) from e
+                except OSError as e:
+                    sock.close()
+                    raise urllib3.exceptions.NewConnectionError(
+                        self, "Failed to connect to %s: %s" % (path, e)
+                    ) from e
+                return sock
+
+        class UnixHTTPConnectionPool(HTTPConnectionPool):
+            ConnectionCls = UnixHTTPConnection
+
+            def __init__(self, host, port=None, **kw) -> None:
+                for keyword in SSL_KEYWORDS:
+                    kw.pop(keyword, None)
+                super().__init__(host, port, **kw)
+
+        self.pool_manager.pool_classes_by_scheme = self.pool_metrics.instrument({
+            'http': UnixHTTPConnectionPool,
+            'https': UnixHTTPConnectionPool,
+        })
@@ -0,0 +1,260 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Local metering of free-trial usage, reconciled with the Hub.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import logging
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.models.get_free_trial_status200_response import GetFreeTrialStatus200Response
+
+logger = logging.getLogger(__name__)
+
+CHAT = "chat"
+AUTOCOMPLETE = "autocomplete"
+FEATURES = (CHAT, AUTOCOMPLETE)
+
+
+class QuotaStatus(NamedTuple):
+    """Estimated free-trial usage of one feature.
+
+    `limit` is None until the first sync; quotas are then unknown and
+    not enforced.
+    """
+    feature: str
+    used: float
+    limit: Optional[float]
+    opted_in: bool
+    synced_at: Optional[float]
+
+    @property
+    def remaining(self) -> Optional[float]:
+        if self.limit is None:
+            return None
+        return max(self.limit - self.used, 0.0)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.limit is not None and self.used >= self.limit
+
+
+class _Counter:
+    """Usage of one feature: the Hub's count at the last sync plus what
+    this process recorded since."""
+
+    __slots__ = ('synced', 'limit', 'pending', 'external_rate', 'rate')
+
+    def __init__(self) -> None:
+        self.synced: float = 0.0
+        self.limit: Optional[float] = None
+        self.pending: float = 0.0
+        # usage per second by other processes and devices, and in total
+        self.external_rate = 0.0
+        self.rate = 0.0
+
+
+class UsageMeter:
+    """Counts chat and autocomplete usage locally, so free-trial quota
+    checks do not need a `get_free_trial_status` call.
+
+    `record` counts usage as it happens. `sync` fetches the Hub's
+    counters and makes them the new baseline; usage recorded while the
+    call is in flight stays pending on top of it. Between syncs the
+    estimate also extrapolates the usage of other processes and devices
+    of the user, at the rate the Hub's counters grew beyond the local
+    recordings.
+
+    When started, a daemon thread syncs every `max_interval` seconds,
+    sooner as the quota would run out at the observed rate (so that at
+    least two syncs happen before it does), and every `min_interval`
+    once the usage of a feature passes `near_limit` of its limit.
+
+    :param api: DefaultApi used for `get_free_trial_status`; a default
+      one if not given.
+    :param min_interval: Seconds between syncs near a limit.
+    :param max_interval: Seconds between syncs far from any limit.
+    :param near_limit: Fraction of a limit from which `min_interval`
+      applies.
+    :param smoothing: Weight of the newest sample in the moving averages
+      of the usage rates.
+    """
+
+    def __init__(
+        self,
+        api: Optional[DefaultApi] = None,
+        min_interval: float = 10.0,
+        max_interval: float = 600.0,
+        near_limit: float = 0.9,
+        smoothing: float = 0.5,
+    ) -> None:
+        self.api = api if api is not None else DefaultApi()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.near_limit = near_limit
+        self.smoothing = smoothing
+        self.opted_in = False
+        self.syncs = 0
+        self._counters: Dict[str, _Counter] = {feature: _Counter() for feature in FEATURES}
+        self._synced_at: Optional[float] = None
+        self._last_attempt: Optional[float] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _counter(self, feature: str) -> _Counter:
+        counter = self._counters.get(feature)
+        if counter is None:
+            raise ValueError(
+                "Unknown feature {0}, must be one of {1}".format(feature, FEATURES)
+            )
+        return counter
+
+    def _estimate(self, counter: _Counter, now: float) -> float:
+        used = counter.synced + counter.pending
+        if self._synced_at is not None:
+            used += counter.external_rate * (now - self._synced_at)
+        return used
+
+    def record(self, feature: str, count: float = 1) -> None:
+        """Counts usage of `CHAT` or `AUTOCOMPLETE`."""
+        counter = self._counter(feature)
+        with self._lock:
+            counter.pending += count
+            near = (
+                counter.limit is not None
+                and self._estimate(counter, time.monotonic()) >= self.near_limit * counter.limit
+            )
+        if near:
+            # let the polling thread switch to `min_interval` at once
+            self._wake.set()
+
+    def status(self, feature: str) -> QuotaStatus:
+        """Returns the estimated usage of a feature, without any call."""
+        counter = self._counter(feature)
+        with self._lock:
+            return QuotaStatus(
+                feature=feature,
+                used=self._estimate(counter, time.monotonic()),
+                limit=counter.limit,
+                opted_in=self.opted_in,
+                synced_at=self._synced_at,
+            )
+
+    def remaining(self, feature: str) -> Optional[float]:
+        """Returns the estimated remaining quota, or None before the
+        first sync."""
+        return self.status(feature).remaining
+
+    def allows(self, feature: str, count: float = 1) -> bool:
+        """Returns whether `count` more uses fit in the estimated quota;
+        True while the quota is unknown."""
+        status = self.status(feature)
+        return status.limit is None or status.used + count <= status.limit
+
+    def sync(self, **kwargs: Any) -> GetFreeTrialStatus200Response:
+        """Calls `get_free_trial_status` and reconciles the counters.
+
+        :param kwargs: Keyword arguments for `get_free_trial_status`, such
+          as `_request_timeout`.
+        """
+        started = time.monotonic()
+        with self._lock:
+            self._last_attempt = started
+            sent = {feature: counter.pending for feature, counter in self._counters.items()}
+        response = self.api.get_free_trial_status(**kwargs)
+        counts = {CHAT: response.chat_count, AUTOCOMPLETE: response.autocomplete_count}
+        limits = {CHAT: response.chat_limit, AUTOCOMPLETE: response.autocomplete_limit}
+        with self._lock:
+            previous = self._synced_at
+            for feature, counter in self._counters.items():
+                server = float(counts[feature] or 0)
+                if previous is not None and started > previous:
+                    elapsed = started - previous
+                    growth = max(server - counter.synced, 0.0)
+                    external = max(growth - sent[feature], 0.0)
+                    counter.external_rate = self._smooth(counter.external_rate, external / elapsed)
+                    counter.rate = self._smooth(counter.rate, max(growth, sent[feature]) / elapsed)
+                counter.synced = server
+                counter.limit = float(limits[feature])
+                # recordings made after the call started are not in `server`
+                counter.pending = max(counter.pending - sent[feature], 0.0)
+            self._synced_at = started
+            self.opted_in = response.opted_in_to_free_trial
+            self.syncs += 1
+        return response
+
+    def _smooth(self, average: float, sample: float) -> float:
+        return average + self.smoothing * (sample - average)
+
+    def next_interval(self) -> float:
+        """Returns the seconds until the next sync is due."""
+        now = time.monotonic()
+        interval = self.max_interval
+        with self._lock:
+            if self._synced_at is None:
+                return self.min_interval
+            for counter in self._counters.values():
+                if counter.limit is None:
+                    continue
+                used = self._estimate(counter, now)
+                if used >= self.near_limit * counter.limit:
+                    return self.min_interval
+                if counter.rate > 0:
+                    interval = min(interval, (counter.limit - used) / counter.rate / 2)
+        return max(interval, self.min_interval)
+
+    def start(self) -> None:
+        """Starts syncing on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="openapi-client-usage-meter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the syncing thread."""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "UsageMeter":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            # cleared first, so a `record` reaching the limit meanwhile
+            # cuts the wait short
+            self._wake.clear()
+            # a `stop` between the loop check and the clear lost its wake-up
+            if self._stop.is_set():
+                break
+            last_attempt = self._last_attempt
+            if last_attempt is not None:
+                delay = last_attempt + self.next_interval() - time.monotonic()
+                if delay > 0:
+                    self._wake.wait(delay)
+                    continue
+            try:
+                self.sync()
+            except Exception:
+                # retried after `next_interval`, from the failed attempt
+                logger.warning("Syncing free trial usage failed", exc_info=True)
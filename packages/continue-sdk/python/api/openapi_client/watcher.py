@@ -0,0 +1,324 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import hashlib
+import heapq
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_response import ApiResponse
+from openapi_client.exceptions import ApiException
+from openapi_client.models.get_policy200_response import GetPolicy200Response
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.list_organizations200_response_organizations_inner import (
+    ListOrganizations200ResponseOrganizationsInner,
+)
+
+logger = logging.getLogger(__name__)
+
+ASSISTANTS = "assistants"
+POLICY = "policy"
+ORGANIZATIONS = "organizations"
+RESOURCES = (ASSISTANTS, POLICY, ORGANIZATIONS)
+
+AssistantKey = Tuple[str, str]
+
+
+class AssistantsDiff(NamedTuple):
+    """Changes between two `list_assistants` results, keyed by slugs."""
+
+    added: List[ListAssistants200ResponseInner]
+    removed: List[ListAssistants200ResponseInner]
+    changed: List[Tuple[ListAssistants200ResponseInner, ListAssistants200ResponseInner]]
+
+
+class PolicyDiff(NamedTuple):
+    """The previous and current `get_policy` results."""
+
+    previous: Optional[GetPolicy200Response]
+    current: Optional[GetPolicy200Response]
+
+
+class OrganizationsDiff(NamedTuple):
+    """Changes between two `list_organizations` results, keyed by id."""
+
+    added: List[ListOrganizations200ResponseOrganizationsInner]
+    removed: List[ListOrganizations200ResponseOrganizationsInner]
+    changed: List[Tuple[
+        ListOrganizations200ResponseOrganizationsInner,
+        ListOrganizations200ResponseOrganizationsInner,
+    ]]
+
+
+class HubSnapshot(NamedTuple):
+    """The latest known state of every watched resource.
+
+    A resource that has not been fetched yet is `None`.
+    """
+
+    assistants: Optional[Dict[AssistantKey, ListAssistants200ResponseInner]] = None
+    policy: Optional[GetPolicy200Response] = None
+    organizations: Optional[Dict[str, ListOrganizations200ResponseOrganizationsInner]] = None
+
+
+def _keyed_diff(previous, current, diff_type):
+    previous = previous or {}
+    added = [value for key, value in current.items() if key not in previous]
+    removed = [value for key, value in previous.items() if key not in current]
+    changed = [
+        (previous[key], value)
+        for key, value in current.items()
+        if key in previous and previous[key] != value
+    ]
+    return diff_type(added, removed, changed)
+
+
+class _WatchedResource:
+    """Polling state of one resource."""
+
+    __slots__ = ('name', 'etag', 'digest', 'interval', 'callbacks')
+
+    def __init__(self, name: str, interval: float) -> None:
+        self.name = name
+        self.etag: Optional[str] = None
+        self.digest: Optional[bytes] = None
+        self.interval = interval
+        self.callbacks: List[Callable[[Any], None]] = []
+
+
+class HubWatcher:
+    """Keeps assistants, policy and organizations warm for a whole process.
+
+    A single watcher replaces independent pollers of `list_assistants`,
+    `get_policy` and `list_organizations`. Each resource is polled with a
+    conditional request (`If-None-Match` with the last `ETag`, falling back
+    to a hash of the body when the server sends none). While nothing
+    changes its interval grows by `backoff` up to `max_interval`; a change
+    resets it to `min_interval`. Every interval is jittered so a fleet of
+    watchers does not poll in lockstep.
+
+    Subscribers registered with `subscribe` receive an `AssistantsDiff`,
+    `PolicyDiff` or `OrganizationsDiff` whenever the shared `snapshot`
+    changes. Callbacks run on the polling thread, or on the thread calling
+    `poll`. Polls, scheduled or through `poll`, run one at a time.
+
+    :param api: DefaultApi to poll with; a default one if not given.
+    :param resources: Names of the resources to watch.
+    :param organization_id: Organization to scope `list_assistants` to.
+    :param always_use_proxy: Passed through to `list_assistants`.
+    :param min_interval: Seconds between polls right after a change.
+    :param max_interval: Upper bound of the polling interval.
+    :param backoff: Factor applied to the interval after an unchanged poll.
+    :param jitter: Relative random spread applied to each interval.
+    """
+
+    def __init__(
+        self,
+        api: Optional[DefaultApi] = None,
+        resources: Iterable[str] = RESOURCES,
+        organization_id: Optional[str] = None,
+        always_use_proxy: Optional[str] = None,
+        min_interval: float = 30.0,
+        max_interval: float = 600.0,
+        backoff: float = 2.0,
+        jitter: float = 0.2,
+    ) -> None:
+        self.api = api if api is not None else DefaultApi()
+        self.organization_id = organization_id
+        self.always_use_proxy = always_use_proxy
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+
+        self._resources: Dict[str, _WatchedResource] = {}
+        for name in resources:
+            if name not in RESOURCES:
+                raise ValueError(
+                    "Unknown resource {0}, must be one of {1}".format(name, RESOURCES)
+                )
+            self._resources[name] = _WatchedResource(name, min_interval)
+        self._snapshot = HubSnapshot()
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> HubSnapshot:
+        """The shared, immutable snapshot of the latest state."""
+        return self._snapshot
+
+    def subscribe(self, resource: str, callback: Callable[[Any], None]) -> Callable[[], None]:
+        """Registers a callback invoked with the diff of each change.
+
+        :param resource: One of `ASSISTANTS`, `POLICY` or `ORGANIZATIONS`.
+        :param callback: Called with the resource's diff type.
+        :return: A function that removes the subscription.
+        """
+        watched = self._resources.get(resource)
+        if watched is None:
+            raise ValueError("Resource {0} is not watched".format(resource))
+        with self._lock:
+            watched.callbacks.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in watched.callbacks:
+                    watched.callbacks.remove(callback)
+
+        return unsubscribe
+
+    def poll(self, resource: Optional[str] = None) -> bool:
+        """Polls now, outside of the schedule.
+
+        :param resource: Resource to poll, or all watched resources if None.
+        :return: Whether anything changed.
+        """
+        names = [resource] if resource is not None else list(self._resources)
+        changed = False
+        for name in names:
+            changed = self._poll(self._resources[name]) or changed
+        return changed
+
+    def start(self) -> None:
+        """Starts polling on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="openapi-client-hub-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the polling thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "HubWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def _jittered(self, interval: float) -> float:
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _run(self) -> None:
+        # spread the first polls too, so restarted fleets do not burst
+        now = time.monotonic()
+        schedule = [
+            (now + random.uniform(0, self.jitter * self.min_interval), name)
+            for name in self._resources
+        ]
+        heapq.heapify(schedule)
+        while schedule:
+            due, name = schedule[0]
+            if self._stop.wait(max(due - time.monotonic(), 0.0)):
+                return
+            heapq.heappop(schedule)
+            watched = self._resources[name]
+            try:
+                self._poll(watched)
+            except Exception:
+                logger.warning("Polling %s failed", name, exc_info=True)
+                with self._lock:
+                    self._unchanged(watched)
+            heapq.heappush(
+                schedule,
+                (time.monotonic() + self._jittered(watched.interval), name),
+            )
+
+    def _fetch(self, name: str, headers: Dict[str, str]) -> ApiResponse[Any]:
+        if name == ASSISTANTS:
+            return self.api.list_assistants_with_http_info(
+                always_use_proxy=self.always_use_proxy,
+                organization_id=self.organization_id,
+                _headers=headers,
+            )
+        elif name == POLICY:
+            return self.api.get_policy_with_http_info(_headers=headers)
+        return self.api.list_organizations_with_http_info(_headers=headers)
+
+    def _poll(self, watched: _WatchedResource) -> bool:
+        # the whole fetch-compare-update runs under the lock, so a poll
+        # never applies a response older than the one applied before it
+        with self._lock:
+            headers = {'Accept': 'application/json'}
+            if watched.etag:
+                headers['If-None-Match'] = watched.etag
+            try:
+                response = self._fetch(watched.name, headers)
+            except ApiException as e:
+                if e.status != 304:
+                    raise
+                return self._unchanged(watched)
+
+            digest = hashlib.sha256(response.raw_data).digest()
+            if digest == watched.digest:
+                return self._unchanged(watched)
+            watched.digest = digest
+            if response.headers is not None:
+                watched.etag = response.headers.get('ETag')
+
+            diff = self._apply(watched.name, response.data)
+            if diff is None:
+                # the body changed but not in a way the models care about
+                return self._unchanged(watched)
+            watched.interval = self.min_interval
+            callbacks = list(watched.callbacks)
+        for callback in callbacks:
+            try:
+                callback(diff)
+            except Exception:
+                logger.exception("HubWatcher callback for %s failed", watched.name)
+        return True
+
+    def _unchanged(self, watched: _WatchedResource) -> bool:
+        watched.interval = min(watched.interval * self.backoff, self.max_interval)
+        return False
+
+    def _apply(self, name: str, data: Any) -> Any:
+        """Stores fetched data in the snapshot and returns its diff, or
+        None if the parsed data is equal to the snapshot."""
+        snapshot = self._snapshot
+        if name == ASSISTANTS:
+            assistants = {
+                (assistant.owner_slug, assistant.package_slug): assistant
+                for assistant in data or []
+            }
+            diff: Any = _keyed_diff(snapshot.assistants, assistants, AssistantsDiff)
+            self._snapshot = snapshot._replace(assistants=assistants)
+        elif name == POLICY:
+            diff = PolicyDiff(snapshot.policy, data)
+            self._snapshot = snapshot._replace(policy=data)
+            if snapshot.policy == data and snapshot.policy is not None:
+                return None
+        else:
+            organizations = {
+                organization.id: organization
+                for organization in (data.organizations if data else [])
+            }
+            diff = _keyed_diff(snapshot.organizations, organizations, OrganizationsDiff)
+            self._snapshot = snapshot._replace(organizations=organizations)
+        if isinstance(diff, (AssistantsDiff, OrganizationsDiff)) \
+                and not (diff.added or diff.removed or diff.changed) \
+                and getattr(snapshot, name) is not None:
+            return None
+        return diff
@@ -46,4 +46,9 @@ setup(
     API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains. 
     """,  # noqa: E501
     package_data={"openapi_client": ["py.typed"]},
+    entry_points={
+        "console_scripts": [
+            "openapi-client-loadgen = openapi_client.loadgen:main",
+        ],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,186 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    Fake Hub and REST clients shared by the unit tests.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import gzip
+import json
+import threading
+import time
+from typing import NamedTuple
+from urllib.parse import parse_qs
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.rest import RESTResponse
+from openapi_client.transport import WSGITransport
+
+HOST = "http://hub.test"
+
+
+def assistant(owner, package, config=None, raw_yaml=None):
+    """Returns the JSON of an assistant as listed by the Hub."""
+    payload = {
+        "configResult": {"config": config or {}, "configLoadInterrupted": False},
+        "ownerSlug": owner,
+        "packageSlug": package,
+    }
+    if raw_yaml is not None:
+        payload["rawYaml"] = raw_yaml
+    return payload
+
+
+def json_response(status, payload, headers=None):
+    """Returns a preloaded JSON `RESTResponse`; `payload` may be bytes."""
+    if not isinstance(payload, bytes):
+        payload = json.dumps(payload).encode()
+    return RESTResponse.from_bytes(
+        status, payload, dict(headers or {}, **{'Content-Type': 'application/json'})
+    )
+
+
+def hub_api(app, **kwargs):
+    """Returns a `DefaultApi` talking to the WSGI `app` at `HOST`."""
+    configuration = Configuration(host=HOST, **kwargs)
+    return DefaultApi(ApiClient(configuration, transport=WSGITransport(app)))
+
+
+class FakeHub:
+    """WSGI app serving the IDE endpoints from memory.
+
+    `assistants` maps an organization id, or None for the personal
+    assistants, to the listed assistant JSON; the organizations are its
+    keys. Listing an organization in `failing` answers its status code.
+    """
+
+    def __init__(self, assistants=None, policy=None, free_trial_status=None,
+                 delay=0.0, compress=False) -> None:
+        self.assistants = assistants if assistants is not None else {}
+        self.policy = policy if policy is not None else {}
+        self.free_trial_status = free_trial_status
+        self.delay = delay
+        self.compress = compress
+        self.failing = {}
+        self.listed = []
+        self.sync_requests = []
+        self.sync_failures = 0
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            status, payload = self.handle(environ)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        headers = [('Content-Type', 'application/json')]
+        data = json.dumps(payload).encode()
+        if self.compress:
+            data = gzip.compress(data)
+            headers.append(('Content-Encoding', 'gzip'))
+        start_response('%d X' % status, headers)
+        return [data]
+
+    def handle(self, environ):
+        path = environ['PATH_INFO']
+        if path == '/ide/policy':
+            return 200, {"policy": self.policy, "orgSlug": "acme"}
+        if path == '/ide/free-trial-status' and self.free_trial_status is not None:
+            return 200, self.free_trial_status
+        if path == '/ide/list-organizations':
+            return 200, {"organizations": [
+                {"id": org, "name": org, "slug": org} for org in self.assistants if org
+            ]}
+        if path == '/ide/list-assistants':
+            org = parse_qs(environ['QUERY_STRING']).get('organizationId', [None])[0]
+            with self.lock:
+                self.listed.append(org)
+            if org in self.failing:
+                return self.failing[org], {"message": "unavailable"}
+            return 200, self.assistants.get(org, [])
+        if path.startswith('/ide/get-assistant/'):
+            owner, package = path.split('/')[3:5]
+            for assistants in list(self.assistants.values()):
+                for listed in assistants:
+                    if (listed["ownerSlug"], listed["packageSlug"]) == (owner, package):
+                        return 200, listed
+        if path == '/ide/sync-secrets':
+            return self.sync_secrets(
+                json.loads(environ['wsgi.input'].read(int(environ['CONTENT_LENGTH'])))
+            )
+        return 404, {"message": "not found"}
+
+    def sync_secrets(self, body):
+        """Resolves every FQSN to a user secret named after it."""
+        with self.lock:
+            self.sync_requests.append(body)
+            if self.sync_failures:
+                self.sync_failures -= 1
+                return 500, {}
+        return 200, [
+            {"found": True, "fqsn": fqsn, "value": "v-" + fqsn["secretName"],
+             "secretLocation": {"secretType": "user", "userSlug": "me",
+                                "secretName": fqsn["secretName"]}}
+            for fqsn in body["fqsns"]
+        ]
+
+
+class FakeRequest(NamedTuple):
+    method: str
+    url: str
+    headers: dict
+    body: object
+    timeout: object
+    retries: object
+
+
+class FakeRestClient:
+    """Stands in for `ApiClient.rest_client`, recording every request.
+
+    Answers `status` with the JSON `body` unless a subclass overrides
+    `respond`.
+    """
+
+    def __init__(self, status=200, body=b'{"policy": {}}', headers=None) -> None:
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.requests = []
+        self.responses = {}
+        self.lock = threading.Lock()
+
+    @property
+    def calls(self):
+        return len(self.requests)
+
+    @property
+    def urls(self):
+        return [request.url for request in self.requests]
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None, _retries=None):
+        request = FakeRequest(method, url, headers or {}, body, _request_timeout, _retries)
+        with self.lock:
+            self.requests.append(request)
+            call = len(self.requests)
+        response = self.respond(request, call)
+        with self.lock:
+            self.responses[call] = response
+        return response
+
+    def respond(self, request, call):
+        return json_response(self.status, self.body, self.headers)
@@ -0,0 +1,162 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import datetime
+import decimal
+import unittest
+from enum import Enum
+
+from pydantic import SecretStr
+
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import ApiValueError
+from openapi_client.models.get_policy200_response import GetPolicy200Response
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class TestApiClient(unittest.TestCase):
+    """ApiClient unit tests"""
+
+    def setUp(self) -> None:
+        self.client = ApiClient(Configuration())
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_sanitize_returns_json_safe_containers_without_copying(self) -> None:
+        body = {"a": [1, 2.5, {"b": "c", "d": None}], "e": (True, "f")}
+        self.assertIs(self.client.sanitize_for_serialization(body), body)
+
+    def test_sanitize_converts_nested_values(self) -> None:
+        body = {
+            "when": [datetime.date(2024, 1, 2), {"at": datetime.datetime(2024, 1, 2, 3, 4)}],
+            "color": Color.RED,
+            "secret": SecretStr("hunter2"),
+            "amount": decimal.Decimal("1.50"),
+            "pair": (Color.RED, 1),
+            "plain": {"x": 1},
+        }
+        self.assertEqual(
+            self.client.sanitize_for_serialization(body),
+            {
+                "when": ["2024-01-02", {"at": "2024-01-02T03:04:00"}],
+                "color": "red",
+                "secret": "hunter2",
+                "amount": "1.50",
+                "pair": ("red", 1),
+                "plain": {"x": 1},
+            },
+        )
+        # the input is left untouched, unchanged branches are shared
+        self.assertIs(body["color"], Color.RED)
+        self.assertIs(self.client.sanitize_for_serialization(body)["plain"], body["plain"])
+
+    def test_sanitize_model(self) -> None:
+        fqsns = [{"packageSlugs": [{"ownerSlug": "o", "packageSlug": "p"}], "secretName": "KEY"}]
+        request = SyncSecretsRequest(fqsns=fqsns, orgScopeId="org")
+        self.assertEqual(
+            self.client.sanitize_for_serialization({"body": [request]}),
+            {"body": [{"fqsns": fqsns, "orgScopeId": "org"}]},
+        )
+
+    def test_sanitize_deeply_nested(self) -> None:
+        body: list = []
+        node = body
+        for _ in range(10000):
+            child: list = []
+            node.append(child)
+            node = child
+        node.append(Color.RED)
+        result = self.client.sanitize_for_serialization(body)
+        for _ in range(10000):
+            result = result[0]
+        self.assertEqual(result, ["red"])
+
+    def test_sanitize_circular_reference(self) -> None:
+        body: dict = {}
+        body["self"] = [body, Color.RED]
+        with self.assertRaises(ApiValueError):
+            self.client.sanitize_for_serialization(body)
+
+    def test_param_serialize_renders_path_and_query(self) -> None:
+        for _ in range(2):
+            method, url, headers, body, post_params = self.client.param_serialize(
+                'GET',
+                '/ide/get-assistant/{ownerSlug}/{packageSlug}',
+                path_params={'ownerSlug': 'my org', 'packageSlug': 'a/b'},
+                query_params=[('organizationId', 'x&y'), ('limit', 10)],
+                header_params={'Accept': 'application/json'},
+            )
+            self.assertEqual(
+                url,
+                'https://api.continue.dev/ide/get-assistant/my%20org/a%2Fb'
+                '?organizationId=x%26y&limit=10'
+            )
+            self.assertEqual(headers['Accept'], 'application/json')
+            self.assertEqual(headers['User-Agent'], 'OpenAPI-Generator/1.0.0/python')
+
+    def test_param_serialize_refreshes_static_headers(self) -> None:
+        self.client.param_serialize('GET', '/ide/policy')
+        self.client.set_default_header('X-Trace', 'abc')
+        self.client.cookie = 'session=1'
+        _, _, headers, _, _ = self.client.param_serialize('GET', '/ide/policy')
+        self.assertEqual(headers['X-Trace'], 'abc')
+        self.assertEqual(headers['Cookie'], 'session=1')
+
+    def test_param_serialize_rerenders_auth_when_token_changes(self) -> None:
+        self.client.configuration.access_token = 'first'
+        _, _, headers, _, _ = self.client.param_serialize(
+            'GET', '/ide/policy', query_params=[], auth_settings=['apiKeyAuth']
+        )
+        self.assertEqual(headers['Authorization'], 'Bearer first')
+        self.client.configuration.access_token = 'second'
+        _, _, headers, _, _ = self.client.param_serialize(
+            'GET', '/ide/policy', query_params=[], auth_settings=['apiKeyAuth']
+        )
+        self.assertEqual(headers['Authorization'], 'Bearer second')
+
+    def test_param_serialize_request_auth_overrides_configuration(self) -> None:
+        self.client.configuration.access_token = 'configured'
+        _, _, headers, _, _ = self.client.param_serialize(
+            'GET', '/ide/policy', query_params=[], auth_settings=['apiKeyAuth'],
+            _request_auth={
+                'in': 'header', 'type': 'bearer', 'key': 'Authorization',
+                'value': 'Bearer override',
+            },
+        )
+        self.assertEqual(headers['Authorization'], 'Bearer override')
+
+    def test_deserialize_optional_types(self) -> None:
+        self.assertEqual(
+            self.client.deserialize('[{"found": true}, null]', 'List[Optional[object]]',
+                                    'application/json'),
+            [{"found": True}, None],
+        )
+        self.assertEqual(
+            self.client.deserialize('{"a": 1, "b": null}', 'Dict[str, Optional[int]]',
+                                    'application/json'),
+            {"a": 1, "b": None},
+        )
+        policy = self.client.deserialize('{"orgSlug": "acme"}', 'Optional[GetPolicy200Response]',
+                                         'application/json')
+        self.assertIsInstance(policy, GetPolicy200Response)
+        self.assertIsNone(
+            self.client.deserialize('null', 'Optional[GetPolicy200Response]', 'application/json')
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import unittest
+
+from openapi_client.assistant_index import AssistantIndex, config_terms
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from test import fakes
+
+
+def assistant(owner, package, models=(), mcp_servers=(), context=()):
+    return fakes.assistant(owner, package, config={
+        "name": package,
+        "models": [
+            {"name": name, "provider": provider, "model": model}
+            for name, provider, model in models
+        ],
+        "mcpServers": [{"name": name, "command": "npx"} for name in mcp_servers],
+        "context": [{"provider": provider} for provider in context],
+    })
+
+
+class TestAssistantIndex(unittest.TestCase):
+    """AssistantIndex unit tests"""
+
+    def setUp(self) -> None:
+        self.index = AssistantIndex()
+        self.index.sync([
+            assistant('acme', 'chat', models=[("Sonnet", "anthropic", "claude-sonnet-4")],
+                      context=["code", "diff"]),
+            assistant('acme', 'ops', models=[("GPT", "openai", "gpt-4o")], mcp_servers=["github"]),
+        ], scope='org1')
+        self.index.sync([
+            assistant('beta', 'bot', models=[("Sonnet", "anthropic", "claude-sonnet-4")]),
+        ], scope='org2')
+
+    def test_lookups(self) -> None:
+        self.assertEqual(self.index.by_provider("anthropic"), {('acme', 'chat'), ('beta', 'bot')})
+        self.assertEqual(self.index.by_model("gpt-4o"), {('acme', 'ops')})
+        self.assertEqual(
+            self.index.find('model_name', "Sonnet"), {('acme', 'chat'), ('beta', 'bot')}
+        )
+        self.assertEqual(self.index.by_mcp_server("github"), {('acme', 'ops')})
+        self.assertEqual(self.index.by_context_provider("diff"), {('acme', 'chat')})
+        self.assertEqual(self.index.by_model("unknown"), frozenset())
+        self.assertEqual(self.index.values('provider'), {"anthropic", "openai"})
+        self.assertEqual(len(self.index), 3)
+        with self.assertRaises(ValueError):
+            self.index.find('color', 'blue')
+
+    def test_update_changes_postings(self) -> None:
+        before = self.index.by_provider("openai")
+        self.index.update([
+            assistant('acme', 'ops', models=[("Sonnet", "anthropic", "claude-sonnet-4")]),
+        ], scope='org1')
+        self.assertEqual(self.index.by_provider("openai"), frozenset())
+        self.assertNotIn("openai", self.index.values('provider'))
+        self.assertEqual(len(self.index.by_provider("anthropic")), 3)
+        # results held by readers are not mutated
+        self.assertEqual(before, {('acme', 'ops')})
+
+    def test_sync_removes_absent_assistants(self) -> None:
+        self.index.sync([
+            assistant('acme', 'chat', models=[("Sonnet", "anthropic", "claude-sonnet-4")]),
+            assistant('beta', 'bot', models=[("Sonnet", "anthropic", "claude-sonnet-4")]),
+        ], scope='org1')
+        self.assertNotIn(('acme', 'ops'), self.index)
+        self.assertEqual(self.index.by_mcp_server("github"), frozenset())
+        self.assertEqual(self.index.by_context_provider("code"), frozenset())
+        # listed by both organizations, so it stays while either lists it
+        self.index.sync([], scope='org2')
+        self.assertIn(('beta', 'bot'), self.index)
+        self.index.sync([], scope='org1')
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.values('model'), frozenset())
+
+    def test_remove_and_models(self) -> None:
+        self.index.remove(('beta', 'bot'))
+        self.assertEqual(self.index.by_provider("anthropic"), {('acme', 'chat')})
+        model = ListAssistants200ResponseInner.from_dict(
+            assistant('beta', 'bot', models=[("L", "ollama", "llama3")])
+        )
+        self.index.update([model])
+        self.assertEqual(self.index.by_provider("ollama"), {('beta', 'bot')})
+        self.assertEqual(config_terms(None), frozenset())
+
+    def test_refresh(self) -> None:
+        assistants = {
+            None: [assistant('me', 'mine', models=[("M", "mistral", "codestral")])],
+            'org1': [assistant('acme', 'chat', models=[("GPT", "openai", "gpt-4o")])],
+        }
+        api = fakes.hub_api(fakes.FakeHub(assistants))
+        index = AssistantIndex()
+        self.assertEqual(index.refresh(api), {})
+        self.assertEqual(index.by_provider("mistral"), {('me', 'mine')})
+        self.assertEqual(index.by_model("gpt-4o"), {('acme', 'chat')})
+        api.api_client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import threading
+import time
+import unittest
+from urllib.parse import parse_qs, urlsplit
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.bulk import get_assistants_bulk, list_assistants_for_all_orgs
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import NotFoundException
+from openapi_client.rest import RESTResponse
+
+
+def json_response(status, payload):
+    return RESTResponse.from_bytes(
+        status, json.dumps(payload).encode(), {'Content-Type': 'application/json'}
+    )
+
+
+def assistant(owner_slug, package_slug):
+    return {
+        "configResult": {"config": {}, "configLoadInterrupted": False},
+        "ownerSlug": owner_slug,
+        "packageSlug": package_slug,
+    }
+
+
+class FakeRestClient:
+    """Answers Hub requests from memory and records peak concurrency."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def request(self, method, url, headers=None, body=None, post_params=None,
+                _request_timeout=None):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(0.01)
+            parts = urlsplit(url)
+            if parts.path == '/ide/list-organizations':
+                body = {"organizations": [
+                    {"id": "org-%d" % i, "name": "Org %d" % i, "slug": "org-%d" % i}
+                    for i in range(3)
+                ]}
+            elif parts.path == '/ide/list-assistants':
+                org = parse_qs(parts.query).get('organizationId', ['personal'])[0]
+                if org == 'org-1':
+                    return json_response(404, {"message": "gone"})
+                body = [assistant(org, "a")]
+            else:
+                _, _, _, owner_slug, package_slug = parts.path.split('/')
+                if package_slug == 'missing':
+                    return json_response(404, {"message": "gone"})
+                body = assistant(owner_slug, package_slug)
+            return json_response(200, body)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestBulk(unittest.TestCase):
+    """Bulk operations unit tests"""
+
+    def setUp(self) -> None:
+        self.client = ApiClient(Configuration(access_token="token"), pool_threads=8)
+        self.rest = FakeRestClient()
+        self.client.rest_client = self.rest
+        self.api = DefaultApi(self.client)
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def test_get_assistants_bulk(self) -> None:
+        slugs = [("acme", "p%d" % i) for i in range(20)] + [("acme", "missing")]
+        result = get_assistants_bulk(self.api, slugs, max_concurrency=3)
+        self.assertEqual([item.key for item in result], slugs)
+        self.assertEqual([a.package_slug for a in result.values], ["p%d" % i for i in range(20)])
+        self.assertIsInstance(result.errors[("acme", "missing")], NotFoundException)
+        self.assertLessEqual(self.rest.peak, 3)
+        with self.assertRaises(NotFoundException):
+            result.raise_for_errors()
+
+    def test_list_assistants_for_all_orgs(self) -> None:
+        result = list_assistants_for_all_orgs(self.api)
+        self.assertEqual([item.key for item in result], [None, "org-0", "org-1", "org-2"])
+        self.assertFalse(result.ok)
+        self.assertEqual(list(result.errors), ["org-1"])
+        self.assertEqual(result[2 + 1].value[0].owner_slug, "org-2")
+
+    def test_without_personal(self) -> None:
+        result = list_assistants_for_all_orgs(self.api, include_personal=False)
+        self.assertEqual([item.key for item in result], ["org-0", "org-1", "org-2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import gzip
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.cassette import Cassette, RecordingTransport, ReplayTransport
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import ApiException, NotFoundException
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.transport import WSGITransport
+from test.fakes import HOST, FakeHub
+
+
+def sync_request(org_scope_id):
+    return SyncSecretsRequest(
+        fqsns=[{"packageSlugs": [], "secretName": "KEY"}], orgScopeId=org_scope_id
+    )
+
+
+def with_cookie(app):
+    """Wraps a WSGI app to set a session cookie on every response."""
+    def cookie_app(environ, start_response):
+        def start(status, headers):
+            return start_response(status, headers + [('Set-Cookie', 'session=secret-cookie')])
+        return app(environ, start)
+    return cookie_app
+
+
+class TestCassette(unittest.TestCase):
+    """cassette unit tests"""
+
+    def setUp(self) -> None:
+        fd, self.path = tempfile.mkstemp(suffix='.jsonl.gz')
+        os.close(fd)
+        self.configuration = Configuration(host=HOST, access_token="secret-token")
+        self.hub = FakeHub(compress=True)
+
+    def tearDown(self) -> None:
+        os.unlink(self.path)
+
+    def client(self, transport):
+        return ApiClient(self.configuration, transport=transport)
+
+    def record(self, **kwargs):
+        recorder = RecordingTransport(
+            self.path, WSGITransport(with_cookie(self.hub)), **kwargs
+        )
+        api = DefaultApi(self.client(recorder))
+        self.hub.policy = {"allowAnonymousTelemetry": 1}
+        first = api.get_policy().policy
+        self.hub.policy = {"allowAnonymousTelemetry": 2}
+        second = api.get_policy().policy
+        with self.assertRaises(NotFoundException):
+            api.get_assistant("acme", "missing")
+        api.sync_secrets_without_preload_content(sync_request("org1"))
+        recorder.close()
+        return first, second
+
+    def test_record_and_replay(self) -> None:
+        recorded = self.record(redact_bodies=())
+        self.assertEqual(recorded, (
+            {"allowAnonymousTelemetry": 1}, {"allowAnonymousTelemetry": 2}
+        ))
+
+        replay = ReplayTransport(self.path)
+        api = DefaultApi(self.client(replay))
+        self.assertEqual(
+            (api.get_policy().policy, api.get_policy().policy, api.get_policy().policy),
+            recorded + recorded[:1],
+        )
+        with self.assertRaises(NotFoundException):
+            api.get_assistant("acme", "missing")
+        response = api.sync_secrets_without_preload_content(
+            sync_request("org1")
+        )
+        self.assertEqual(json.loads(response.read())[0]["value"], "v-KEY")
+        self.assertEqual(self.hub.calls, 4)
+
+    def test_bodies_are_byte_exact_and_credentials_redacted(self) -> None:
+        self.record()
+        interaction = Cassette.load(self.path).interactions[0]
+        self.assertEqual(interaction.url, "http://hub.test/ide/policy")
+        self.assertEqual(dict(interaction.headers)['Content-Encoding'], 'gzip')
+        self.assertEqual(
+            json.loads(gzip.decompress(interaction.body))["policy"],
+            {"allowAnonymousTelemetry": 1},
+        )
+        self.assertNotIn('Authorization', interaction.request_headers)
+        self.assertNotIn('Set-Cookie', dict(interaction.headers))
+        with gzip.open(self.path, 'rt') as f:
+            content = f.read()
+        self.assertNotIn('secret-token', content)
+        self.assertNotIn('secret-cookie', content)
+
+    def test_secret_bodies_redacted_by_default(self) -> None:
+        self.record()
+        interactions = Cassette.load(self.path).interactions
+        self.assertEqual(interactions[-1].body, b'')
+        self.assertNotIn('Content-Encoding', dict(interactions[-1].headers))
+        # other bodies are kept
+        self.assertTrue(interactions[0].body)
+
+        api = DefaultApi(self.client(ReplayTransport(self.path)))
+        response = api.sync_secrets_without_preload_content(sync_request("org1"))
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.read(), b'')
+
+    def test_unmatched_request(self) -> None:
+        self.record()
+        api = DefaultApi(self.client(ReplayTransport(self.path, repeat=False)))
+        api.sync_secrets_without_preload_content(sync_request("org1"))
+        with self.assertRaises(ApiException):
+            api.sync_secrets_without_preload_content(
+                sync_request("org1")
+            )
+        with self.assertRaises(ApiException):
+            api.sync_secrets_without_preload_content(
+                sync_request("org2")
+            )
+
+    def test_recorded_latency(self) -> None:
+        self.record()
+        cassette = Cassette.load(self.path)
+        cassette.interactions = [
+            interaction._replace(latency=0.05) for interaction in cassette.interactions
+        ]
+        api = DefaultApi(self.client(ReplayTransport(cassette, latency_scale=1.0)))
+        start = time.monotonic()
+        api.get_policy()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,7 +14,7 @@
 
 import unittest
 
-from api.default_api import DefaultApi
+from openapi_client.api.default_api import DefaultApi
 
 
 class TestDefaultApi(unittest.TestCase):
@@ -0,0 +1,131 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from openapi_client.exceptions import ServiceException
+from openapi_client.export import AssistantExporter
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from test.fakes import FakeHub, assistant, hub_api
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def assistants(owner, count):
+    return [
+        assistant(owner, "a%d" % i, config={"name": "a%d" % i}, raw_yaml="name: a%d\n" % i)
+        for i in range(count)
+    ]
+
+
+def read_jsonl(path):
+    with gzip.open(path, 'rt') as f:
+        return [json.loads(line) for line in f]
+
+
+class TestAssistantExporter(unittest.TestCase):
+    """AssistantExporter unit tests"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'assistants.jsonl.gz')
+        self.hub = FakeHub({
+            None: assistants('me', 1),
+            'org1': assistants('org1', 2),
+            'org2': assistants('org2', 3),
+            'org3': [],
+        })
+        self.api = hub_api(self.hub)
+
+    def tearDown(self) -> None:
+        self.api.api_client.close()
+        shutil.rmtree(self.directory)
+
+    def test_export(self) -> None:
+        result = AssistantExporter(self.api, self.path, max_concurrency=2).run()
+        self.assertEqual(result, (4, 6, 0, {}))
+        records = read_jsonl(self.path)
+        self.assertEqual(
+            sorted((r['organizationId'] or '', r['packageSlug']) for r in records),
+            [('', 'a0'), ('org1', 'a0'), ('org1', 'a1'),
+             ('org2', 'a0'), ('org2', 'a1'), ('org2', 'a2')],
+        )
+        model = ListAssistants200ResponseInner.from_dict(records[0])
+        self.assertEqual(model.raw_yaml, "name: a0\n")
+        self.assertFalse(os.path.exists(self.path + '.checkpoint'))
+
+    def test_resume_after_failure(self) -> None:
+        self.hub.failing['org2'] = 503
+        result = AssistantExporter(self.api, self.path).run()
+        self.assertEqual(result.assistants, 3)
+        self.assertIsInstance(result.errors['org2'], ServiceException)
+        self.assertTrue(os.path.exists(self.path + '.checkpoint'))
+
+        # a crash mid-write leaves garbage after the last checkpoint
+        with open(self.path, 'ab') as f:
+            f.write(b'\x1f\x8b partial')
+        self.hub.failing.clear()
+        self.hub.listed.clear()
+        result = AssistantExporter(self.api, self.path).run()
+        self.assertEqual(self.hub.listed, ['org2'])
+        self.assertEqual((result.assistants, result.skipped, result.errors), (3, 3, {}))
+        self.assertEqual(len(read_jsonl(self.path)), 6)
+        self.assertFalse(os.path.exists(self.path + '.checkpoint'))
+
+    def test_resume_without_output_starts_over(self) -> None:
+        self.hub.failing['org2'] = 503
+        AssistantExporter(self.api, self.path).run()
+        os.unlink(self.path)
+        self.hub.failing.clear()
+        with self.assertLogs('openapi_client.export', 'WARNING'):
+            result = AssistantExporter(self.api, self.path).run()
+        self.assertEqual((result.assistants, result.skipped, result.errors), (6, 0, {}))
+        self.assertEqual(len(read_jsonl(self.path)), 6)
+
+    def test_fresh_run_replaces_output(self) -> None:
+        AssistantExporter(self.api, self.path).run()
+        AssistantExporter(self.api, self.path).run()
+        self.assertEqual(len(read_jsonl(self.path)), 6)
+
+    def test_plain_jsonl(self) -> None:
+        path = os.path.join(self.directory, 'assistants.jsonl')
+        AssistantExporter(self.api, path, format='jsonl', include_personal=False).run()
+        with open(path) as f:
+            self.assertEqual(len(f.readlines()), 5)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self) -> None:
+        path = os.path.join(self.directory, 'assistants')
+        AssistantExporter(self.api, path, format='parquet').run()
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.num_rows, 6)
+        self.assertIn('raw_yaml', table.column_names)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet_removes_stale_parts(self) -> None:
+        path = os.path.join(self.directory, 'assistants')
+        AssistantExporter(self.api, path, format='parquet').run()
+        del self.hub.assistants['org2']
+        AssistantExporter(self.api, path, format='parquet').run()
+        self.assertEqual(len(os.listdir(path)), 3)
+        self.assertEqual(pyarrow.parquet.read_table(path).num_rows, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
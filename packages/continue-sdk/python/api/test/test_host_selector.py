@@ -0,0 +1,100 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import unittest
+
+import urllib3
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.host_selector import HostSelector, is_connect_error
+from test.fakes import FakeRestClient
+
+
+class DownRestClient(FakeRestClient):
+    """Refuses connections to the `down` hosts."""
+
+    def __init__(self, down=()) -> None:
+        super().__init__()
+        self.down = set(down)
+
+    def respond(self, request, call):
+        for host in self.down:
+            if request.url.startswith(host):
+                raise urllib3.exceptions.MaxRetryError(
+                    None, request.url, urllib3.exceptions.NewConnectionError(None, "refused")
+                )
+        return super().respond(request, call)
+
+
+class TestHostSelector(unittest.TestCase):
+    """HostSelector unit tests"""
+
+    def test_from_configuration(self) -> None:
+        selector = HostSelector.from_configuration(
+            Configuration(), extra_hosts=['https://proxy.internal/']
+        )
+        self.assertEqual(selector.hosts, [
+            'https://api.continue.dev', 'http://localhost:3001', 'https://proxy.internal',
+        ])
+        selector = HostSelector.from_configuration(Configuration(), indexes=[0])
+        self.assertEqual(selector.hosts, ['https://api.continue.dev'])
+
+    def test_prefers_lowest_latency(self) -> None:
+        selector = HostSelector(['http://a', 'http://b'])
+        for url, latency in (('http://a', 0.2), ('http://b', 0.05)):
+            selector.begin(url)
+            selector.record_success(url, latency)
+        self.assertEqual(selector.select(), 'http://b')
+        # requests in flight make a host less attractive
+        for _ in range(4):
+            selector.begin('http://b')
+        self.assertEqual(selector.select(), 'http://a')
+
+    def test_failure_cooldown(self) -> None:
+        selector = HostSelector(['http://a', 'http://b'], cooldown=60)
+        selector.begin('http://a')
+        selector.record_failure('http://a')
+        self.assertEqual(selector.candidates(), ['http://b', 'http://a'])
+        self.assertFalse(selector.status()[0].healthy)
+
+    def test_is_connect_error(self) -> None:
+        refused = urllib3.exceptions.NewConnectionError(None, "refused")
+        self.assertTrue(is_connect_error(refused))
+        self.assertTrue(is_connect_error(urllib3.exceptions.MaxRetryError(None, "u", refused)))
+        self.assertFalse(is_connect_error(urllib3.exceptions.ReadTimeoutError(None, "u", "slow")))
+
+    def test_api_client_fails_over(self) -> None:
+        configuration = Configuration(host="http://a.test")
+        selector = HostSelector(['http://a.test', 'http://b.test'])
+        api_client = ApiClient(configuration, host_selector=selector)
+        api_client.rest_client = DownRestClient(down=['http://a.test'])
+        api = DefaultApi(api_client)
+        api.get_policy()
+        self.assertEqual(api_client.rest_client.urls, [
+            'http://a.test/ide/policy', 'http://b.test/ide/policy',
+        ])
+        api.get_policy()
+        self.assertEqual(api_client.rest_client.urls[-1], 'http://b.test/ide/policy')
+        self.assertEqual(len(api_client.rest_client.urls), 3)
+
+    def test_all_hosts_down_raises(self) -> None:
+        selector = HostSelector(['http://a.test', 'http://b.test'])
+        api_client = ApiClient(Configuration(host="http://a.test"), host_selector=selector)
+        api_client.rest_client = DownRestClient(down=['http://a.test', 'http://b.test'])
+        with self.assertRaises(urllib3.exceptions.MaxRetryError):
+            DefaultApi(api_client).get_policy()
+        self.assertFalse(any(status.healthy for status in selector.status()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import time
+import unittest
+
+import urllib3
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import DeadlineExceededException
+from openapi_client.host_selector import HostSelector
+from openapi_client.latency import AdaptiveTimeout, DeadlineRetry, HedgingPolicy, LatencyTracker
+from test.fakes import FakeRestClient, json_response
+
+
+class SlowFirstRestClient(FakeRestClient):
+    """Answers the first request after `slow` seconds, the others at once."""
+
+    def __init__(self, slow) -> None:
+        super().__init__()
+        self.slow = slow
+
+    def respond(self, request, call):
+        if call == 1:
+            time.sleep(self.slow)
+        return json_response(200, {"policy": {"allowAnonymousTelemetry": call != 1}})
+
+
+class TestLatency(unittest.TestCase):
+    """LatencyTracker and hedging unit tests"""
+
+    def test_percentile(self) -> None:
+        tracker = LatencyTracker(window=100, min_samples=10)
+        for i in range(9):
+            tracker.record('op', i / 100.0)
+        self.assertIsNone(tracker.percentile('op', 50))
+        for i in range(9, 100):
+            tracker.record('op', i / 100.0)
+        self.assertAlmostEqual(tracker.percentile('op', 50), 0.5, places=2)
+        self.assertAlmostEqual(tracker.percentile('op', 99), 0.98, places=2)
+        # old samples leave the window
+        for _ in range(100):
+            tracker.record('op', 2.0)
+        self.assertEqual(tracker.percentile('op', 50), 2.0)
+        self.assertEqual(tracker.count('op'), 100)
+
+    def test_budget_caps_extra_load(self) -> None:
+        policy = HedgingPolicy(max_extra_load=0.1, burst=2)
+        hedges = 0
+        for _ in range(100):
+            policy.on_request()
+            hedges += policy.try_hedge()
+        self.assertLessEqual(hedges, 10)
+        self.assertGreaterEqual(hedges, 9)
+
+    def test_delay_requires_samples_and_listed_operation(self) -> None:
+        policy = HedgingPolicy(operations=['get_policy'], min_delay=0.01)
+        self.assertIsNone(policy.delay('get_policy'))
+        for _ in range(policy.tracker.min_samples):
+            policy.tracker.record('get_policy', 0.001)
+            policy.tracker.record('list_assistants', 0.001)
+        self.assertEqual(policy.delay('get_policy'), 0.01)
+        self.assertIsNone(policy.delay('list_assistants'))
+
+    def _api(self, rest_client, policy):
+        api_client = ApiClient(Configuration(host="http://hub.test"), hedging_policy=policy)
+        api_client.rest_client = rest_client
+        self.addCleanup(api_client.close)
+        return DefaultApi(api_client)
+
+    def test_hedge_wins_over_slow_request(self) -> None:
+        policy = HedgingPolicy(default_delay=0.02, max_extra_load=1, burst=1)
+        rest_client = SlowFirstRestClient(slow=0.5)
+        api = self._api(rest_client, policy)
+        start = time.monotonic()
+        result = api.get_policy()
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertTrue(result.policy["allowAnonymousTelemetry"])
+        self.assertEqual((policy.hedges, policy.hedge_wins), (1, 1))
+        # the losing response is closed once it arrives
+        time.sleep(0.6)
+        self.assertTrue(rest_client.responses[1].response.closed)
+        self.assertEqual(policy.tracker.count('get_policy'), 2)
+
+    def test_no_hedge_without_budget(self) -> None:
+        policy = HedgingPolicy(default_delay=0.02, max_extra_load=0)
+        rest_client = SlowFirstRestClient(slow=0.1)
+        result = self._api(rest_client, policy).get_policy()
+        self.assertFalse(result.policy["allowAnonymousTelemetry"])
+        self.assertEqual(rest_client.calls, 1)
+        self.assertEqual(policy.hedges, 0)
+
+
+class RefusingRestClient(FakeRestClient):
+    """Refuses connections after `delay`."""
+
+    def __init__(self, delay) -> None:
+        super().__init__()
+        self.delay = delay
+
+    def respond(self, request, call):
+        time.sleep(self.delay)
+        raise urllib3.exceptions.NewConnectionError(None, "refused")
+
+
+class TestAdaptiveTimeout(unittest.TestCase):
+    """AdaptiveTimeout and deadline unit tests"""
+
+    def test_read_timeout_follows_percentile(self) -> None:
+        timeouts = AdaptiveTimeout(multiplier=3, min_timeout=0.5, max_timeout=10)
+        self.assertEqual(timeouts.read_timeout('list_assistants'), 10)
+        for _ in range(50):
+            timeouts.tracker.record('list_assistants', 2.0)
+            timeouts.tracker.record('get_policy', 0.01)
+        self.assertEqual(timeouts.read_timeout('list_assistants'), 6.0)
+        self.assertEqual(timeouts.read_timeout('get_policy'), 0.5)
+
+    def test_deadline_retry(self) -> None:
+        retry = DeadlineRetry.wrap(3, time.monotonic() + 60)
+        self.assertFalse(retry.is_exhausted())
+        retry = retry.new(total=2)
+        self.assertIsInstance(retry, DeadlineRetry)
+        self.assertFalse(retry.is_exhausted())
+        retry.deadline = time.monotonic() - 1
+        self.assertTrue(retry.is_exhausted())
+        with self.assertRaises(urllib3.exceptions.MaxRetryError):
+            retry.increment('GET', '/ide/policy', error=urllib3.exceptions.ProtocolError())
+
+    def test_api_client_uses_learned_timeouts(self) -> None:
+        timeouts = AdaptiveTimeout(min_timeout=0.2, max_timeout=30, connect_timeout=2)
+        api_client = ApiClient(Configuration(host="http://hub.test"), adaptive_timeout=timeouts)
+        rest_client = api_client.rest_client = FakeRestClient(body=b'{}')
+        api = DefaultApi(api_client)
+        api.get_policy()
+        request = rest_client.requests[0]
+        self.assertEqual((request.timeout.connect_timeout, request.timeout.read_timeout), (2, 30))
+        self.assertIsNone(request.retries)
+        self.assertEqual(timeouts.tracker.count('get_policy'), 1)
+        for _ in range(30):
+            api.get_policy()
+        self.assertEqual(rest_client.requests[-1].timeout.read_timeout, 0.2)
+        # an explicit timeout wins
+        api.get_policy(_request_timeout=5)
+        self.assertEqual(rest_client.requests[-1].timeout, 5)
+
+    def test_deadline_spans_attempts(self) -> None:
+        configuration = Configuration(host="http://a.test")
+        configuration.request_deadline = 0.15
+        api_client = ApiClient(
+            configuration,
+            host_selector=HostSelector(['http://a.test', 'http://b.test', 'http://c.test']),
+        )
+        rest_client = api_client.rest_client = RefusingRestClient(delay=0.1)
+        with self.assertRaises(DeadlineExceededException):
+            DefaultApi(api_client).get_policy()
+        self.assertEqual(rest_client.calls, 2)
+        first, second = rest_client.requests
+        self.assertLessEqual(first.timeout.total, 0.15)
+        self.assertLess(second.timeout.total, 0.06)
+        self.assertIsInstance(first.retries, DeadlineRetry)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import contextlib
+import io
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client.api_client import ApiClient
+from openapi_client.loadgen import LatencyHistogram, main, run_load
+from openapi_client.sansio import build_request
+from test.fakes import FakeHub, hub_api
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        data = json.dumps({"policy": {"path": self.path}}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """LatencyHistogram unit tests"""
+
+    def test_percentiles(self) -> None:
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000.0)
+        self.assertEqual(histogram.count, 1000)
+        for percentile, expected in ((50, 0.5), (90, 0.9), (99, 0.99), (100, 1.0)):
+            self.assertAlmostEqual(
+                histogram.percentile(percentile), expected, delta=expected / 100
+            )
+        self.assertAlmostEqual(histogram.mean, 0.5005)
+        self.assertEqual(histogram.percentile(100), 1.0)
+
+    def test_wide_range_in_few_buckets(self) -> None:
+        histogram = LatencyHistogram()
+        for exponent in range(-6, 3):
+            histogram.record(10.0 ** exponent)
+        self.assertLess(len(histogram._counts), 10)
+        self.assertAlmostEqual(histogram.percentile(100), 100.0)
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+    def test_merge(self) -> None:
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.001)
+        second.record(0.003)
+        first.merge(second)
+        self.assertEqual((first.count, first.min, first.max), (2, 1000, 3000))
+
+
+class TestRunLoad(unittest.TestCase):
+    """run_load unit tests"""
+
+    def client(self, hub) -> ApiClient:
+        return hub_api(hub).api_client
+
+    def test_open_loop_counts_queueing(self) -> None:
+        hub = FakeHub(delay=0.05)
+        client = self.client(hub)
+        # one worker at 100 req/s for a 20 req/s server: requests queue up
+        report = run_load(client, build_request(client, 'get_policy'),
+                          rate=100, total=10, workers=1)
+        self.assertEqual(report.requests, 10)
+        self.assertEqual(report.statuses[200], 10)
+        self.assertGreater(report.latency.percentile(100), 0.3)
+        self.assertLess(report.latency.percentile(0), 0.1)
+
+    def test_closed_loop_and_errors(self) -> None:
+        hub = FakeHub(delay=0.01)
+        client = self.client(hub)
+        request = build_request(client, 'get_assistant', owner_slug='a', package_slug='b')
+        report = run_load(client, request, concurrency=3, total=9)
+        self.assertEqual(report.requests, 9)
+        self.assertEqual(hub.peak, 3)
+        self.assertEqual(dict(report.errors), {'NotFoundException': 9})
+        self.assertEqual(report.as_dict()['statuses'], {'404': 9})
+        self.assertIn('NotFoundException', str(report))
+
+    def test_requires_one_mode(self) -> None:
+        client = self.client(FakeHub(delay=0))
+        request = build_request(client, 'get_policy')
+        with self.assertRaises(ValueError):
+            run_load(client, request, total=1)
+        with self.assertRaises(ValueError):
+            run_load(client, request, rate=1, concurrency=1, total=1)
+
+
+class TestMain(unittest.TestCase):
+    """loadgen command line unit tests"""
+
+    def test_against_stub_server(self) -> None:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                code = main([
+                    'get_policy', '--host', 'http://127.0.0.1:%d/' % server.server_port,
+                    '--rate', '200', '--requests', '20', '--json',
+                ])
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(code, 0)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['requests'], 20)
+        self.assertEqual(report['statuses'], {'200': 20})
+        self.assertEqual(report['errors'], {})
+        self.assertIsNotNone(report['latency_ms']['p99'])
+
+    def test_rejects_bad_params(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                main(['get_policy', '--rate', '1', '-p', 'owner_slug=a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from openapi_client.export import write_atomic
+from openapi_client.mirror import AssistantMirror
+from test.fakes import FakeHub, assistant, hub_api
+
+
+class TestAssistantMirror(unittest.TestCase):
+    """AssistantMirror unit tests"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.hub = FakeHub({
+            None: [assistant('me', 'scratch', raw_yaml="name: scratch\n")],
+            'org1': [assistant('acme', 'helper', raw_yaml="name: helper\n"),
+                     assistant('acme', 'noyaml')],
+            'org2': [assistant('beta', 'bot', raw_yaml="name: bot\n")],
+        })
+        self.api = hub_api(self.hub)
+        self.mirror = AssistantMirror(self.api, self.directory, max_workers=2)
+
+    def tearDown(self) -> None:
+        self.api.api_client.close()
+        shutil.rmtree(self.directory)
+
+    def read(self, path):
+        with open(os.path.join(self.directory, path)) as f:
+            return f.read()
+
+    def test_first_sync_writes_everything(self) -> None:
+        result = self.mirror.sync()
+        self.assertEqual(
+            sorted(result.written), ['acme/helper.yaml', 'beta/bot.yaml', 'me/scratch.yaml']
+        )
+        self.assertEqual(self.read('acme/helper.yaml'), "name: helper\n")
+        self.assertEqual(self.mirror.load_manifest()['beta/bot.yaml'].organization_id, 'org2')
+
+    def test_only_changes_are_written(self) -> None:
+        self.mirror.sync()
+        self.hub.assistants['org1'][0]['rawYaml'] = "name: helper\nversion: 2\n"
+        with mock.patch('openapi_client.mirror.write_atomic', wraps=write_atomic) as write:
+            result = self.mirror.sync()
+        self.assertEqual(result.written, ['acme/helper.yaml'])
+        self.assertEqual(result.unchanged, 2)
+        # the changed file and the manifest
+        self.assertEqual(write.call_count, 2)
+        self.assertEqual(self.read('acme/helper.yaml'), "name: helper\nversion: 2\n")
+
+    def test_removed_assistants_are_deleted(self) -> None:
+        self.mirror.sync()
+        del self.hub.assistants['org2']
+        result = self.mirror.sync()
+        self.assertEqual(result.deleted, ['beta/bot.yaml'])
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'beta')))
+        self.assertNotIn('beta/bot.yaml', self.mirror.load_manifest())
+
+    def test_failed_organization_is_kept(self) -> None:
+        self.mirror.sync()
+        self.hub.failing['org2'] = 503
+        result = self.mirror.sync()
+        self.assertIn('org2', result.errors)
+        self.assertEqual(result.deleted, [])
+        self.assertEqual(self.read('beta/bot.yaml'), "name: bot\n")
+
+    def test_subset_keeps_other_organizations(self) -> None:
+        self.mirror.sync()
+        del self.hub.assistants['org1'][0]
+        subset = AssistantMirror(self.api, self.directory, organization_ids=['org1'])
+        self.assertEqual(subset.sync().deleted, ['acme/helper.yaml'])
+        self.assertEqual(self.read('beta/bot.yaml'), "name: bot\n")
+        self.assertEqual(self.read('me/scratch.yaml'), "name: scratch\n")
+        self.assertEqual(sorted(subset.load_manifest()), ['beta/bot.yaml', 'me/scratch.yaml'])
+
+    def test_missing_file_is_restored(self) -> None:
+        self.mirror.sync()
+        os.unlink(os.path.join(self.directory, 'me/scratch.yaml'))
+        self.assertEqual(self.mirror.sync().written, ['me/scratch.yaml'])
+
+    def test_unsafe_slugs_are_skipped(self) -> None:
+        self.hub.assistants['org2'] = [
+            assistant('..', 'evil', raw_yaml="x"), assistant('beta', 'a/b', raw_yaml="y"),
+        ]
+        with self.assertLogs('openapi_client.mirror', 'WARNING'):
+            result = self.mirror.sync()
+        self.assertEqual(sorted(result.written), ['acme/helper.yaml', 'me/scratch.yaml'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import io
+import mmap
+import os
+import tempfile
+import unittest
+
+from urllib3.filepost import encode_multipart_formdata
+
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.multipart import FileSource, MultipartEncoder
+from openapi_client.rest import RESTResponse
+
+
+class TestMultipart(unittest.TestCase):
+    """MultipartEncoder and streamed file unit tests"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'config.json')
+        self.content = os.urandom(200 * 1024)
+        with open(self.path, 'wb') as f:
+            f.write(self.content)
+
+    def test_matches_urllib3_encoding(self) -> None:
+        fields = [
+            ('name', 'assistant'),
+            ('meta', {'a': 1}),
+            ('file', ('config.json', FileSource(self.path), 'application/json')),
+        ]
+        encoder = MultipartEncoder(fields, boundary='b0undary', chunk_size=4096)
+        body = b''.join(encoder)
+        expected, content_type = encode_multipart_formdata([
+            ('name', 'assistant'),
+            ('meta', '{"a": 1}'),
+            ('file', ('config.json', self.content, 'application/json')),
+        ], boundary='b0undary')
+        self.assertEqual(body, expected)
+        self.assertEqual(encoder.content_type, content_type)
+        self.assertEqual(encoder.content_length, len(expected))
+        self.assertTrue(all(len(chunk) <= 4096 for chunk in encoder))
+
+    def test_header_params_are_escaped(self) -> None:
+        fields = [
+            ('a"b', 'x'),
+            ('file', ('evil"\r\nX-Injected: 1 é.json', b'{}', 'application/json')),
+        ]
+        body = b''.join(MultipartEncoder(fields, boundary='b0undary'))
+        expected, _ = encode_multipart_formdata(fields, boundary='b0undary')
+        self.assertEqual(body, expected)
+        self.assertNotIn(b'\r\nX-Injected', body)
+
+    def test_file_objects_and_mmap_can_be_resent(self) -> None:
+        with open(self.path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            stream = io.BytesIO(b'xx' + self.content)
+            stream.read(2)
+            encoder = MultipartEncoder([
+                ('a', ('a.bin', stream, None)),
+                ('b', ('b.bin', mapped, None)),
+            ])
+            first = b''.join(encoder)
+            self.assertEqual(first, b''.join(encoder))
+            self.assertEqual(len(first), encoder.content_length)
+            self.assertEqual(first.count(self.content), 2)
+
+    def test_files_parameters_do_not_read_files(self) -> None:
+        api_client = ApiClient(Configuration())
+        params = api_client.files_parameters({'file': self.path})
+        name, (filename, data, mimetype) = params[0]
+        self.assertEqual((name, filename, mimetype), ('file', 'config.json', 'application/json'))
+        self.assertIsInstance(data, FileSource)
+        with open(self.path, 'rb') as f:
+            params = api_client.files_parameters({'file': f})
+            self.assertIs(params[0][1][1], f)
+            self.assertEqual(f.tell(), 0)
+
+    def test_file_response_is_streamed_to_disk(self) -> None:
+        api_client = ApiClient(Configuration())
+        api_client.configuration.temp_folder_path = self.directory.name
+        response = RESTResponse.from_bytes(
+            200, self.content,
+            {'Content-Disposition': 'attachment; filename="download.bin"'},
+        )
+        result = api_client.response_deserialize(response, {'200': 'file'})
+        self.assertIsNone(response.data)
+        with open(result.data, 'rb') as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertEqual(os.path.basename(result.data), 'download.bin')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import unittest
+
+from openapi_client.policy import CompiledPolicy, PolicyEvaluator, policy_hash
+from test.fakes import FakeHub, hub_api
+
+
+class TestCompiledPolicy(unittest.TestCase):
+    """CompiledPolicy unit tests"""
+
+    def test_no_policy_allows_everything(self) -> None:
+        for policy in (CompiledPolicy(None), CompiledPolicy({})):
+            self.assertTrue(policy.allow_anonymous_telemetry)
+            self.assertTrue(policy.allow_other_orgs)
+            self.assertTrue(policy.allow_codebase_indexing)
+            self.assertTrue(policy.allow_mcp_servers)
+
+    def test_flags(self) -> None:
+        policy = CompiledPolicy({
+            "allowAnonymousTelemetry": False,
+            "allowOtherOrgs": True,
+            "allowCodebaseIndexing": False,
+            "allowMcpServers": False,
+        })
+        self.assertFalse(policy.allow_anonymous_telemetry)
+        self.assertTrue(policy.allow_other_orgs)
+        self.assertFalse(policy.allow_codebase_indexing)
+        self.assertFalse(policy.allow_mcp_servers)
+
+
+class TestPolicyEvaluator(unittest.TestCase):
+    """PolicyEvaluator unit tests"""
+
+    def test_compiles_once_per_content(self) -> None:
+        evaluator = PolicyEvaluator()
+        first = evaluator.compile({"allowOtherOrgs": False, "allowMcpServers": True})
+        second = evaluator.compile({"allowMcpServers": True, "allowOtherOrgs": False})
+        self.assertIs(first, second)
+        self.assertEqual(evaluator.compilations, 1)
+        self.assertIsNot(evaluator.compile({"allowOtherOrgs": True}), first)
+        self.assertEqual(evaluator.compilations, 2)
+        self.assertEqual(
+            first.hash, policy_hash({"allowMcpServers": True, "allowOtherOrgs": False})
+        )
+
+    def test_cache_is_bounded(self) -> None:
+        evaluator = PolicyEvaluator(max_cached=2)
+        for i in range(3):
+            evaluator.compile({"allowOtherOrgs": i == 0, "allowMcpServers": i == 1})
+        evaluator.compile({"allowOtherOrgs": True, "allowMcpServers": False})
+        self.assertEqual(evaluator.compilations, 4)
+
+    def test_fetch(self) -> None:
+        hub = FakeHub(policy={"allowMcpServers": False})
+        evaluator = PolicyEvaluator(hub_api(hub))
+        first = evaluator.fetch()
+        self.assertFalse(first.allow_mcp_servers)
+        self.assertIs(evaluator.fetch(), first)
+        hub.policy = {}
+        self.assertTrue(evaluator.fetch().allow_mcp_servers)
+        self.assertEqual(evaluator.compilations, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
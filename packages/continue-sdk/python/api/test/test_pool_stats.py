@@ -0,0 +1,155 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import itertools
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.latency import HedgingPolicy
+from openapi_client.pool_stats import WAIT_BUCKETS
+from openapi_client.rest import RESTClientObject
+from openapi_client.transport import WSGITransport
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    delay = 0.0
+
+    def do_GET(self) -> None:
+        time.sleep(self.delay)
+        body = b'[]'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class AlternatingHandler(SlowHandler):
+    """Answers the odd requests after 0.3 seconds, the others at once."""
+
+    requests = itertools.count()
+
+    def do_GET(self) -> None:
+        self.delay = 0.3 if next(self.requests) % 2 == 0 else 0.0
+        SlowHandler.do_GET(self)
+
+
+class TestPoolStats(unittest.TestCase):
+    """PoolStats unit tests"""
+
+    def setUp(self) -> None:
+        SlowHandler.delay = 0.0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = 'http://127.0.0.1:%d/ide/list-assistants' % self.server.server_address[1]
+        self.host = 'http://127.0.0.1:%d' % self.server.server_address[1]
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def client(self, maxsize: int, **settings) -> RESTClientObject:
+        configuration = Configuration()
+        configuration.connection_pool_maxsize = maxsize
+        for name, value in settings.items():
+            setattr(configuration, name, value)
+        return RESTClientObject(configuration)
+
+    def get_concurrently(self, client: RESTClientObject, count: int) -> None:
+        threads = [
+            threading.Thread(target=lambda: client.request('GET', self.url).read())
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_connections_are_reused(self) -> None:
+        client = self.client(2)
+        for _ in range(5):
+            self.assertEqual(client.request('GET', self.url).read(), b'[]')
+        stats = client.pool_stats()[self.host]
+        self.assertEqual(stats.checkouts, 5)
+        self.assertEqual(stats.new_connections, 1)
+        self.assertEqual(stats.reused, 4)
+        self.assertEqual(stats.reuse_ratio, 0.8)
+        self.assertEqual((stats.in_use, stats.idle, stats.maxsize), (0, 1, 2))
+        self.assertEqual(stats.saturated, 0)
+        self.assertEqual(sum(count for _, count in stats.wait_histogram), 5)
+        self.assertEqual([bound for bound, _ in stats.wait_histogram], list(WAIT_BUCKETS))
+        self.assertGreater(stats.new_connection_rate, 0)
+
+    def test_saturation_opens_extra_connections(self) -> None:
+        SlowHandler.delay = 0.2
+        client = self.client(1, connection_pool_saturation_warning=True)
+        with self.assertLogs('openapi_client.pool_stats', 'WARNING') as logs:
+            self.get_concurrently(client, 3)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('opening extra connections', logs.output[0])
+        stats = client.pool_stats()[self.host]
+        self.assertEqual(stats.saturated, 2)
+        self.assertEqual(stats.new_connections, 3)
+        self.assertEqual(stats.discarded, 2)
+        self.assertEqual(stats.peak_in_use, 3)
+        self.assertEqual(stats.in_use, 0)
+
+    def test_blocking_pool_waits(self) -> None:
+        SlowHandler.delay = 0.2
+        client = self.client(1, connection_pool_block=True)
+        self.get_concurrently(client, 2)
+        stats = client.pool_stats()[self.host]
+        self.assertEqual(stats.saturated, 1)
+        self.assertEqual(stats.new_connections, 1)
+        self.assertEqual(stats.discarded, 0)
+        self.assertEqual(stats.peak_in_use, 1)
+        self.assertGreater(stats.max_wait, 0.1)
+
+    def test_api_client(self) -> None:
+        api_client = ApiClient(Configuration(host=self.host))
+        api_client.rest_client.request('GET', self.url).read()
+        self.assertEqual(api_client.pool_stats()[self.host].checkouts, 1)
+        wsgi = ApiClient(transport=WSGITransport(lambda environ, start_response: []))
+        self.assertEqual(wsgi.pool_stats(), {})
+
+    def test_hedged_losers_release_connections(self) -> None:
+        self.server.RequestHandlerClass = AlternatingHandler
+        configuration = Configuration(host=self.host)
+        configuration.connection_pool_maxsize = 2
+        configuration.connection_pool_block = True
+        policy = HedgingPolicy(default_delay=0.05, max_extra_load=1)
+        api = DefaultApi(ApiClient(configuration, hedging_policy=policy))
+        # each call leaves a losing response that must free its pool slot
+        done = threading.Event()
+
+        def calls() -> None:
+            for _ in range(3):
+                api.list_assistants()
+            done.set()
+
+        threading.Thread(target=calls, daemon=True).start()
+        self.assertTrue(done.wait(5))
+        self.assertEqual(policy.hedges, 3)
+        api.api_client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import ApiException, RateLimitExceededException
+from openapi_client.rate_limit import RateLimiter, SharedTokenBucket, TokenBucket
+from test.fakes import FakeRestClient
+
+
+class TestRateLimit(unittest.TestCase):
+    """RateLimiter unit tests"""
+
+    def test_token_bucket_burst_then_rate(self) -> None:
+        bucket = TokenBucket(rate=100, capacity=3)
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [0.0] * 3)
+        wait = bucket.try_acquire()
+        self.assertGreater(wait, 0)
+        self.assertLessEqual(wait, 0.01)
+        time.sleep(wait)
+        self.assertEqual(bucket.try_acquire(), 0.0)
+
+    def test_pause_blocks_bucket(self) -> None:
+        bucket = TokenBucket(rate=1000, capacity=10)
+        bucket.pause(0.05)
+        self.assertGreater(bucket.try_acquire(), 0.03)
+
+    def test_fail_fast_refunds_other_buckets(self) -> None:
+        global_bucket = TokenBucket(rate=1, capacity=5)
+        limiter = RateLimiter(
+            global_bucket=global_bucket,
+            operation_buckets={'get_policy': TokenBucket(rate=1, capacity=1)},
+            block=False,
+        )
+        limiter.acquire('get_policy')
+        with self.assertRaises(RateLimitExceededException) as cm:
+            limiter.acquire('get_policy')
+        self.assertEqual(cm.exception.status, 429)
+        self.assertEqual(cm.exception.operation_id, 'get_policy')
+        # the failed attempt did not consume global budget
+        for _ in range(4):
+            limiter.acquire('list_assistants')
+        with self.assertRaises(RateLimitExceededException):
+            limiter.acquire('list_assistants')
+
+    def test_blocking_limits_throughput(self) -> None:
+        limiter = RateLimiter(global_bucket=TokenBucket(rate=200, capacity=1))
+        start = time.monotonic()
+        threads = [
+            threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 20 requests with a burst of 1 need at least 19 refill intervals
+        self.assertGreaterEqual(time.monotonic() - start, 19 / 200 * 0.9)
+
+    def test_max_wait(self) -> None:
+        limiter = RateLimiter(global_bucket=TokenBucket(rate=1, capacity=1), max_wait=0.01)
+        limiter.acquire()
+        with self.assertRaises(RateLimitExceededException):
+            limiter.acquire()
+
+    def test_shared_bucket_across_instances(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bucket')
+            first = SharedTokenBucket(path, rate=1, capacity=2)
+            second = SharedTokenBucket(path, rate=1, capacity=2)
+            self.assertEqual(first.try_acquire(), 0.0)
+            self.assertEqual(second.try_acquire(), 0.0)
+            self.assertGreater(first.try_acquire(), 0)
+            second.refund()
+            self.assertEqual(first.try_acquire(), 0.0)
+            first.pause(5)
+            self.assertGreater(second.try_acquire(), 4)
+
+    def test_api_client_acquires_per_operation(self) -> None:
+        limiter = RateLimiter(
+            operation_buckets={'get_policy': TokenBucket(rate=1, capacity=1)},
+            block=False,
+        )
+        api_client = ApiClient(Configuration(host="http://hub.test"), rate_limiter=limiter)
+        rest_client = FakeRestClient()
+        api_client.rest_client = rest_client
+        api = DefaultApi(api_client)
+        api.get_policy()
+        with self.assertRaises(RateLimitExceededException):
+            api.get_policy()
+        self.assertEqual(rest_client.calls, 1)
+        with self.assertRaises(RateLimitExceededException):
+            api.get_policy_without_preload_content()
+        # other operations are not limited
+        api.list_organizations_without_preload_content()
+        self.assertEqual(rest_client.calls, 2)
+
+    def test_429_pauses_buckets(self) -> None:
+        bucket = TokenBucket(rate=1000, capacity=10)
+        limiter = RateLimiter(global_bucket=bucket, block=False)
+        api_client = ApiClient(Configuration(host="http://hub.test"), rate_limiter=limiter)
+        api_client.rest_client = FakeRestClient(429, headers={'Retry-After': '2'})
+        with self.assertRaises(ApiException):
+            DefaultApi(api_client).get_policy()
+        with self.assertRaises(RateLimitExceededException) as cm:
+            DefaultApi(api_client).get_policy()
+        self.assertGreater(cm.exception.retry_after, 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
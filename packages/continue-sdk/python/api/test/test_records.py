@@ -0,0 +1,94 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import unittest
+
+from openapi_client.assistant_index import AssistantIndex
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.models.list_organizations200_response_organizations_inner import (
+    ListOrganizations200ResponseOrganizationsInner,
+)
+from openapi_client.records import AssistantRecord, OrganizationRecord
+
+ASSISTANT = {
+    "configResult": {
+        "config": {
+            "name": "chat",
+            "models": [{"name": "Sonnet", "provider": "anthropic", "model": "claude-sonnet-4"}],
+        },
+        "configLoadInterrupted": False,
+        "errors": ["warning"],
+    },
+    "ownerSlug": "acme",
+    "packageSlug": "chat",
+    "useOnPremProxy": False,
+    "rawYaml": "name: chat\n",
+}
+
+
+class TestAssistantRecord(unittest.TestCase):
+    """AssistantRecord unit tests"""
+
+    def test_round_trip(self) -> None:
+        model = ListAssistants200ResponseInner.from_dict(ASSISTANT)
+        record = AssistantRecord.from_model(model)
+        self.assertEqual(record.key, ('acme', 'chat'))
+        self.assertEqual(record.errors, ('warning',))
+        self.assertEqual(record.config, ASSISTANT["configResult"]["config"])
+        self.assertEqual(record.to_model(), model)
+        self.assertEqual(record.to_dict(), ASSISTANT)
+        self.assertEqual(AssistantRecord.from_dict(ASSISTANT), record)
+
+    def test_slugs_are_interned(self) -> None:
+        first, second = (
+            AssistantRecord.from_dict(json.loads(json.dumps(ASSISTANT))) for _ in range(2)
+        )
+        self.assertIs(first.owner_slug, second.owner_slug)
+        self.assertIs(first.package_slug, second.package_slug)
+
+    def test_hashable_and_immutable(self) -> None:
+        record = AssistantRecord.from_dict(ASSISTANT)
+        reordered = dict(ASSISTANT, configResult=dict(
+            ASSISTANT["configResult"],
+            config=dict(reversed(list(ASSISTANT["configResult"]["config"].items()))),
+        ))
+        self.assertEqual(hash(AssistantRecord.from_dict(reordered)), hash(record))
+        self.assertEqual(len({record, AssistantRecord.from_dict(reordered)}), 1)
+        self.assertEqual({record: 1}[AssistantRecord.from_dict(ASSISTANT)], 1)
+        with self.assertRaises(AttributeError):
+            record.owner_slug = 'other'  # type: ignore[misc]
+        self.assertFalse(hasattr(record, '__dict__'))
+        # `config` is a copy, so changing it leaves the record intact
+        record.config["name"] = "changed"
+        self.assertEqual(record.config["name"], "chat")
+
+    def test_consumers_accept_records(self) -> None:
+        index = AssistantIndex()
+        index.update([AssistantRecord.from_dict(ASSISTANT)])
+        self.assertEqual(index.by_provider("anthropic"), {('acme', 'chat')})
+
+
+class TestOrganizationRecord(unittest.TestCase):
+    """OrganizationRecord unit tests"""
+
+    def test_round_trip(self) -> None:
+        data = {"id": "org1", "name": "Acme", "slug": "acme"}
+        model = ListOrganizations200ResponseOrganizationsInner.from_dict(data)
+        record = OrganizationRecord.from_model(model)
+        self.assertEqual(record, OrganizationRecord("org1", "Acme", "acme"))
+        self.assertEqual(record.to_dict(), data)
+        self.assertEqual(record.to_model(), model)
+        self.assertIn(OrganizationRecord.from_dict(data), {record})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import logging
+import unittest
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import NotFoundException
+from openapi_client.request_log import logger
+from test.fakes import FakeRestClient, json_response
+
+
+class FreeTrialNotFound(FakeRestClient):
+
+    def respond(self, request, call):
+        if 'free-trial' in request.url:
+            return json_response(404, self.body)
+        return super().respond(request, call)
+
+
+class TestRequestLog(unittest.TestCase):
+    """Sampled request logging unit tests"""
+
+    def setUp(self) -> None:
+        self.configuration = Configuration(host="http://hub.test")
+        api_client = ApiClient(self.configuration)
+        self.rest_client = api_client.rest_client = FreeTrialNotFound()
+        self.api = DefaultApi(api_client)
+
+    def test_disabled_logger_builds_no_record(self) -> None:
+        self.assertFalse(logger.isEnabledFor(logging.INFO))
+        self.api.get_policy()
+        self.assertIsNone(self.rest_client.responses[1].request_log)
+
+    def test_errors_are_logged_at_info(self) -> None:
+        self.configuration.request_log_sample_rate = 0.0
+        with self.assertLogs(logger, logging.DEBUG) as cm:
+            self.api.get_policy()
+            with self.assertRaises(NotFoundException):
+                self.api.get_free_trial_status()
+        self.assertEqual(len(cm.records), 1)
+        record = cm.records[0]
+        self.assertEqual(record.levelno, logging.INFO)
+        fields = record.openapi_request.as_dict()
+        self.assertEqual(fields['operation_id'], 'get_free_trial_status')
+        self.assertEqual(fields['status'], 404)
+        self.assertEqual(fields['url'], 'http://hub.test/ide/free-trial-status')
+        self.assertEqual(fields['size'], len(b'{"policy": {}}'))
+        self.assertIn('get_free_trial_status GET', record.getMessage())
+
+    def test_sampled_at_debug(self) -> None:
+        with self.assertLogs(logger, logging.DEBUG) as cm:
+            self.api.get_policy()
+            self.api.get_policy()
+        self.assertEqual([r.levelno for r in cm.records], [logging.DEBUG] * 2)
+
+    def test_slow_requests_are_logged(self) -> None:
+        self.configuration.request_log_sample_rate = 0.0
+        self.configuration.request_log_slow_threshold = 0.0
+        with self.assertLogs(logger, logging.INFO) as cm:
+            self.api.get_policy()
+        self.assertEqual(cm.records[0].openapi_request.status, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import gzip
+import io
+import tracemalloc
+import unittest
+import zlib
+
+import urllib3
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import ResponseTooLargeException
+from openapi_client.rest import RESTResponse
+from test.fakes import FakeRestClient
+
+
+def make_response(body, headers=None):
+    return RESTResponse(urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        headers=headers or {},
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    ))
+
+
+class StreamingRestClient(FakeRestClient):
+
+    def respond(self, request, call):
+        return make_response(self.body, {'Content-Type': 'application/json'})
+
+
+class TestResponseSize(unittest.TestCase):
+    """Response size limit unit tests"""
+
+    def test_content_length_fails_before_reading(self) -> None:
+        response = make_response(b'x' * 100, {'Content-Length': '100'})
+        with self.assertRaises(ResponseTooLargeException) as cm:
+            response.limit(10)
+        self.assertEqual(cm.exception.limit, 10)
+        self.assertEqual(cm.exception.status, 200)
+        self.assertTrue(response.response.closed)
+
+    def test_read_aborts_when_limit_crossed(self) -> None:
+        response = make_response(b'x' * 200000)
+        response.limit(100000)
+        with self.assertRaises(ResponseTooLargeException):
+            response.read()
+        self.assertTrue(response.response.closed)
+
+    def test_within_limit(self) -> None:
+        response = make_response(b'x' * 100, {'Content-Length': '100'})
+        response.limit(100)
+        self.assertEqual(response.read(), b'x' * 100)
+
+    def test_limit_applies_after_decompression(self) -> None:
+        bomb = gzip.compress(b'\0' * (20 * 1024 * 1024))
+        self.assertLess(len(bomb), 100000)
+        response = make_response(bomb, {
+            'Content-Encoding': 'gzip', 'Content-Length': str(len(bomb)),
+        })
+        response.limit(1024 * 1024)
+        with self.assertRaises(ResponseTooLargeException):
+            response.read()
+
+    def test_decompression_is_bounded_in_memory(self) -> None:
+        bomb = gzip.compress(b'\0' * (20 * 1024 * 1024))
+        response = make_response(bomb, {'Content-Encoding': 'gzip'})
+        response.limit(1024 * 1024)
+        tracemalloc.start()
+        try:
+            with self.assertRaises(ResponseTooLargeException):
+                for _ in response.stream():
+                    pass
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 4 * 1024 * 1024)
+
+    def test_bounded_decompression_formats(self) -> None:
+        body = b'{"policy": {}}' * 5000
+        raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        for encoding, data in [
+            ('gzip', gzip.compress(body[:35000]) + gzip.compress(body[35000:])),
+            ('deflate', zlib.compress(body)),
+            ('deflate', raw_deflate.compress(body) + raw_deflate.flush()),
+        ]:
+            with self.subTest(encoding):
+                response = make_response(data, {'Content-Encoding': encoding})
+                response.limit(len(body))
+                self.assertEqual(response.read(), body)
+
+    def test_per_operation_limit(self) -> None:
+        configuration = Configuration(host="http://hub.test")
+        configuration.max_response_size = 10
+        configuration.max_response_size_by_operation['get_policy'] = None
+        api_client = ApiClient(configuration)
+        api_client.rest_client = StreamingRestClient(body=b'{"policy": {"a": true}}')
+        api = DefaultApi(api_client)
+        self.assertEqual(api.get_policy().policy, {'a': True})
+        with self.assertRaises(ResponseTooLargeException):
+            api.list_organizations()
+
+
+if __name__ == '__main__':
+    unittest.main()
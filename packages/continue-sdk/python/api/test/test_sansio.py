@@ -0,0 +1,145 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import ast
+import inspect
+import pickle
+import unittest
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.exceptions import NotFoundException
+from openapi_client.models.get_policy200_response import GetPolicy200Response
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.sansio import (
+    OPERATIONS,
+    RawResponse,
+    build_request,
+    execute,
+    execute_many,
+    fetch,
+    parse_response,
+)
+from test.fakes import FakeHub, assistant, hub_api
+
+
+class TestSansIO(unittest.TestCase):
+    """sansio unit tests"""
+
+    def setUp(self) -> None:
+        self.hub = FakeHub(
+            {"org1": [assistant("acme", str(i)) for i in range(5)] + [assistant("a", "b")]},
+            policy={"allowAnonymousTelemetry": True},
+        )
+        self.api_client = hub_api(self.hub, access_token="tok").api_client
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+
+    def test_operations_cover_default_api(self) -> None:
+        serializers = {
+            name[1:-len('_serialize')] for name in dir(DefaultApi)
+            if name.startswith('_') and name.endswith('_serialize')
+        }
+        self.assertEqual(set(OPERATIONS), serializers)
+
+    def test_operations_match_default_api(self) -> None:
+        methods = {
+            node.name: node for node in ast.parse(inspect.getsource(DefaultApi)).body[0].body
+            if isinstance(node, ast.FunctionDef)
+        }
+        for operation_id, spec in OPERATIONS.items():
+            with self.subTest(operation_id):
+                parameters = inspect.signature(getattr(DefaultApi, operation_id)).parameters
+                self.assertEqual(
+                    spec.params, tuple(name for name in parameters if name[0] != '_')[1:]
+                )
+                response_types = [
+                    ast.literal_eval(node.value) for node in ast.walk(methods[operation_id])
+                    if isinstance(node, ast.AnnAssign)
+                    and node.target.id == '_response_types_map'
+                ]
+                self.assertEqual(response_types, [dict(spec.response_types)])
+                serialize = {
+                    keyword.arg: ast.literal_eval(keyword.value)
+                    for node in ast.walk(methods['_%s_serialize' % operation_id])
+                    if isinstance(node, ast.Call)
+                    and getattr(node.func, 'attr', None) == 'param_serialize'
+                    for keyword in node.keywords if keyword.arg in ('method', 'resource_path')
+                }
+                self.assertEqual(
+                    serialize, {'method': spec.method, 'resource_path': spec.resource_path}
+                )
+
+    def test_build_request_is_plain_data(self) -> None:
+        request = build_request(
+            self.api_client, 'get_assistant',
+            owner_slug='acme', package_slug='helper', organization_id='org1',
+        )
+        self.assertEqual(request.method, 'GET')
+        self.assertEqual(
+            request.url, 'http://hub.test/ide/get-assistant/acme/helper?organizationId=org1'
+        )
+        self.assertEqual(request.headers['Authorization'], 'Bearer tok')
+        self.assertEqual(pickle.loads(pickle.dumps(request)), request)
+
+    def test_build_request_serializes_body(self) -> None:
+        request = build_request(
+            self.api_client, 'sync_secrets',
+            sync_secrets_request=SyncSecretsRequest(fqsns=[], org_scope_id='org1'),
+        )
+        self.assertEqual(request.method, 'POST')
+        self.assertEqual(request.body, {"fqsns": [], "orgScopeId": "org1"})
+
+    def test_build_request_rejects_unknown(self) -> None:
+        with self.assertRaises(ValueError):
+            build_request(self.api_client, 'delete_everything')
+        with self.assertRaises(TypeError):
+            build_request(self.api_client, 'get_policy', organization_id='org1')
+
+    def test_parse_response_without_io(self) -> None:
+        request = build_request(self.api_client, 'get_policy')
+        raw = RawResponse(200, {'Content-Type': 'application/json'},
+                          b'{"policy": {"allowOtherOrgs": false}}')
+        response = parse_response(self.api_client, request, raw)
+        self.assertIsInstance(response.data, GetPolicy200Response)
+        self.assertEqual(response.data.policy, {"allowOtherOrgs": False})
+
+        with self.assertRaises(NotFoundException):
+            parse_response(self.api_client, request, RawResponse(404, {}, b'{}'))
+
+    def test_fetch_then_parse_matches_default_api(self) -> None:
+        request = build_request(self.api_client, 'get_policy')
+        raw = fetch(self.api_client, request)
+        self.assertEqual(raw.status, 200)
+        self.assertEqual(
+            parse_response(self.api_client, request, raw).data,
+            DefaultApi(self.api_client).get_policy(),
+        )
+
+    def test_execute_many(self) -> None:
+        requests = [
+            build_request(self.api_client, 'get_assistant', owner_slug='acme', package_slug=str(i))
+            for i in range(5)
+        ] + [build_request(self.api_client, 'get_assistant', owner_slug='acme', package_slug='x')]
+        result = execute_many(self.api_client, requests, max_concurrency=2)
+        self.assertEqual(
+            [response.data.package_slug for response in result.values], ['0', '1', '2', '3', '4']
+        )
+        self.assertEqual(list(result.errors), [5])
+        self.assertIsInstance(result.errors[5], NotFoundException)
+
+    def test_execute(self) -> None:
+        request = build_request(self.api_client, 'get_assistant', owner_slug='a', package_slug='b')
+        self.assertEqual(execute(self.api_client, request).data.owner_slug, 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import unittest
+
+from openapi_client.bulk import get_assistants_bulk, list_assistants_for_all_orgs
+from openapi_client.secret_prefetch import (
+    SecretPrefetcher,
+    assistant_secret_references,
+    decode_fqsn,
+    encode_fqsn,
+    find_secret_references,
+)
+from test import fakes
+
+
+def assistant(owner, package, api_key):
+    return fakes.assistant(owner, package, config={
+        "name": package,
+        "models": [{"name": "m", "provider": "openai", "model": "gpt-4o",
+                    "apiKey": "${{ secrets.%s }}" % api_key}],
+    }, raw_yaml="name: %s\n" % package)
+
+
+class TestFqsn(unittest.TestCase):
+    """FQSN helpers unit tests"""
+
+    def test_round_trip(self) -> None:
+        decoded = decode_fqsn("acme/chat/OPENAI_KEY")
+        self.assertEqual(decoded, {
+            "packageSlugs": [{"ownerSlug": "acme", "packageSlug": "chat"}],
+            "secretName": "OPENAI_KEY",
+        })
+        self.assertEqual(encode_fqsn(decoded), "acme/chat/OPENAI_KEY")
+        self.assertEqual(decode_fqsn("KEY"), {"packageSlugs": [], "secretName": "KEY"})
+        with self.assertRaises(ValueError):
+            decode_fqsn("acme/KEY")
+
+    def test_find_references(self) -> None:
+        self.assertEqual(find_secret_references({
+            "a": ["${{ secrets.acme/chat/A }}", "x ${{secrets.B}} y"],
+            "b": "${{ secrets.organization:acme/C }}",
+            "c": 3,
+        }), {"acme/chat/A", "B"})
+        self.assertEqual(assistant_secret_references(assistant("acme", "chat", "acme/chat/K")),
+                         {"acme/chat/K"})
+
+
+class TestSecretPrefetcher(unittest.TestCase):
+    """SecretPrefetcher unit tests"""
+
+    def setUp(self) -> None:
+        self.hub = fakes.FakeHub({
+            None: [assistant("me", "mine", "me/mine/KEY")],
+            "org1": [
+                assistant("acme", "chat", "acme/chat/KEY"),
+                assistant("acme", "ops", "acme/chat/KEY"),
+                assistant("acme", "bot", "acme/bot/OTHER"),
+            ],
+        })
+        self.api = fakes.hub_api(self.hub)
+
+    def tearDown(self) -> None:
+        self.api.api_client.close()
+
+    def test_one_sync_per_organization(self) -> None:
+        prefetcher = SecretPrefetcher(self.api)
+        result = list_assistants_for_all_orgs(self.api, secret_prefetcher=prefetcher)
+        self.assertEqual(result.errors, {})
+        self.assertEqual(prefetcher.get("acme/chat/KEY", "org1")["value"], "v-KEY")
+        self.assertEqual(prefetcher.get("acme/bot/OTHER", "org1")["value"], "v-OTHER")
+        self.assertTrue(prefetcher.get("me/mine/KEY")["found"])
+        self.assertEqual(len(self.hub.sync_requests), 2)
+        by_scope = {r.get("orgScopeId"): len(r["fqsns"]) for r in self.hub.sync_requests}
+        self.assertEqual(by_scope, {None: 1, "org1": 2})
+
+    def test_one_sync_for_bulk_get(self) -> None:
+        prefetcher = SecretPrefetcher(self.api)
+        slugs = [("acme", "chat"), ("acme", "ops"), ("acme", "bot")]
+        result = get_assistants_bulk(
+            self.api, slugs, organization_id="org1", secret_prefetcher=prefetcher
+        )
+        self.assertTrue(result.ok)
+        self.assertEqual(prefetcher.get("acme/bot/OTHER", "org1")["value"], "v-OTHER")
+        self.assertEqual(len(self.hub.sync_requests), 1)
+        self.assertEqual(len(self.hub.sync_requests[0]["fqsns"]), 2)
+
+    def test_plain_calls_are_scanned_on_request(self) -> None:
+        SecretPrefetcher(self.api)
+        self.api.list_assistants(organization_id="org1")
+        self.assertEqual(self.hub.sync_requests, [])
+
+        prefetcher = SecretPrefetcher(self.api, scan_responses=True)
+        self.api.list_assistants(organization_id="org1")
+        self.api.get_assistant("me", "mine")
+        self.assertEqual(prefetcher.get("acme/bot/OTHER", "org1")["value"], "v-OTHER")
+        self.assertTrue(prefetcher.get("me/mine/KEY")["found"])
+        by_scope = {r.get("orgScopeId"): len(r["fqsns"]) for r in self.hub.sync_requests}
+        self.assertEqual(by_scope, {None: 1, "org1": 2})
+
+    def test_known_references_are_not_requested_again(self) -> None:
+        prefetcher = SecretPrefetcher(self.api)
+        future = prefetcher.prefetch(self.hub.assistants["org1"], "org1")
+        self.assertIsNotNone(future)
+        future.result(5)
+        self.assertIsNone(prefetcher.prefetch(self.hub.assistants["org1"], "org1"))
+        prefetcher.get("acme/chat/KEY", "org1")
+        self.assertEqual(len(self.hub.sync_requests), 1)
+
+    def test_get_without_prefetch(self) -> None:
+        prefetcher = SecretPrefetcher(self.api)
+        self.assertEqual(prefetcher.get("X")["value"], "v-X")
+        with self.assertRaises(ValueError):
+            prefetcher.get("acme/X")
+
+    def test_failure_is_retried(self) -> None:
+        self.hub.sync_failures = 1
+        prefetcher = SecretPrefetcher(self.api)
+        future = prefetcher.prefetch([assistant("acme", "chat", "acme/chat/KEY")], "org1")
+        with self.assertRaises(Exception):
+            future.result(5)
+        self.assertEqual(prefetcher.get("acme/chat/KEY", "org1")["value"], "v-KEY")
+        self.assertEqual(len(self.hub.sync_requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+
+from openapi_client.rest import RESTResponse
+from openapi_client.shared_cache import SharedResponseCache
+
+
+class TestSharedResponseCache(unittest.TestCase):
+    """SharedResponseCache unit tests"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.cache = SharedResponseCache(self.directory, ttl=60)
+        self.sent = 0
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def send(self, status=200, body=b'{"ok": true}'):
+        def send():
+            time.sleep(0.05)
+            self.sent += 1
+            return RESTResponse.from_bytes(status, body, {'Content-Type': 'application/json'})
+        return send
+
+    def test_single_fetch_for_concurrent_callers(self) -> None:
+        bodies = []
+
+        def fetch():
+            response = self.cache.fetch(
+                'GET', 'https://hub/ide/policy', {'Authorization': 'Bearer a'}, self.send()
+            )
+            bodies.append(response.read())
+
+        threads = [threading.Thread(target=fetch) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.sent, 1)
+        self.assertEqual(bodies, [b'{"ok": true}'] * 6)
+        self.assertEqual((self.cache.hits, self.cache.misses), (5, 1))
+
+    def test_entries_vary_on_credentials(self) -> None:
+        url = 'https://hub/ide/policy'
+        self.cache.fetch('GET', url, {'Authorization': 'Bearer a'}, self.send())
+        other = self.cache.fetch('GET', url, {'Authorization': 'Bearer b'}, self.send(body=b'b'))
+        self.assertEqual(other.read(), b'b')
+        self.assertEqual(self.sent, 2)
+
+    def test_errors_and_stale_entries_are_refetched(self) -> None:
+        error = self.cache.fetch('GET', 'https://hub/x', None, self.send(status=500, body=b'boom'))
+        self.assertEqual(error.status, 500)
+        self.cache.fetch('GET', 'https://hub/x', None, self.send())
+        self.assertEqual(self.sent, 2)
+
+        self.cache.ttl = 0
+        self.cache.fetch('GET', 'https://hub/x', None, self.send())
+        self.assertEqual(self.sent, 3)
+
+    def test_prune_removes_entries_but_not_lock_files(self) -> None:
+        self.cache.fetch('GET', 'https://hub/x', None, self.send())
+        self.cache.fetch('GET', 'https://hub/y', None, self.send())
+        self.cache.fetch('GET', 'https://hub/z', None, self.send(status=500))
+        self.assertEqual(len(os.listdir(self.directory)), 5)
+        self.assertEqual(self.cache.prune(), 0)
+        self.assertEqual(self.cache.prune(max_age=0), 2)
+        names = os.listdir(self.directory)
+        self.assertEqual(len(names), 3)
+        self.assertTrue(all(name.endswith('.lock') for name in names))
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), "POSIX permissions")
+    def test_refuses_directories_other_users_can_access(self) -> None:
+        shared = os.path.join(self.directory, 'shared')
+        os.mkdir(shared)
+        os.chmod(shared, 0o755)
+        with self.assertRaises(PermissionError):
+            SharedResponseCache(shared)
+        link = os.path.join(self.directory, 'link')
+        os.symlink(tempfile.mkdtemp(dir=self.directory), link)
+        with self.assertRaises(PermissionError):
+            SharedResponseCache(link)
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), "POSIX permissions")
+    def test_default_directory_falls_back_to_user_cache(self) -> None:
+        temp = os.path.join(self.directory, 'tmp')
+        os.mkdir(temp)
+        taken = os.path.join(temp, 'openapi-client-cache-%d' % os.getuid())
+        os.mkdir(taken)
+        os.chmod(taken, 0o777)
+        previous, tempfile.tempdir = tempfile.tempdir, temp
+        environ = dict(os.environ, XDG_CACHE_HOME=os.path.join(self.directory, 'cache'))
+        try:
+            with unittest.mock.patch.dict(os.environ, environ), \
+                    self.assertLogs('openapi_client.shared_cache', 'WARNING'):
+                cache = SharedResponseCache()
+        finally:
+            tempfile.tempdir = previous
+        self.assertEqual(cache.directory, os.path.join(self.directory, 'cache', 'openapi-client'))
+        self.assertEqual(os.stat(cache.directory).st_mode & 0o777, 0o700)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import threading
+import time
+import unittest
+
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.token_manager import AccessToken, TokenManager
+
+
+class TestTokenManager(unittest.TestCase):
+    """TokenManager unit tests"""
+
+    def setUp(self) -> None:
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def tearDown(self) -> None:
+        pass
+
+    def fetch(self, lifetime=None, delay=0.0):
+        def fetch_token():
+            time.sleep(delay)
+            with self.lock:
+                self.calls += 1
+                calls = self.calls
+            expires_at = time.time() + lifetime if lifetime is not None else None
+            return AccessToken("token-%d" % calls, expires_at)
+        return fetch_token
+
+    def test_concurrent_callers_share_one_refresh(self) -> None:
+        with TokenManager(self.fetch(delay=0.05)) as manager:
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(manager.get_token()))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(results, ["token-1"] * 8)
+            self.assertEqual(self.calls, 1)
+            self.assertEqual(manager.authorization_header, "Bearer token-1")
+
+    def test_refreshes_in_background_before_expiry(self) -> None:
+        fetch = self.fetch(lifetime=0.4)
+        with TokenManager(fetch, refresh_margin=0.3, retry_interval=0.01) as manager:
+            self.assertEqual(manager.get_token(), "token-1")
+            deadline = time.time() + 2
+            while self.calls < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertGreaterEqual(self.calls, 2)
+            # the background refresh happened before the first token expired
+            self.assertNotEqual(manager.get_token(), "token-1")
+
+    def test_configuration_uses_token_manager(self) -> None:
+        configuration = Configuration(access_token="static")
+        with TokenManager(lambda: ("managed", None)) as manager:
+            configuration.token_manager = manager
+            client = ApiClient(configuration)
+            _, _, headers, _, _ = client.param_serialize(
+                'GET', '/ide/policy', query_params=[], auth_settings=['apiKeyAuth']
+            )
+            self.assertEqual(headers['Authorization'], 'Bearer managed')
+            manager.refresh()
+            self.assertEqual(manager.revision, 2)
+
+    def test_configuration_uses_manager_prefix(self) -> None:
+        configuration = Configuration()
+        with TokenManager(lambda: ("managed", None), prefix="Token") as manager:
+            configuration.token_manager = manager
+            client = ApiClient(configuration)
+            _, _, headers, _, _ = client.param_serialize(
+                'GET', '/ide/policy', query_params=[], auth_settings=['apiKeyAuth']
+            )
+            self.assertEqual(headers['Authorization'], 'Token managed')
+
+
+if __name__ == '__main__':
+    unittest.main()
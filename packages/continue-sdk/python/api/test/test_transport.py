@@ -0,0 +1,125 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import os
+import socketserver
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+from openapi_client.api.default_api import DefaultApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import NotFoundException
+from openapi_client.models.sync_secrets_request import SyncSecretsRequest
+from openapi_client.transport import ASGITransport, UnixSocketTransport, WSGITransport
+
+
+def handle(method, path, query, headers, body):
+    """A tiny Hub: returns (status, json body)."""
+    if path == '/ide/policy':
+        return 200, {"policy": {"auth": headers.get('authorization')}, "orgSlug": query}
+    if path == '/ide/sync-secrets' and method == 'POST':
+        return 200, [json.loads(body)]
+    return 404, {"message": "not found"}
+
+
+def wsgi_app(environ, start_response):
+    headers = {
+        key[5:].lower().replace('_', '-'): value
+        for key, value in environ.items() if key.startswith('HTTP_')
+    }
+    body = environ['wsgi.input'].read(int(environ.get('CONTENT_LENGTH') or 0))
+    status, payload = handle(
+        environ['REQUEST_METHOD'], environ['PATH_INFO'], environ['QUERY_STRING'], headers, body
+    )
+    start_response('%d X' % status, [('Content-Type', 'application/json')])
+    return [json.dumps(payload).encode()]
+
+
+async def asgi_app(scope, receive, send):
+    message = await receive()
+    headers = {k.decode(): v.decode() for k, v in scope['headers']}
+    status, payload = handle(
+        scope['method'], scope['path'], scope['query_string'].decode(), headers, message['body']
+    )
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(b'content-type', b'application/json')]})
+    data = json.dumps(payload).encode()
+    await send({'type': 'http.response.body', 'body': data[:5], 'more_body': True})
+    await send({'type': 'http.response.body', 'body': data[5:]})
+
+
+class UnixHandler(BaseHTTPRequestHandler):
+
+    def _respond(self):
+        path, _, query = self.path.partition('?')
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        headers = {k.lower(): v for k, v in self.headers.items()}
+        status, payload = handle(self.command, path, query, headers, body)
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = _respond
+
+    def address_string(self):
+        return 'unix'
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTransport(unittest.TestCase):
+    """Transport unit tests"""
+
+    def check(self, transport) -> None:
+        configuration = Configuration(host="http://hub.test", access_token="t0k")
+        api = DefaultApi(ApiClient(configuration, transport=transport))
+        policy = api.get_policy()
+        self.assertEqual(policy.policy, {"auth": "Bearer t0k"})
+        response = api.sync_secrets_without_preload_content(
+            SyncSecretsRequest(fqsns=[{"secretName": "s"}], orgScopeId="o")
+        )
+        self.assertEqual(
+            json.loads(response.read()), [{"fqsns": [{"secretName": "s"}], "orgScopeId": "o"}]
+        )
+        with self.assertRaises(NotFoundException):
+            api.get_free_trial_status()
+
+    def test_wsgi(self) -> None:
+        self.check(WSGITransport(wsgi_app))
+
+    def test_asgi(self) -> None:
+        transport = ASGITransport(asgi_app)
+        self.addCleanup(transport.close)
+        self.check(transport)
+
+    def test_unix_socket(self) -> None:
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'hub.sock')
+        server = socketserver.ThreadingUnixStreamServer(path, UnixHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(os.rmdir, directory)
+        self.addCleanup(os.unlink, path)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.check(UnixSocketTransport(path, Configuration()))
+
+
+if __name__ == '__main__':
+    unittest.main()
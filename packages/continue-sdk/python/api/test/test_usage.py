@@ -0,0 +1,139 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import threading
+import unittest
+from unittest import mock
+
+from openapi_client.usage import AUTOCOMPLETE, CHAT, UsageMeter
+from test.fakes import FakeHub, hub_api
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class TestUsageMeter(unittest.TestCase):
+    """UsageMeter unit tests"""
+
+    def setUp(self) -> None:
+        self.status = {
+            "optedInToFreeTrial": True,
+            "chatCount": 10,
+            "autocompleteCount": 100,
+            "chatLimit": 50,
+            "autocompleteLimit": 2000,
+        }
+        self.hub = FakeHub(free_trial_status=self.status)
+        self.api = hub_api(self.hub)
+        self.clock = FakeClock()
+        patcher = mock.patch('openapi_client.usage.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.api.api_client.close()
+
+    def test_quota_unknown_before_sync(self) -> None:
+        meter = UsageMeter(self.api)
+        meter.record(CHAT, 3)
+        self.assertTrue(meter.allows(CHAT))
+        self.assertIsNone(meter.remaining(CHAT))
+        self.assertEqual(meter.status(CHAT).used, 3)
+        with self.assertRaises(ValueError):
+            meter.record("edit")
+
+    def test_local_reads_between_syncs(self) -> None:
+        meter = UsageMeter(self.api)
+        meter.sync()
+        for _ in range(5):
+            meter.record(CHAT)
+        meter.record(AUTOCOMPLETE, 20)
+        self.assertEqual(meter.remaining(CHAT), 35)
+        self.assertEqual(meter.status(AUTOCOMPLETE).used, 120)
+        self.assertTrue(meter.allows(CHAT, 35))
+        self.assertFalse(meter.allows(CHAT, 36))
+        self.assertEqual(self.hub.calls, 1)
+        # the Hub counted the local usage: the sync replaces it
+        self.status["chatCount"] = 15
+        self.clock.now += 10
+        meter.sync()
+        self.assertEqual(meter.status(CHAT).used, 15)
+        self.assertTrue(meter.status(CHAT).opted_in)
+
+    def test_extrapolates_usage_of_other_devices(self) -> None:
+        meter = UsageMeter(self.api, smoothing=1.0)
+        meter.sync()
+        meter.record(CHAT, 2)
+        # 2 local and 8 from elsewhere in 100 seconds
+        self.status["chatCount"] = 20
+        self.clock.now += 100
+        meter.sync()
+        self.assertEqual(meter.status(CHAT).used, 20)
+        self.clock.now += 50
+        self.assertAlmostEqual(meter.status(CHAT).used, 24)
+        self.assertFalse(meter.status(CHAT).exhausted)
+
+    def test_polls_faster_near_limit(self) -> None:
+        meter = UsageMeter(self.api, min_interval=5, max_interval=600, smoothing=1.0)
+        self.assertEqual(meter.next_interval(), 5)
+        meter.sync()
+        self.assertEqual(meter.next_interval(), 600)
+        # 10 chats in 100 s leaves 30 for 300 s; poll twice before that
+        self.status["chatCount"] = 20
+        self.clock.now += 100
+        meter.sync()
+        self.assertAlmostEqual(meter.next_interval(), 150)
+        meter.record(CHAT, 26)
+        self.assertEqual(meter.next_interval(), 5)
+
+    def test_background_sync(self) -> None:
+        meter = UsageMeter(self.api)
+        synced = threading.Event()
+        sync = meter.sync
+
+        def sync_and_signal(**kwargs):
+            try:
+                return sync(**kwargs)
+            finally:
+                synced.set()
+
+        meter.sync = sync_and_signal  # type: ignore[method-assign]
+        with meter:
+            self.assertTrue(synced.wait(5))
+        self.assertEqual(meter.remaining(CHAT), 40)
+
+    def test_stop_before_clear_is_not_lost(self) -> None:
+        meter = UsageMeter(self.api, min_interval=600)
+        meter.sync()
+
+        class StopThenClear(threading.Event):
+            """Lets `stop` run right before the wake-up is cleared."""
+
+            def clear(self) -> None:
+                meter._stop.set()
+                self.set()
+                super().clear()
+
+        meter._wake = StopThenClear()
+        thread = threading.Thread(target=meter._run, daemon=True)
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
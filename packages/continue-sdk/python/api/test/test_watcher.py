@@ -0,0 +1,127 @@
+# coding: utf-8
+
+"""
+    Continue Hub IDE API
+
+    API for Continue IDE to fetch assistants and other related information. These endpoints are primarily used by the Continue IDE extensions for VS Code and JetBrains.
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import threading
+import time
+import unittest
+
+from openapi_client.api_response import ApiResponse
+from openapi_client.exceptions import ApiException
+from openapi_client.models.get_policy200_response import GetPolicy200Response
+from openapi_client.models.list_assistants200_response_inner import ListAssistants200ResponseInner
+from openapi_client.watcher import ASSISTANTS, POLICY, AssistantsDiff, HubWatcher, PolicyDiff
+
+
+def assistant(package_slug, name="assistant"):
+    return {
+        "configResult": {"config": {"name": name}, "configLoadInterrupted": False},
+        "ownerSlug": "acme",
+        "packageSlug": package_slug,
+    }
+
+
+class FakeApi:
+    """Serves canned bodies and answers 304 to a matching If-None-Match."""
+
+    def __init__(self) -> None:
+        self.assistants = [assistant("a"), assistant("b")]
+        self.policy = {"policy": {"allowMcpServers": True}, "orgSlug": "acme"}
+        self.requests = []
+
+    def _respond(self, body, data, headers):
+        raw = json.dumps(body).encode()
+        etag = '"%d"' % hash(raw)
+        self.requests.append(headers.get('If-None-Match'))
+        if headers.get('If-None-Match') == etag:
+            raise ApiException(status=304, reason="Not Modified")
+        return ApiResponse(status_code=200, data=data, headers={'ETag': etag}, raw_data=raw)
+
+    def list_assistants_with_http_info(self, always_use_proxy=None, organization_id=None,
+                                       _headers=None):
+        data = [ListAssistants200ResponseInner.from_dict(a) for a in self.assistants]
+        return self._respond(self.assistants, data, _headers)
+
+    def get_policy_with_http_info(self, _headers=None):
+        return self._respond(self.policy, GetPolicy200Response.from_dict(self.policy), _headers)
+
+
+class TestHubWatcher(unittest.TestCase):
+    """HubWatcher unit tests"""
+
+    def setUp(self) -> None:
+        self.api = FakeApi()
+        self.watcher = HubWatcher(
+            self.api, resources=(ASSISTANTS, POLICY), min_interval=1, max_interval=8
+        )
+
+    def tearDown(self) -> None:
+        self.watcher.stop()
+
+    def test_assistant_diffs(self) -> None:
+        diffs = []
+        self.watcher.subscribe(ASSISTANTS, diffs.append)
+        self.assertTrue(self.watcher.poll(ASSISTANTS))
+        self.assertEqual(len(diffs[0].added), 2)
+        self.assertEqual(set(self.watcher.snapshot.assistants), {("acme", "a"), ("acme", "b")})
+
+        self.api.assistants = [assistant("a", name="renamed"), assistant("c")]
+        self.assertTrue(self.watcher.poll(ASSISTANTS))
+        diff = diffs[1]
+        self.assertIsInstance(diff, AssistantsDiff)
+        self.assertEqual([a.package_slug for a in diff.added], ["c"])
+        self.assertEqual([a.package_slug for a in diff.removed], ["b"])
+        self.assertEqual(diff.changed[0][1].config_result.config, {"name": "renamed"})
+
+    def test_unchanged_polls_use_etag_and_back_off(self) -> None:
+        diffs = []
+        self.watcher.subscribe(POLICY, diffs.append)
+        self.watcher.poll(POLICY)
+        self.assertIsInstance(diffs[0], PolicyDiff)
+        for _ in range(5):
+            self.assertFalse(self.watcher.poll(POLICY))
+        self.assertEqual(len(diffs), 1)
+        self.assertIsNotNone(self.api.requests[-1])
+        self.assertEqual(self.watcher._resources[POLICY].interval, 8)
+
+        self.api.policy = {"policy": {"allowMcpServers": False}, "orgSlug": "acme"}
+        self.assertTrue(self.watcher.poll(POLICY))
+        self.assertEqual(diffs[1].current.policy, {"allowMcpServers": False})
+        self.assertEqual(self.watcher._resources[POLICY].interval, 1)
+
+    def test_concurrent_polls_are_serialized(self) -> None:
+        fetch = self.api.list_assistants_with_http_info
+        in_flight = []
+        peak = []
+
+        def slow_fetch(**kwargs):
+            in_flight.append(None)
+            peak.append(len(in_flight))
+            time.sleep(0.02)
+            in_flight.pop()
+            return fetch(**kwargs)
+
+        self.api.list_assistants_with_http_info = slow_fetch
+        diffs = []
+        self.watcher.subscribe(ASSISTANTS, diffs.append)
+        threads = [
+            threading.Thread(target=self.watcher.poll, args=(ASSISTANTS,)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(max(peak), 1)
+        self.assertEqual(len(diffs), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()